@@ -2,6 +2,11 @@ from typing import Iterable, Callable, TypeVar, Any, MutableSequence, Union, Opt
 import random
 from typing import Iterable, Callable, TypeVar, Any, MutableSequence, Union, Optional
 
+try: # Optional: Span bulk operations (memoryview / slice copies)
+    from cppspan import Span as _Span
+except ImportError: # pragma: no cover
+    _Span = None
+
 T = TypeVar('T')
 U = TypeVar('U')
 
@@ -23,7 +28,15 @@ def copy(source: Iterable[T], result: Destination) -> None:
     Copies elements from source to result.
     If result is a Sequence, it MUST have enough space (like std::copy).
     If result is a Callable (e.g. list.append), it appends (like std::back_inserter).
+    A Span on either side is copied in bulk.
     """
+    if _Span is not None and not callable(result):
+        if isinstance(result, _Span):
+            result.copy_from(source)
+            return
+        if isinstance(source, _Span):
+            source.copy_to(result)
+            return
     idx = 0
     for item in source:
         idx = _write(result, idx, item)
@@ -37,6 +50,9 @@ def copy_if(source: Iterable[T], result: Destination, predicate: Callable[[T], b
 
 def copy_n(source: Iterable[T], n: int, result: Destination) -> None:
     """Copies first n elements."""
+    if _Span is not None and isinstance(source, _Span):
+        copy(source.first(min(n, len(source))), result)
+        return
     idx = 0
     count = 0
     for item in source:
@@ -47,11 +63,17 @@ def copy_n(source: Iterable[T], n: int, result: Destination) -> None:
 
 def fill(sequence: MutableSequence[T], value: T) -> None:
     """Assigns value to every element in the sequence."""
+    if _Span is not None and isinstance(sequence, _Span):
+        sequence.fill(value)
+        return
     for i in range(len(sequence)):
         sequence[i] = value
 
 def fill_n(sequence: MutableSequence[T], n: int, value: T) -> None:
     """Assigns value to first n elements."""
+    if _Span is not None and isinstance(sequence, _Span):
+        sequence.first(n).fill(value)
+        return
     for i in range(n):
         sequence[i] = value
 
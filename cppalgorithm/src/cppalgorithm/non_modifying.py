@@ -1,6 +1,11 @@
 from typing import Iterable, Callable, TypeVar, Any, Optional, Tuple, Sequence
 import collections
 
+try: # Optional: Span bulk operations (memoryview / slice scans)
+    from cppspan import Span as _Span
+except ImportError: # pragma: no cover
+    _Span = None
+
 T = TypeVar('T')
 
 def for_each(iterable: Iterable[T], func: Callable[[T], Any]) -> None:
@@ -17,6 +22,8 @@ def find(iterable: Iterable[T], value: T) -> int:
     Returns -1 if not found.
     Equivalent to: std::find (returning index instead of iterator)
     """
+    if _Span is not None and isinstance(iterable, _Span):
+        return iterable.find(value)
     for i, item in enumerate(iterable):
         if item == value:
             return i
@@ -49,6 +56,8 @@ def count(iterable: Iterable[T], value: T) -> int:
     Returns the number of elements equal to value.
     Equivalent to: std::count
     """
+    if _Span is not None and isinstance(iterable, _Span):
+        return iterable.count(value)
     c = 0
     for item in iterable:
         if item == value:
@@ -139,6 +148,12 @@ def equal(iterable1: Iterable[T], iterable2: Iterable[T],
     Returns True if ranges are equal.
     Considers lengths.
     """
+    if predicate is None and _Span is not None:
+        for a, b in ((iterable1, iterable2), (iterable2, iterable1)):
+            if isinstance(a, _Span):
+                result = a.__eq__(b)
+                if result is not NotImplemented:
+                    return result
     iter1 = iter(iterable1)
     iter2 = iter(iterable2)
     
@@ -155,5 +155,31 @@ class TestModifying(unittest.TestCase):
         self.assertTrue(prev_permutation(data))
         self.assertEqual(data, [3, 1, 2])
 
+    def test_span_dispatch(self):
+        try:
+            from cppspan import Span
+        except ImportError:
+            return
+        from array import array
+        from cppalgorithm import find, count, equal
+        buf = array('i', range(8))
+        fill(Span(buf)[::2], -1)
+        self.assertEqual(buf.tolist(), [-1, 1, -1, 3, -1, 5, -1, 7])
+        fill_n(Span(buf), 2, 0)
+        self.assertEqual(buf[:3].tolist(), [0, 0, -1])
+        dest = array('i', bytes(4 * 8))
+        copy(Span(buf), Span(dest))
+        self.assertEqual(dest, buf)
+        out = [None] * 3
+        copy_n(Span(buf), 3, out)
+        self.assertEqual(out, [0, 0, -1])
+        copy([9, 9], Span(buf)[6:])
+        self.assertEqual(buf[6:].tolist(), [9, 9])
+        self.assertEqual(find(Span(buf), 9), 6)
+        self.assertEqual(count(Span(buf), -1), 2)
+        self.assertTrue(equal(Span(buf), Span(array('i', buf))))
+        self.assertTrue(equal(buf.tolist(), Span(buf)))
+        self.assertFalse(equal(Span(buf), Span(buf)[1:]))
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,15 +1,19 @@
 from __future__ import annotations
 from typing import TypeVar, Generic, Iterable, Iterator, Any, Sequence, overload
+from array import array
+from itertools import islice
 import ctypes
 
 T = TypeVar('T')
 
 from cppbase import Sequence
+from cppbase.buffer import check_dtype, typed_fill
 
 class Array(Sequence, Generic[T]):
-    __slots__ = ('_data', '_size')
+    __slots__ = ('_data', '_size', '_dtype')
 
-    def __init__(self, size: int, init_value: T | None = None, source: Iterable[T] | None = None):
+    def __init__(self, size: int, init_value: T | None = None, source: Iterable[T] | None = None,
+                 dtype: str | None = None):
         """
         Fixed-size array implementation similar to std::array<T, N>.
         
@@ -17,31 +21,32 @@ class Array(Sequence, Generic[T]):
             size: The fixed size N of the array.
             init_value: Value to fill the array with if source is insufficient.
             source: Iterable to initialize the array.
+            dtype: Optional array typecode (e.g. 'd', 'q'). Elements are then
+                   stored as machine values in an `array.array`, which
+                   exposes the buffer protocol (NumPy, struct, memoryview)
+                   and makes fill/compare/slice copies run in C.
         """
         if size < 0:
             raise ValueError("Array size cannot be negative")
             
         self._size = size
-        # Create a fixed-size array of python objects
-        self._data = (ctypes.py_object * size)()
-        
-        # Initialize
-        if source is not None:
-            # Fill from source
-            i = 0
-            for x in source:
-                if i >= size:
-                    raise IndexError("Initializer list too long for Array size")
-                self._data[i] = x
-                i += 1
-            # Fill remainder with init_value
-            while i < size:
-                self._data[i] = init_value
-                i += 1
+        self._dtype = check_dtype(dtype)
+        values = [] if source is None else list(islice(source, size + 1))
+        if len(values) > size:
+            raise IndexError("Initializer list too long for Array size")
+        n = len(values)
+
+        if dtype:
+            # Zero-initialised typed buffer, like value-initialised std::array<double, N>
+            self._data = array(dtype, bytes(size * array(dtype).itemsize))
+            self._data[:n] = array(dtype, values)
+            if init_value is not None:
+                typed_fill(self._data, init_value, n, size)
         else:
-            # Fill all with init_value
-            for i in range(size):
-                self._data[i] = init_value
+            # Create a fixed-size array of python objects
+            self._data = (ctypes.py_object * size)()
+            self._data[:n] = values
+            self._data[n:size] = [init_value] * (size - n)
 
     # --------------------- Element Access ---------------------
     def at(self, pos: int) -> T:
@@ -51,12 +56,26 @@ class Array(Sequence, Generic[T]):
         return self._data[pos]
 
     def __getitem__(self, pos: int) -> T:
+        if isinstance(pos, slice):
+            return self._data[pos] # list, or array.array for typed storage
         if pos < 0: pos += self._size
         if not (0 <= pos < self._size):
             raise IndexError("Array index out of range")
         return self._data[pos]
 
     def __setitem__(self, pos: int, value: T):
+        if isinstance(pos, slice):
+            # Slice writes copy in C but can never change the size
+            count = len(range(*pos.indices(self._size)))
+            if self._dtype:
+                if not (isinstance(value, array) and value.typecode == self._dtype):
+                    value = array(self._dtype, value)
+            else:
+                value = list(value)
+            if len(value) != count:
+                raise ValueError("Array slice assignment cannot change the Array size")
+            self._data[pos] = value
+            return
         if pos < 0: pos += self._size
         if not (0 <= pos < self._size):
             raise IndexError("Array index out of range")
@@ -70,10 +89,22 @@ class Array(Sequence, Generic[T]):
         if self._size == 0: raise IndexError("back() called on empty Array")
         return self._data[self._size - 1]
 
-    def data(self) -> ctypes.Array:
-        """Returns the underlying ctypes (raw) array."""
+    def data(self) -> ctypes.Array | array:
+        """Returns the underlying ctypes (raw) array, or the array.array for typed storage."""
         return self._data
 
+    def dtype(self) -> str | None:
+        return self._dtype
+
+    def memoryview(self) -> memoryview:
+        """Zero-copy buffer over typed storage (shareable with NumPy / struct)."""
+        if not self._dtype:
+            raise TypeError("memoryview requires typed storage (dtype=...)")
+        return memoryview(self._data)
+
+    def __buffer__(self, flags: int) -> memoryview: # Buffer protocol (Python 3.12+)
+        return self.memoryview()
+
     # --------------------- Capacity ---------------------
     def empty(self) -> bool:
         return self._size == 0
@@ -90,8 +121,10 @@ class Array(Sequence, Generic[T]):
     # --------------------- Operations ---------------------
     def fill(self, value: T):
         """Assigns the given value to every element in the array."""
-        for i in range(self._size):
-            self._data[i] = value
+        if self._dtype:
+            typed_fill(self._data, value) # memset / memmove
+        else:
+            self._data[:] = [value] * self._size
 
     def swap(self, other: 'Array[T]'):
         """Exchanges the contents of the container with those of other."""
@@ -104,11 +137,11 @@ class Array(Sequence, Generic[T]):
         # Note: In C++ strict terms, std::array swap is linear. 
         # But in Python, swapping the backing storage object is safe and O(1).
         self._data, other._data = other._data, self._data
+        self._dtype, other._dtype = other._dtype, self._dtype
 
     # --------------------- Iterators ---------------------
     def __iter__(self) -> Iterator[T]:
-        for i in range(self._size):
-            yield self._data[i]
+        return iter(self._data if self._dtype else self._data[:])
 
     def __repr__(self):
         # Prevent huge output for large arrays
@@ -118,11 +151,42 @@ class Array(Sequence, Generic[T]):
         return f"Array[{self._size}]({list(self)})"
 
     # --------------------- Comparisons ---------------------
+    # Lexicographic, like std::array. Typed arrays of the same dtype compare
+    # their buffers in C; anything else compares as lists (still no Python loop).
+    def _operands(self, other: 'Array') -> tuple:
+        if self._dtype and self._dtype == other._dtype:
+            return self._data, other._data
+        return list(self._data[:]), list(other._data[:])
+
     def __eq__(self, other): 
         if not isinstance(other, Array) or self._size != other._size:
             return False
-        # Element-wise comparison
-        for i in range(self._size):
-            if self._data[i] != other._data[i]:
-                return False
-        return True
+        a, b = self._operands(other)
+        return a == b
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __lt__(self, other):
+        if not isinstance(other, Array):
+            return NotImplemented
+        a, b = self._operands(other)
+        return a < b
+
+    def __le__(self, other):
+        if not isinstance(other, Array):
+            return NotImplemented
+        a, b = self._operands(other)
+        return a <= b
+
+    def __gt__(self, other):
+        if not isinstance(other, Array):
+            return NotImplemented
+        a, b = self._operands(other)
+        return a > b
+
+    def __ge__(self, other):
+        if not isinstance(other, Array):
+            return NotImplemented
+        a, b = self._operands(other)
+        return a >= b
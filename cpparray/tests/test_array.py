@@ -67,5 +67,57 @@ class TestArray(unittest.TestCase):
         with self.assertRaises(ValueError):
             a.swap(c)
 
+    def test_slices(self):
+        a = Array(5, source=[0, 1, 2, 3, 4])
+        self.assertEqual(a[1:3], [1, 2])
+        self.assertEqual(a[::-2], [4, 2, 0])
+        a[1:3] = [7, 8]
+        self.assertEqual(list(a), [0, 7, 8, 3, 4])
+        with self.assertRaises(ValueError):
+            a[1:3] = [1]
+
+    def test_comparisons(self):
+        self.assertTrue(Array(2, source=[1, 2]) < Array(2, source=[1, 3]))
+        self.assertTrue(Array(2, source=[1, 2]) != Array(2, source=[2, 2]))
+        self.assertFalse(Array(2, source=[1, 2]) == Array(3, source=[1, 2]))
+
+    def test_typed_storage(self):
+        from array import array
+        a = Array(6, init_value=1.5, source=[0.5], dtype='d')
+        self.assertEqual(list(a), [0.5, 1.5, 1.5, 1.5, 1.5, 1.5])
+        self.assertEqual(list(Array(3, dtype='q')), [0, 0, 0])
+        a.fill(2.25)
+        self.assertEqual(list(a), [2.25] * 6)
+        a.fill(0)
+        self.assertEqual(list(a), [0.0] * 6)
+
+        a[2:4] = [3.0, 4.0]
+        self.assertIsInstance(a[1:5], array)
+        self.assertEqual(list(a[1:5]), [0.0, 3.0, 4.0, 0.0])
+        with self.assertRaises(ValueError):
+            a[0:2] = [1.0, 2.0, 3.0]
+        with self.assertRaises(TypeError):
+            a[0] = 'x'
+
+        # Zero-copy buffer shared with struct
+        import struct
+        view = a.memoryview()
+        self.assertEqual(view.format, 'd')
+        struct.pack_into('d', view, 0, 9.5)
+        self.assertEqual(a[0], 9.5)
+        view.release()
+        with self.assertRaises(TypeError):
+            Array(2).memoryview()
+        with self.assertRaises(ValueError):
+            Array(2, dtype='x')
+
+        b = Array(6, source=[9.5, 0, 3, 4, 0, 0], dtype='d')
+        self.assertEqual(a, b)
+        self.assertEqual(a, Array(6, source=[9.5, 0.0, 3.0, 4.0, 0.0, 0.0]))
+        b[5] = 1.0
+        self.assertTrue(a < b)
+        a.swap(b)
+        self.assertEqual(a[5], 1.0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,5 @@
 from .interfaces import Container, Sequence, Associative, Unordered, Adapter
+from .pool import NodePool
+from .views import EqualRange
 
-__all__ = ['Container', 'Sequence', 'Associative', 'Unordered', 'Adapter']
+__all__ = ['Container', 'Sequence', 'Associative', 'Unordered', 'Adapter', 'NodePool', 'EqualRange']
@@ -0,0 +1,52 @@
+from __future__ import annotations
+from typing import Any, Optional
+from array import array
+import ctypes
+
+# array.array typecodes accepted for typed storage (also valid NumPy dtype codes)
+TYPECODES = 'bBhHiIlLqQfd'
+
+
+def check_dtype(dtype: Optional[str]) -> Optional[str]:
+    """Validates a container's `dtype` argument (None or an array typecode)."""
+    if dtype is not None and (not isinstance(dtype, str) or len(dtype) != 1
+                              or dtype not in TYPECODES):
+        raise ValueError(f"unsupported dtype {dtype!r}, expected one of {TYPECODES!r}")
+    return dtype
+
+
+# Byte with its bit order reversed, for bytes.translate
+REVERSED_BITS = bytes(int(f'{b:08b}'[::-1], 2) for b in range(256))
+
+
+def check_bitorder(bitorder: str) -> str:
+    """Validates a `bitorder` argument ('little' or 'big') for bit packing."""
+    if bitorder not in ('little', 'big'):
+        raise ValueError(f"bitorder must be 'little' or 'big', got {bitorder!r}")
+    return bitorder
+
+
+def typed_fill(buf: array, value: Any, start: int = 0, stop: Optional[int] = None):
+    """
+    Sets buf[start:stop] to `value` without a Python-level loop.
+
+    The value is stored (and type-checked) once; zero bytes are then
+    written with one memset, anything else by doubling the filled prefix
+    with memmove, so a fill costs O(log n) calls.
+    """
+    if stop is None:
+        stop = len(buf)
+    n = stop - start
+    if n <= 0:
+        return
+    buf[start] = value
+    size = buf.itemsize
+    addr = buf.buffer_info()[0] + start * size
+    if buf[start:start + 1].tobytes() == bytes(size):
+        ctypes.memset(addr, 0, n * size)
+        return
+    filled = 1
+    while filled < n:
+        chunk = min(filled, n - filled)
+        ctypes.memmove(addr + filled * size, addr, chunk * size)
+        filled += chunk
@@ -0,0 +1,101 @@
+from __future__ import annotations
+from typing import Any, Dict, List
+
+
+class NodePool:
+    """
+    Free-list allocator for the `__slots__` nodes of linked containers.
+
+    Erased nodes are parked on a stack instead of being dropped, and the next
+    insert re-initialises one of them in place of allocating a new object.
+    A pool can be private to one container or shared by several containers
+    that use the same node type.
+
+    Like a C++ allocator, recycling a node invalidates any iterator still
+    pointing at it.
+    """
+    __slots__ = ('node_type', 'max_free', '_free', '_fields', '_hits', '_misses', '_released', '_discarded')
+
+    def __init__(self, node_type: type, max_free: int | None = 4096):
+        self.node_type = node_type
+        self.max_free = max_free
+        self._free: List[Any] = []
+        # Fields to clear on release so parked nodes don't keep values alive.
+        self._fields = tuple(getattr(node_type, '__slots__', ()))
+        self._hits = 0
+        self._misses = 0
+        self._released = 0
+        self._discarded = 0
+
+    # --------------------- Allocation ---------------------
+    def acquire(self, *args) -> Any:
+        """Returns a node initialised with `args`, recycled when possible."""
+        if self._free:
+            node = self._free.pop()
+            node.__init__(*args)
+            self._hits += 1
+            return node
+        self._misses += 1
+        return self.node_type(*args)
+
+    def release(self, node: Any):
+        """Returns a node that is no longer linked into any container."""
+        self._released += 1
+        if self.max_free is not None and len(self._free) >= self.max_free:
+            self._discarded += 1
+            return
+        for name in self._fields:
+            setattr(node, name, None)
+        self._free.append(node)
+
+    def reserve(self, n: int):
+        """Pre-allocates nodes until at least `n` are free."""
+        if self.max_free is not None:
+            n = min(n, self.max_free)
+        node_type = self.node_type
+        while len(self._free) < n:
+            self._free.append(node_type.__new__(node_type))
+
+    def clear(self):
+        """Drops every parked node (statistics are kept)."""
+        self._free = []
+
+    # --------------------- Instrumentation ---------------------
+    def free_count(self) -> int:
+        return len(self._free)
+
+    def hit_rate(self) -> float:
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'released': self._released,
+            'discarded': self._discarded,
+            'free': len(self._free),
+            'hit_rate': self.hit_rate(),
+        }
+
+    def reset_stats(self):
+        self._hits = self._misses = self._released = self._discarded = 0
+
+    def __repr__(self):
+        return (f"NodePool({self.node_type.__name__}, free={len(self._free)}, "
+                f"hit_rate={self.hit_rate():.2f})")
+
+
+def make_pool(pool: NodePool | bool | None, node_type: type) -> NodePool | None:
+    """Normalises a container's `pool` argument (None/False, True or a NodePool)."""
+    if pool is None or pool is False:
+        return None
+    if pool is True:
+        return NodePool(node_type)
+    if not isinstance(pool, NodePool):
+        raise TypeError("pool must be a NodePool, True or None")
+    if pool.node_type is not node_type:
+        raise TypeError(
+            f"pool allocates {pool.node_type.__name__}, expected {node_type.__name__}"
+        )
+    return pool
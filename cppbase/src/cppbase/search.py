@@ -0,0 +1,228 @@
+from __future__ import annotations
+from typing import Any, List, Sequence
+import bisect
+
+
+def is_sorted(keys: Sequence[Any]) -> bool:
+    """True if keys is in non-descending order."""
+    it = iter(keys)
+    try:
+        prev = next(it)
+    except StopIteration:
+        return True
+    for k in it:
+        if k < prev:
+            return False
+        prev = k
+    return True
+
+
+def gallop_lower_bound(column: Sequence[Any], key: Any, lo: int = 0, hi: int | None = None) -> int:
+    """
+    bisect_left(column, key, lo, hi), found by probing lo, lo+1, lo+3, lo+7...
+    first. Costs O(log d) where d is the distance from lo to the answer,
+    which is what makes walking a sorted batch cheap.
+    """
+    if hi is None:
+        hi = len(column)
+    bound = lo
+    step = 1
+    while bound < hi and column[bound] < key:
+        lo = bound + 1
+        bound = lo + step
+        step <<= 1
+    return bisect.bisect_left(column, key, lo, min(bound, hi))
+
+
+def _prefer_gallop(n: int, m: int) -> bool:
+    """True if galloping m keys through n beats a linear merge walk."""
+    # Merge walk ~ n + m steps; galloping ~ 2 * m * log2(n / m) steps.
+    return m > 0 and n > 2 * m * max(1, (n // m).bit_length())
+
+
+def lower_bound_many(column: Sequence[Any], keys: Sequence[Any]) -> List[int]:
+    """
+    bisect_left position in the sorted `column` for every key of `keys`.
+
+    For a sorted batch the search resumes from the previous answer: either a
+    linear merge walk (batch comparable in size to the column) or a galloping
+    search (small batch, large column), whichever costs fewer comparisons.
+    Unsorted batches fall back to one full bisect per key.
+    """
+    n = len(column)
+    m = len(keys)
+    if not m:
+        return []
+    if not is_sorted(keys):
+        return [bisect.bisect_left(column, k) for k in keys]
+
+    out: List[int] = []
+    append = out.append
+    if not _prefer_gallop(n, m):
+        i = 0
+        for k in keys:
+            while i < n and column[i] < k:
+                i += 1
+            append(i)
+    else:
+        lo = 0
+        for k in keys:
+            lo = gallop_lower_bound(column, k, lo, n)
+            append(lo)
+    return out
+
+
+# --------------------- Sorted set operations ---------------------
+# Inputs are sorted sequences without duplicates (list or array); results
+# are new sorted lists. When one side is much smaller, its elements gallop
+# through the larger side and untouched stretches of the larger side are
+# copied as slices; otherwise both sides are walked in one merge pass.
+
+def sorted_union(a: Sequence[Any], b: Sequence[Any]) -> List[Any]:
+    if len(a) < len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    out: List[Any] = []
+    if _prefer_gallop(n, m):
+        lo = 0
+        for x in b:
+            i = gallop_lower_bound(a, x, lo, n)
+            out += a[lo:i]
+            if i == n or a[i] != x:
+                out.append(x)
+            lo = i
+        out += a[lo:]
+        return out
+    append = out.append
+    i = j = 0
+    while i < n and j < m:
+        x, y = a[i], b[j]
+        if x < y:
+            append(x)
+            i += 1
+        elif y < x:
+            append(y)
+            j += 1
+        else:
+            append(x)
+            i += 1
+            j += 1
+    out += a[i:]
+    out += b[j:]
+    return out
+
+
+def sorted_intersection(a: Sequence[Any], b: Sequence[Any]) -> List[Any]:
+    if len(a) < len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    out: List[Any] = []
+    append = out.append
+    if _prefer_gallop(n, m):
+        lo = 0
+        for x in b:
+            lo = gallop_lower_bound(a, x, lo, n)
+            if lo == n:
+                break
+            if a[lo] == x:
+                append(x)
+        return out
+    i = j = 0
+    while i < n and j < m:
+        x, y = a[i], b[j]
+        if x < y:
+            i += 1
+        elif y < x:
+            j += 1
+        else:
+            append(x)
+            i += 1
+            j += 1
+    return out
+
+
+def sorted_difference(a: Sequence[Any], b: Sequence[Any]) -> List[Any]:
+    """Elements of a that are not in b."""
+    n, m = len(a), len(b)
+    out: List[Any] = []
+    if _prefer_gallop(n, m):
+        # Few removals: copy the stretches of a between them
+        lo = 0
+        for y in b:
+            i = gallop_lower_bound(a, y, lo, n)
+            out += a[lo:i]
+            lo = i + 1 if i < n and a[i] == y else i
+            if lo >= n:
+                break
+        out += a[lo:]
+        return out
+    append = out.append
+    if _prefer_gallop(m, n):
+        lo = 0
+        for x in a:
+            lo = gallop_lower_bound(b, x, lo, m)
+            if lo == m or b[lo] != x:
+                append(x)
+        return out
+    i = j = 0
+    while i < n and j < m:
+        x, y = a[i], b[j]
+        if x < y:
+            append(x)
+            i += 1
+        elif y < x:
+            j += 1
+        else:
+            i += 1
+            j += 1
+    out += a[i:]
+    return out
+
+
+def sorted_symmetric_difference(a: Sequence[Any], b: Sequence[Any]) -> List[Any]:
+    if len(a) < len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    out: List[Any] = []
+    if _prefer_gallop(n, m):
+        lo = 0
+        for x in b:
+            i = gallop_lower_bound(a, x, lo, n)
+            out += a[lo:i]
+            if i < n and a[i] == x:
+                lo = i + 1
+            else:
+                out.append(x)
+                lo = i
+        out += a[lo:]
+        return out
+    append = out.append
+    i = j = 0
+    while i < n and j < m:
+        x, y = a[i], b[j]
+        if x < y:
+            append(x)
+            i += 1
+        elif y < x:
+            append(y)
+            j += 1
+        else:
+            i += 1
+            j += 1
+    out += a[i:]
+    out += b[j:]
+    return out
+
+
+def sorted_includes(a: Sequence[Any], b: Sequence[Any]) -> bool:
+    """True if every element of b is in a (std::includes)."""
+    n, m = len(a), len(b)
+    if m > n:
+        return False
+    lo = 0
+    for y in b:
+        lo = gallop_lower_bound(a, y, lo, n)
+        if lo == n or a[lo] != y:
+            return False
+        lo += 1
+    return True
@@ -0,0 +1,54 @@
+from __future__ import annotations
+from collections.abc import Sequence as _SequenceABC
+from itertools import repeat
+from typing import Any, Iterator
+
+
+class EqualRange(_SequenceABC):
+    """
+    Lazy view of all elements equal to one key in a compact multi-container.
+
+    Compact multisets keep one node per distinct key with a `count`;
+    compact multimaps keep one node per key whose `value` is a list of the
+    mapped values. The view reads the node directly, so `len()` is O(1) and
+    nothing is copied until iterated. Like an iterator range, it is
+    invalidated when its key is erased.
+    """
+    __slots__ = ('_node', '_mapped')
+
+    def __init__(self, node: Any, mapped: bool = False):
+        self._node = node
+        self._mapped = mapped
+
+    @property
+    def key(self) -> Any:
+        return self._node.key if self._node is not None else None
+
+    def __len__(self) -> int:
+        node = self._node
+        if node is None:
+            return 0
+        return len(node.value) if self._mapped else node.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not (0 <= index < n):
+            raise IndexError("equal_range index out of range")
+        node = self._node
+        return (node.key, node.value[index]) if self._mapped else node.key
+
+    def __iter__(self) -> Iterator[Any]:
+        node = self._node
+        if node is None:
+            return iter(())
+        if self._mapped:
+            key = node.key
+            return ((key, v) for v in node.value)
+        return repeat(node.key, node.count)
+
+    def __repr__(self):
+        return f"EqualRange({self.key!r}, size={len(self)})"
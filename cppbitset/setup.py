@@ -20,4 +20,6 @@ setup(
         "Programming Language :: Python :: 3",
     ],
     python_requires=">=3.7",
+    install_requires=["cppbase"],
+    extras_require={"numpy": ["numpy"]},
 )
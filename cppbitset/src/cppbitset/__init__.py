@@ -1,3 +1,6 @@
 from .bitset import Bitset
+from .bloom import BloomFilter, CountingBloomFilter
+from .mapped import MappedBitset
+from .roaring import RoaringBitmap
 
-__all__ = ['Bitset']
+__all__ = ['Bitset', 'BloomFilter', 'CountingBloomFilter', 'MappedBitset', 'RoaringBitmap']
@@ -1,16 +1,54 @@
 from __future__ import annotations
-from typing import Union, Iterable
+from typing import Union, Iterable, Iterator, Any, Callable
+from array import array
+import operator
+import re
+import sys
 
-from typing import Union, Iterable
 from cppbase import Container
+from cppbase.buffer import REVERSED_BITS, check_bitorder
+
+try: # Optional: in-place word-wise &, |, ^ and ~ without big-int round trips
+    import numpy as _np
+except ImportError: # pragma: no cover
+    _np = None
+
+_FULL = (1 << 64) - 1
+_LITTLE = sys.byteorder == 'little'
+_NONZERO = re.compile(b'[^\x00]')       # First non-empty word, found in C
+_NONZERO_RUN = re.compile(b'[^\x00]+')
+_bit_count = getattr(int, 'bit_count', None) # Python 3.10+
+
+
+def _popcount(v: int) -> int:
+    return _bit_count(v) if _bit_count is not None else bin(v).count('1')
+
+
+def _lowbit(w: int) -> int:
+    return (w & -w).bit_length() - 1
+
+
+def _nwords(nbits: int) -> int:
+    return (nbits + 63) >> 6
+
 
 class Bitset(Container):
-    __slots__ = ('_val', '_nbits')
+    """
+    Fixed-size sequence of N bits (std::bitset<N>).
+
+    Bits live in an array of 64-bit words (`array('Q')`), bit i in word
+    i // 64 (bit 0 is the LSB). Reading or writing one bit touches one word.
+    Whole-set operations (count, &, |, ^, ~, shifts, comparisons) run over
+    all words in C, through NumPy when it is installed or one big-int
+    conversion otherwise; the in-place operators (&=, |=, ^=, <<=, >>=)
+    write back into the same storage.
+    """
+    __slots__ = ('_words', '_nbits')
 
     def __init__(self, nbits: int, val: Union[int, str, None] = None):
         """
         Fixed-size sequence of N bits.
-        
+
         Args:
             nbits (int): Number of bits (N).
             val: Initial value. Can be integer or binary string (e.g. "1010").
@@ -18,22 +56,67 @@ class Bitset(Container):
         """
         if nbits < 0:
             raise ValueError("nbits must be non-negative")
-        
+
         self._nbits = nbits
-        self._val = 0
-        
-        if isinstance(val, int):
-            self._val = val & ((1 << nbits) - 1)
-        elif isinstance(val, str):
+        self._words = array('Q', bytes(8 * _nwords(nbits)))
+
+        if isinstance(val, str):
             # Parse binary string. '110' -> 6 (1*4 + 1*2 + 0)
-            # std::bitset constructor from string uses index 0 as left-most char? 
             # In C++: string "1100" -> bitset[3]=1, [2]=1, [1]=0, [0]=0.
             # Python int('1100', 2) does exactly this (12).
-            # But we might need to truncate if string is longer than nbits.
-            # And handles '0b' prefix if present? Let's stick to simple "0101".
             if val.startswith("0b"):
                 val = val[2:]
-            self._val = int(val, 2) & ((1 << nbits) - 1)
+            val = int(val, 2)
+        if isinstance(val, int) and val:
+            self._store(val & ((1 << nbits) - 1))
+
+    # --------------------- Word Storage ---------------------
+    def _bytes(self) -> memoryview:
+        return memoryview(self._words).cast('B')
+
+    def _to_int(self) -> int:
+        """All bits as one int (bit i of the set is bit i of the int)."""
+        if _LITTLE:
+            return int.from_bytes(self._bytes(), 'little')
+        words = array('Q', self._bytes().tobytes())
+        words.byteswap()
+        return int.from_bytes(words, 'little')
+
+    def _store(self, v: int):
+        """Writes v (already within N bits) into the existing words."""
+        if not len(self._words):
+            return
+        data: Any = v.to_bytes(8 * len(self._words), 'little')
+        if not _LITTLE:
+            data = array('Q', data)
+            data.byteswap()
+        self._bytes()[:] = data
+
+    def _fill(self, word: int):
+        n = len(self._words)
+        if not n:
+            return
+        view = memoryview(self._words)
+        view[0] = word
+        filled = 1
+        while filled < n: # Doubling copies: O(log n) memmoves
+            chunk = min(filled, n - filled)
+            view[filled:filled + chunk] = view[0:chunk]
+            filled += chunk
+        self._mask_tail()
+
+    def _mask_tail(self):
+        # Bits past N in the last word stay zero
+        r = self._nbits & 63
+        if r:
+            self._words[-1] &= (1 << r) - 1
+
+    def _copy(self) -> 'Bitset':
+        res = Bitset.__new__(Bitset)
+        res._nbits = self._nbits
+        res._words = array('Q')
+        res._words.frombytes(self._bytes())
+        return res
 
     # --------------------- Element Access ---------------------
     def __getitem__(self, pos: int) -> bool:
@@ -41,16 +124,16 @@ class Bitset(Container):
         if pos < 0: pos += self._nbits
         if not (0 <= pos < self._nbits):
             raise IndexError("Bitset index out of range")
-        return bool((self._val >> pos) & 1)
+        return bool((self._words[pos >> 6] >> (pos & 63)) & 1)
 
     def __setitem__(self, pos: int, value: bool):
         if pos < 0: pos += self._nbits
         if not (0 <= pos < self._nbits):
             raise IndexError("Bitset index out of range")
         if value:
-            self._val |= (1 << pos)
+            self._words[pos >> 6] |= (1 << (pos & 63))
         else:
-            self._val &= ~(1 << pos)
+            self._words[pos >> 6] &= ~(1 << (pos & 63))
 
     def test(self, pos: int) -> bool:
         """Checks if bit at pos is set. Throws IndexError if out of bounds."""
@@ -62,26 +145,62 @@ class Bitset(Container):
 
     def count(self) -> int:
         """Returns number of bits set to true."""
-        return bin(self._val).count('1')
+        return _popcount(self._to_int())
 
     def any(self) -> bool:
-        return self._val != 0
+        return _NONZERO.search(self._bytes()) is not None
 
     def none(self) -> bool:
-        return self._val == 0
+        return not self.any()
 
     def all(self) -> bool:
-        # Check if val == (1<<N) - 1
-        return self._val == ((1 << self._nbits) - 1)
+        return self.count() == self._nbits
+
+    # --------------------- Searching ---------------------
+    def _scan(self, word: int) -> int:
+        # First set bit in words[word:], or N
+        m = _NONZERO.search(self._bytes(), word << 3)
+        if m is None:
+            return self._nbits
+        i = m.start() >> 3
+        return (i << 6) + _lowbit(self._words[i])
+
+    def find_first(self) -> int:
+        """Index of the lowest set bit, or size() if none (GCC's _Find_first)."""
+        return self._scan(0)
+
+    def find_next(self, pos: int) -> int:
+        """Index of the lowest set bit after pos, or size() if none (_Find_next)."""
+        pos += 1
+        if pos < 0:
+            pos = 0
+        if pos >= self._nbits:
+            return self._nbits
+        w = self._words[pos >> 6] >> (pos & 63)
+        if w:
+            return pos + _lowbit(w)
+        return self._scan((pos >> 6) + 1)
+
+    def iter_set_bits(self) -> Iterator[int]:
+        """Yields the index of every set bit in increasing order, skipping empty words in C."""
+        words = self._words
+        nxt = 0
+        for m in _NONZERO_RUN.finditer(self._bytes()):
+            last = (m.end() - 1) >> 3
+            for i in range(max(m.start() >> 3, nxt), last + 1):
+                w = words[i]
+                base = i << 6
+                while w:
+                    low = w & -w
+                    yield base + low.bit_length() - 1
+                    w ^= low
+            nxt = last + 1
 
     # --------------------- Modifiers ---------------------
     def set(self, pos: int | None = None, val: bool = True):
         """Sets bit at pos to val. If pos is None, sets all bits."""
         if pos is None:
-            if val:
-                self._val = (1 << self._nbits) - 1
-            else:
-                self._val = 0
+            self._fill(_FULL if val else 0)
         else:
             self[pos] = val
 
@@ -92,54 +211,116 @@ class Bitset(Container):
     def flip(self, pos: int | None = None):
         """Flips bit at pos. If pos is None, flips all."""
         if pos is None:
-            mask = (1 << self._nbits) - 1
-            self._val ^= mask
+            if _np is not None and len(self._words):
+                words = _np.frombuffer(self._words, dtype=_np.uint64)
+                _np.invert(words, out=words)
+                self._mask_tail()
+            else:
+                self._store(self._to_int() ^ ((1 << self._nbits) - 1))
         else:
             if pos < 0: pos += self._nbits
             if not (0 <= pos < self._nbits):
                 raise IndexError("Bitset index out of range")
-            self._val ^= (1 << pos)
+            self._words[pos >> 6] ^= (1 << (pos & 63))
 
     # --------------------- Conversions ---------------------
     def to_ulong(self) -> int:
-        return self._val
+        return self._to_int()
 
     def to_string(self) -> str:
         """Returns string representation (0s and 1s). pos 0 is on the RIGHT."""
         # Python bin() gives '0b101'. We want '0'*padding + '101'.
-        s = bin(self._val)[2:] # strip 0b
+        s = bin(self._to_int())[2:] # strip 0b
         return s.zfill(self._nbits)
 
+    def to_bytes(self, bitorder: str = 'little') -> bytes:
+        """
+        Packed bits, (N + 7) // 8 bytes. With 'little' bit 0 is the LSB of
+        byte 0 (the word storage's own layout); with 'big' it is the MSB.
+        """
+        nbytes = (self._nbits + 7) >> 3
+        if _LITTLE:
+            data = self._bytes()[:nbytes].tobytes()
+        else:
+            data = self._to_int().to_bytes(nbytes, 'little')
+        return data if check_bitorder(bitorder) == 'little' else data.translate(REVERSED_BITS)
+
+    @classmethod
+    def from_bytes(cls, data: Any, nbits: int | None = None, bitorder: str = 'little') -> 'Bitset':
+        """Inverse of to_bytes; nbits defaults to 8 bits per byte of data."""
+        data = bytes(data)
+        if nbits is None:
+            nbits = 8 * len(data)
+        if nbits < 0 or (nbits + 7) >> 3 > len(data):
+            raise ValueError(f"{len(data)} bytes cannot hold {nbits} bits")
+        if check_bitorder(bitorder) == 'big':
+            data = data.translate(REVERSED_BITS)
+        res = Bitset(nbits)
+        if nbits:
+            res._bytes()[:(nbits + 7) >> 3] = data[:(nbits + 7) >> 3]
+            if not _LITTLE:
+                res._words.byteswap()
+            res._mask_tail()
+        return res
+
     # --------------------- Bitwise Operators ---------------------
-    def __and__(self, other: 'Bitset') -> 'Bitset':
+    def _apply(self, other: 'Bitset', op: Callable[[int, int], int], ufunc: str) -> 'Bitset':
+        # In place: the result is written over this bitset's words
+        if not isinstance(other, Bitset):
+            return NotImplemented
         if self._nbits != other._nbits: raise ValueError("Bitset size mismatch")
-        return Bitset(self._nbits, self._val & other._val)
+        if _np is not None and len(self._words):
+            words = _np.frombuffer(self._words, dtype=_np.uint64)
+            getattr(_np, ufunc)(words, _np.frombuffer(other._words, dtype=_np.uint64), out=words)
+        else:
+            self._store(op(self._to_int(), other._to_int()))
+        return self
+
+    def __iand__(self, other: 'Bitset') -> 'Bitset':
+        return self._apply(other, operator.and_, 'bitwise_and')
+
+    def __ior__(self, other: 'Bitset') -> 'Bitset':
+        return self._apply(other, operator.or_, 'bitwise_or')
+
+    def __ixor__(self, other: 'Bitset') -> 'Bitset':
+        return self._apply(other, operator.xor, 'bitwise_xor')
+
+    def __ilshift__(self, pos: int) -> 'Bitset':
+        self._store((self._to_int() << pos) & ((1 << self._nbits) - 1))
+        return self
+
+    def __irshift__(self, pos: int) -> 'Bitset':
+        self._store(self._to_int() >> pos)
+        return self
+
+    def __and__(self, other: 'Bitset') -> 'Bitset':
+        if not isinstance(other, Bitset): return NotImplemented
+        return self._copy().__iand__(other)
 
     def __or__(self, other: 'Bitset') -> 'Bitset':
-        if self._nbits != other._nbits: raise ValueError("Bitset size mismatch")
-        return Bitset(self._nbits, self._val | other._val)
+        if not isinstance(other, Bitset): return NotImplemented
+        return self._copy().__ior__(other)
 
     def __xor__(self, other: 'Bitset') -> 'Bitset':
-        if self._nbits != other._nbits: raise ValueError("Bitset size mismatch")
-        return Bitset(self._nbits, self._val ^ other._val)
+        if not isinstance(other, Bitset): return NotImplemented
+        return self._copy().__ixor__(other)
 
     def __invert__(self) -> 'Bitset':
         # ~x
-        new_val = (~self._val) & ((1 << self._nbits) - 1)
-        return Bitset(self._nbits, new_val)
+        res = self._copy()
+        res.flip()
+        return res
 
     def __lshift__(self, pos: int) -> 'Bitset':
-        new_val = (self._val << pos) & ((1 << self._nbits) - 1)
-        return Bitset(self._nbits, new_val)
+        return self._copy().__ilshift__(pos)
 
     def __rshift__(self, pos: int) -> 'Bitset':
-        new_val = (self._val >> pos)
-        return Bitset(self._nbits, new_val)
-    
+        return self._copy().__irshift__(pos)
+
     # --------------------- Comparisons ---------------------
     def __eq__(self, other):
         if not isinstance(other, Bitset): return False
-        return self._nbits == other._nbits and self._val == other._val
+        return self._nbits == other._nbits and self._words == other._words
 
     def __repr__(self):
         return f"bitset<{self._nbits}>({self.to_string()})"
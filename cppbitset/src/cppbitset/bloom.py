@@ -0,0 +1,378 @@
+from __future__ import annotations
+from typing import Any, Iterable, List, Tuple
+from collections import Counter
+from hashlib import blake2b
+import math
+import struct
+
+from .bitset import Bitset, _NONZERO
+
+try: # Optional: vectorised hashing arithmetic and scatter/gather for the batched calls
+    import numpy as _np
+except ImportError: # pragma: no cover
+    _np = None
+
+_MASK64 = (1 << 64) - 1
+_MAX_COUNT = 255 # Counting filter counters saturate here and are never decremented again
+_HEADER = struct.Struct('<4sIQ') # magic, number of hashes, number of slots
+
+
+def _key_bytes(item: Any) -> bytes:
+    # Stable across processes (unlike hash()), so filters can be serialized
+    if isinstance(item, str):
+        return item.encode('utf-8')
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        return bytes(item)
+    if isinstance(item, int):
+        return str(item).encode()
+    return repr(item).encode('utf-8')
+
+
+def _digest(item: Any) -> bytes:
+    return blake2b(_key_bytes(item), digest_size=16).digest()
+
+
+def _optimal(capacity: int, fp_rate: float) -> Tuple[int, int]:
+    """Number of slots m and hashes k for `capacity` items at false-positive rate `fp_rate`."""
+    if capacity <= 0:
+        raise ValueError("capacity must be positive")
+    if not 0.0 < fp_rate < 1.0:
+        raise ValueError("fp_rate must be between 0 and 1")
+    m = max(1, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+    k = max(1, round(m / capacity * math.log(2)))
+    return m, k
+
+
+class _Filter:
+    """
+    Shared hashing for the Bloom filters.
+
+    Each item is hashed once (BLAKE2b, 128 bits) into h1 and h2, and its k
+    slots are (h1 + i * h2) mod 2**64 mod m for i in range(k): double
+    hashing, so k costs no extra hash calls.
+    """
+    __slots__ = ('_m', '_k')
+    _MAGIC = b''
+
+    def _positions(self, item: Any) -> List[int]:
+        d = _digest(item)
+        h1 = int.from_bytes(d[:8], 'little')
+        h2 = int.from_bytes(d[8:], 'little') | 1
+        m = self._m
+        return [((h1 + i * h2) & _MASK64) % m for i in range(self._k)]
+
+    def _positions_many(self, items: Iterable[Any]) -> Any:
+        # One (n, k) uint64 array; uint64 arithmetic wraps mod 2**64 like _positions
+        digests = b''.join(map(_digest, items))
+        h = _np.frombuffer(digests, dtype='<u8').reshape(-1, 2).astype(_np.uint64)
+        h1, h2 = h[:, :1], h[:, 1:] | _np.uint64(1)
+        steps = _np.arange(self._k, dtype=_np.uint64)
+        return (h1 + steps * h2) % _np.uint64(self._m)
+
+    def size(self) -> int:
+        """Number of slots (m)."""
+        return self._m
+
+    def num_hashes(self) -> int:
+        return self._k
+
+    def _check(self, other: Any):
+        if type(other) is not type(self):
+            raise TypeError(f"expected {type(self).__name__}, got {type(other).__name__}")
+        if (self._m, self._k) != (other._m, other._k):
+            raise ValueError(f"{type(self).__name__} size mismatch")
+
+    @classmethod
+    def _read_header(cls, data: Any) -> Tuple[int, int, memoryview]:
+        view = memoryview(data).cast('B')
+        if len(view) < _HEADER.size:
+            raise ValueError("truncated filter")
+        magic, k, m = _HEADER.unpack_from(view)
+        if magic != cls._MAGIC:
+            raise ValueError(f"not a serialized {cls.__name__}")
+        if m <= 0 or k <= 0:
+            raise ValueError(f"corrupt {cls.__name__}: slots and hashes must be positive")
+        return m, k, view[_HEADER.size:]
+
+
+class BloomFilter(_Filter):
+    """
+    Probabilistic set membership over a Bitset.
+
+    `x in f` is False only for items never added; for other items it is
+    True with probability about `fp_rate`. The filter is sized from the
+    expected number of items and the target rate, and uses m bits in total
+    whatever the items are.
+
+    Items are hashed by value: str (UTF-8), bytes-like objects, ints (in
+    decimal, so 5 and "5" are the same key) and anything else by repr().
+    """
+    __slots__ = ('_bits',)
+    _MAGIC = b'BLM1'
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01):
+        """
+        Args:
+            capacity (int): Expected number of distinct items.
+            fp_rate (float): Target false-positive rate at that capacity.
+        """
+        self._m, self._k = _optimal(capacity, fp_rate)
+        self._bits = Bitset(self._m)
+
+    @classmethod
+    def with_size(cls, nbits: int, nhashes: int) -> 'BloomFilter':
+        """A filter with exactly nbits bits and nhashes hash functions."""
+        if nbits <= 0 or nhashes <= 0:
+            raise ValueError("nbits and nhashes must be positive")
+        f = cls.__new__(cls)
+        f._m, f._k = nbits, nhashes
+        f._bits = Bitset(nbits)
+        return f
+
+    # --------------------- Modifiers ---------------------
+    def add(self, item: Any):
+        words = self._bits._words
+        for p in self._positions(item):
+            words[p >> 6] |= 1 << (p & 63)
+
+    def add_many(self, items: Iterable[Any]):
+        """Adds every item; with NumPy the bits are set in one scatter."""
+        if _np is None:
+            for item in items:
+                self.add(item)
+            return
+        pos = self._positions_many(items).ravel()
+        words = _np.frombuffer(self._bits._words, dtype=_np.uint64)
+        _np.bitwise_or.at(words, pos >> _np.uint64(6), _np.uint64(1) << (pos & _np.uint64(63)))
+
+    def clear(self):
+        self._bits.reset()
+
+    # --------------------- Lookup ---------------------
+    def __contains__(self, item: Any) -> bool:
+        words = self._bits._words
+        return all(words[p >> 6] >> (p & 63) & 1 for p in self._positions(item))
+
+    def contains_many(self, items: Iterable[Any]) -> List[bool]:
+        """Membership of every item, in order."""
+        if _np is None:
+            return [item in self for item in items]
+        pos = self._positions_many(items)
+        words = _np.frombuffer(self._bits._words, dtype=_np.uint64)
+        hit = (words[pos >> _np.uint64(6)] >> (pos & _np.uint64(63))) & _np.uint64(1)
+        return hit.all(axis=1).tolist()
+
+    def estimate_count(self) -> float:
+        """Estimated number of distinct items added (Swamidass & Baldi)."""
+        x = self._bits.count()
+        if x >= self._m:
+            return math.inf
+        return -self._m / self._k * math.log(1 - x / self._m)
+
+    def false_positive_rate(self) -> float:
+        """Current false-positive probability from the fraction of set bits."""
+        return (self._bits.count() / self._m) ** self._k
+
+    # --------------------- Set Operations ---------------------
+    # Filters with the same m and k combine bitwise: | holds every item of
+    # both, & answers True only where both would (at a rate no better than
+    # a filter built from the intersection directly).
+    def _derive(self, bits: Bitset) -> 'BloomFilter':
+        f = BloomFilter.__new__(BloomFilter)
+        f._m, f._k, f._bits = self._m, self._k, bits
+        return f
+
+    def __or__(self, other: 'BloomFilter') -> 'BloomFilter':
+        self._check(other)
+        return self._derive(self._bits | other._bits)
+
+    def __and__(self, other: 'BloomFilter') -> 'BloomFilter':
+        self._check(other)
+        return self._derive(self._bits & other._bits)
+
+    def __ior__(self, other: 'BloomFilter') -> 'BloomFilter':
+        self._check(other)
+        self._bits |= other._bits
+        return self
+
+    def __iand__(self, other: 'BloomFilter') -> 'BloomFilter':
+        self._check(other)
+        self._bits &= other._bits
+        return self
+
+    def union(self, other: 'BloomFilter') -> 'BloomFilter':
+        return self | other
+
+    def intersection(self, other: 'BloomFilter') -> 'BloomFilter':
+        return self & other
+
+    def __eq__(self, other):
+        if not isinstance(other, BloomFilter): return False
+        return (self._m, self._k) == (other._m, other._k) and self._bits == other._bits
+
+    __hash__ = None # Mutable
+
+    # --------------------- Serialization ---------------------
+    def to_bytes(self) -> bytes:
+        """Header (magic, k, m) followed by the bits as Bitset.to_bytes()."""
+        return _HEADER.pack(self._MAGIC, self._k, self._m) + self._bits.to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data: Any) -> 'BloomFilter':
+        m, k, body = cls._read_header(data)
+        if len(body) != (m + 7) >> 3:
+            raise ValueError("truncated BloomFilter")
+        f = cls.__new__(cls)
+        f._m, f._k = m, k
+        f._bits = Bitset.from_bytes(body, m)
+        return f
+
+    def __repr__(self):
+        return f"BloomFilter(bits={self._m}, hashes={self._k}, set={self._bits.count()})"
+
+
+class CountingBloomFilter(_Filter):
+    """
+    Bloom filter with an 8-bit counter per slot, so items can be removed.
+
+    Adding increments an item's k counters and removing decrements them;
+    membership requires all k to be non-zero. Counters saturate at 255 and
+    then stay there (decrementing them could create false negatives).
+    """
+    __slots__ = ('_counts',)
+    _MAGIC = b'CBL1'
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01):
+        self._m, self._k = _optimal(capacity, fp_rate)
+        self._counts = bytearray(self._m)
+
+    @classmethod
+    def with_size(cls, nslots: int, nhashes: int) -> 'CountingBloomFilter':
+        if nslots <= 0 or nhashes <= 0:
+            raise ValueError("nslots and nhashes must be positive")
+        f = cls.__new__(cls)
+        f._m, f._k = nslots, nhashes
+        f._counts = bytearray(nslots)
+        return f
+
+    # --------------------- Modifiers ---------------------
+    def add(self, item: Any):
+        counts = self._counts
+        for p in self._positions(item):
+            if counts[p] < _MAX_COUNT:
+                counts[p] += 1
+
+    def add_many(self, items: Iterable[Any]):
+        if _np is None:
+            for item in items:
+                self.add(item)
+            return
+        slots, hits = _np.unique(self._positions_many(items), return_counts=True)
+        counts = _np.frombuffer(self._counts, dtype=_np.uint8)
+        counts[slots] = _np.minimum(counts[slots] + hits, _MAX_COUNT)
+
+    def remove(self, item: Any):
+        """Removes one occurrence of item; KeyError if it is definitely absent."""
+        counts = self._counts
+        # Double hashing can repeat a slot; add() incremented it once per repeat
+        pos = Counter(self._positions(item))
+        if not all(counts[p] >= n for p, n in pos.items()):
+            raise KeyError(item)
+        for p, n in pos.items():
+            if counts[p] < _MAX_COUNT:
+                counts[p] -= n
+
+    def discard(self, item: Any):
+        try:
+            self.remove(item)
+        except KeyError:
+            pass
+
+    def clear(self):
+        self._counts[:] = bytes(self._m)
+
+    # --------------------- Lookup ---------------------
+    def __contains__(self, item: Any) -> bool:
+        counts = self._counts
+        return all(counts[p] for p in self._positions(item))
+
+    def contains_many(self, items: Iterable[Any]) -> List[bool]:
+        if _np is None:
+            return [item in self for item in items]
+        counts = _np.frombuffer(self._counts, dtype=_np.uint8)
+        return (counts[self._positions_many(items)] != 0).all(axis=1).tolist()
+
+    def to_bloom(self) -> BloomFilter:
+        """Plain BloomFilter with a bit set for every non-zero counter."""
+        f = BloomFilter.with_size(self._m, self._k)
+        if _np is not None:
+            flags = _np.frombuffer(self._counts, dtype=_np.uint8) != 0
+            f._bits = Bitset.from_bytes(_np.packbits(flags, bitorder='little').tobytes(), self._m)
+        else:
+            words = f._bits._words
+            for m in _NONZERO.finditer(self._counts):
+                p = m.start()
+                words[p >> 6] |= 1 << (p & 63)
+        return f
+
+    # --------------------- Set Operations ---------------------
+    # Union adds counters (saturating), intersection keeps the smaller one.
+    def _combine(self, other: 'CountingBloomFilter', union: bool) -> bytearray:
+        self._check(other)
+        if _np is not None:
+            a = _np.frombuffer(self._counts, dtype=_np.uint8).astype(_np.uint16)
+            b = _np.frombuffer(other._counts, dtype=_np.uint8)
+            res = _np.minimum(a + b, _MAX_COUNT) if union else _np.minimum(a, b)
+            return bytearray(res.astype(_np.uint8).tobytes())
+        if union:
+            return bytearray(min(x + y, _MAX_COUNT) for x, y in zip(self._counts, other._counts))
+        return bytearray(map(min, self._counts, other._counts))
+
+    def _derive(self, counts: bytearray) -> 'CountingBloomFilter':
+        f = CountingBloomFilter.__new__(CountingBloomFilter)
+        f._m, f._k, f._counts = self._m, self._k, counts
+        return f
+
+    def __or__(self, other: 'CountingBloomFilter') -> 'CountingBloomFilter':
+        return self._derive(self._combine(other, True))
+
+    def __and__(self, other: 'CountingBloomFilter') -> 'CountingBloomFilter':
+        return self._derive(self._combine(other, False))
+
+    def __ior__(self, other: 'CountingBloomFilter') -> 'CountingBloomFilter':
+        self._counts = self._combine(other, True)
+        return self
+
+    def __iand__(self, other: 'CountingBloomFilter') -> 'CountingBloomFilter':
+        self._counts = self._combine(other, False)
+        return self
+
+    def union(self, other: 'CountingBloomFilter') -> 'CountingBloomFilter':
+        return self | other
+
+    def intersection(self, other: 'CountingBloomFilter') -> 'CountingBloomFilter':
+        return self & other
+
+    def __eq__(self, other):
+        if not isinstance(other, CountingBloomFilter): return False
+        return (self._m, self._k) == (other._m, other._k) and self._counts == other._counts
+
+    __hash__ = None # Mutable
+
+    # --------------------- Serialization ---------------------
+    def to_bytes(self) -> bytes:
+        """Header (magic, k, m) followed by one byte per counter."""
+        return _HEADER.pack(self._MAGIC, self._k, self._m) + bytes(self._counts)
+
+    @classmethod
+    def from_bytes(cls, data: Any) -> 'CountingBloomFilter':
+        m, k, body = cls._read_header(data)
+        if len(body) != m:
+            raise ValueError("truncated CountingBloomFilter")
+        f = cls.__new__(cls)
+        f._m, f._k = m, k
+        f._counts = bytearray(body)
+        return f
+
+    def __repr__(self):
+        return f"CountingBloomFilter(slots={self._m}, hashes={self._k})"
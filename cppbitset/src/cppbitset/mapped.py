@@ -0,0 +1,95 @@
+from __future__ import annotations
+from typing import Callable, Optional, Union
+import mmap
+import os
+
+from .bitset import Bitset, _LITTLE, _nwords
+
+
+class MappedBitset(Bitset):
+    """
+    Bitset whose words live in a memory-mapped file.
+
+    The file holds the bits in `Bitset.to_bytes('little')` layout, padded to
+    whole 64-bit words. Opening it maps the file instead of reading it, so a
+    1 GB bitmap is usable immediately and its pages are loaded on demand;
+    every Bitset operation works on the mapping. Writable maps are shared:
+    other processes mapping the same file see changes without copying, and
+    `flush()` writes them back to disk.
+
+    Binary operators (&, |, ^, ~, shifts) return ordinary in-memory Bitsets;
+    the in-place forms write into the file.
+    """
+    __slots__ = ('_mmap', '_path', '_readonly')
+
+    def __init__(self, path: Union[str, os.PathLike], nbits: Optional[int] = None,
+                 readonly: bool = False):
+        """
+        Args:
+            path: File to map. Created if missing (unless readonly).
+            nbits (int): Number of bits. Defaults to 8 per byte of the file.
+                A writable file that is too short is extended with zero bits.
+            readonly (bool): Map read-only; modifying the bits raises TypeError.
+        """
+        if not _LITTLE: # pragma: no cover
+            raise NotImplementedError("MappedBitset needs a little-endian host (words are mapped as-is)")
+        exists = os.path.exists(path)
+        if readonly and not exists:
+            raise FileNotFoundError(path)
+        with open(path, 'rb' if readonly else ('r+b' if exists else 'w+b')) as f:
+            size = os.fstat(f.fileno()).st_size
+            if nbits is None:
+                nbits = 8 * size
+            if nbits <= 0:
+                raise ValueError("MappedBitset needs a positive number of bits")
+            need = 8 * _nwords(nbits)
+            if size < need:
+                if readonly:
+                    raise ValueError(f"{path}: {size} bytes cannot hold {nbits} bits in 64-bit words")
+                f.truncate(need) # Zero-filled
+            access = mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE
+            self._mmap = mmap.mmap(f.fileno(), need, access=access)
+        self._path = os.fspath(path)
+        self._readonly = readonly
+        self._nbits = nbits
+        self._words = memoryview(self._mmap).cast('Q')
+
+    # NumPy refuses read-only output arrays with ValueError; check first so
+    # every write to a read-only map raises TypeError, as memoryview does
+    def _writable(self):
+        if self._readonly:
+            raise TypeError("cannot modify read-only memory")
+
+    def _apply(self, other: Bitset, op: Callable[[int, int], int], ufunc: str) -> Bitset:
+        self._writable()
+        return super()._apply(other, op, ufunc)
+
+    def flip(self, pos: Optional[int] = None):
+        self._writable()
+        super().flip(pos)
+
+    def flush(self):
+        """Writes modified pages back to the file."""
+        if not self._readonly:
+            self._mmap.flush()
+
+    def close(self):
+        """Unmaps the file. The bitset is unusable afterwards."""
+        if self._mmap.closed:
+            return
+        self.flush()
+        self._words.release()
+        self._mmap.close()
+
+    def __enter__(self) -> 'MappedBitset':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __reduce__(self):
+        # Workers re-map the same file rather than receiving a copy of the bits
+        return (MappedBitset, (self._path, self._nbits, self._readonly))
+
+    def __repr__(self):
+        return f"MappedBitset<{self._nbits}>({self._path!r})"
@@ -0,0 +1,603 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, List, Optional, Union
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+import operator
+import re
+import struct
+import sys
+
+from cppbase import Container
+from .bitset import _popcount
+
+# Portable roaring format (https://github.com/RoaringBitmap/RoaringFormatSpec)
+_SERIAL_COOKIE_NO_RUNCONTAINER = 12346
+_SERIAL_COOKIE = 12347
+_NO_OFFSET_THRESHOLD = 4
+
+_ARRAY_MAX = 4096       # Array containers hold at most this many values
+_BITMAP_BYTES = 8192    # 65536 bits
+_LITTLE = sys.byteorder == 'little'
+_NONZERO_RUN = re.compile(b'[^\x00]+')
+_BYTE_BITS = [tuple(k for k in range(8) if b >> k & 1) for b in range(256)]
+
+
+def _bits_of(data: Union[bytes, bytearray]) -> List[int]:
+    """Positions of the set bits of a little-endian bitmap, ascending."""
+    out: List[int] = []
+    for m in _NONZERO_RUN.finditer(data):
+        for i in range(m.start(), m.end()):
+            base = i << 3
+            out.extend([base + k for k in _BYTE_BITS[data[i]]])
+    return out
+
+
+def _u16(values: Iterable[int]) -> array:
+    return array('H', values)
+
+
+def _le(a: array) -> bytes:
+    if not _LITTLE:
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a.tobytes()
+
+
+def _from_le(typecode: str, data: Union[bytes, memoryview]) -> array:
+    a = array(typecode)
+    a.frombytes(data)
+    if not _LITTLE:
+        a.byteswap()
+    return a
+
+
+# --------------------- Containers ---------------------
+# Each holds the low 16 bits of the values in one 64K chunk.
+
+class _ArrayContainer:
+    """Sorted array('H') of up to 4096 values."""
+    __slots__ = ('values',)
+
+    def __init__(self, values: array):
+        self.values = values
+
+    def cardinality(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, low: int) -> bool:
+        i = bisect_left(self.values, low)
+        return i < len(self.values) and self.values[i] == low
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.values)
+
+    def as_int(self) -> int:
+        bits = bytearray(_BITMAP_BYTES)
+        for v in self.values:
+            bits[v >> 3] |= 1 << (v & 7)
+        return int.from_bytes(bits, 'little')
+
+    def rank(self, low: int) -> int:
+        return bisect_right(self.values, low)
+
+    def select(self, i: int) -> int:
+        return self.values[i]
+
+    def add(self, low: int) -> '_Container':
+        if low in self:
+            return self
+        if len(self.values) < _ARRAY_MAX:
+            insort(self.values, low)
+            return self
+        return _BitmapContainer.from_int(self.as_int() | (1 << low), _ARRAY_MAX + 1)
+
+    def discard(self, low: int) -> '_Container':
+        i = bisect_left(self.values, low)
+        if i < len(self.values) and self.values[i] == low:
+            del self.values[i]
+        return self
+
+    def copy(self) -> '_ArrayContainer':
+        return _ArrayContainer(array('H', self.values))
+
+    def serialized(self) -> bytes:
+        return _le(self.values)
+
+
+class _BitmapContainer:
+    """65536-bit little-endian bitmap (bytearray) with its cardinality."""
+    __slots__ = ('bits', 'card')
+
+    def __init__(self, bits: bytearray, card: int):
+        self.bits = bits
+        self.card = card
+
+    @staticmethod
+    def from_int(v: int, card: int) -> '_BitmapContainer':
+        return _BitmapContainer(bytearray(v.to_bytes(_BITMAP_BYTES, 'little')), card)
+
+    def cardinality(self) -> int:
+        return self.card
+
+    def __contains__(self, low: int) -> bool:
+        return bool(self.bits[low >> 3] >> (low & 7) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(_bits_of(self.bits))
+
+    def as_int(self) -> int:
+        return int.from_bytes(self.bits, 'little')
+
+    def rank(self, low: int) -> int:
+        b = low >> 3
+        head = _popcount(int.from_bytes(self.bits[:b], 'little'))
+        return head + _popcount(self.bits[b] & ((2 << (low & 7)) - 1))
+
+    def select(self, i: int) -> int:
+        # Smallest byte whose prefix holds more than i bits, by bisection
+        bits = self.bits
+        lo, hi = 0, _BITMAP_BYTES
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if _popcount(int.from_bytes(bits[:mid + 1], 'little')) > i:
+                hi = mid
+            else:
+                lo = mid + 1
+        before = _popcount(int.from_bytes(bits[:lo], 'little'))
+        return (lo << 3) + _BYTE_BITS[bits[lo]][i - before]
+
+    def add(self, low: int) -> '_Container':
+        mask = 1 << (low & 7)
+        if not self.bits[low >> 3] & mask:
+            self.bits[low >> 3] |= mask
+            self.card += 1
+        return self
+
+    def discard(self, low: int) -> '_Container':
+        mask = 1 << (low & 7)
+        if self.bits[low >> 3] & mask:
+            self.bits[low >> 3] &= ~mask & 0xFF
+            self.card -= 1
+            if self.card <= _ARRAY_MAX:
+                return _ArrayContainer(_u16(_bits_of(self.bits)))
+        return self
+
+    def copy(self) -> '_BitmapContainer':
+        return _BitmapContainer(bytearray(self.bits), self.card)
+
+    def serialized(self) -> bytes:
+        return bytes(self.bits)
+
+
+class _RunContainer:
+    """Runs of consecutive values as parallel starts / (length - 1) arrays."""
+    __slots__ = ('starts', 'lengths')
+
+    def __init__(self, starts: array, lengths: array):
+        self.starts = starts
+        self.lengths = lengths
+
+    @staticmethod
+    def from_int(v: int) -> '_RunContainer':
+        mask = (1 << 65536) - 1
+        firsts = _bits_of((v & ~(v << 1) & mask).to_bytes(_BITMAP_BYTES, 'little'))
+        lasts = _bits_of((v & ~(v >> 1)).to_bytes(_BITMAP_BYTES, 'little'))
+        return _RunContainer(_u16(firsts), _u16(map(operator.sub, lasts, firsts)))
+
+    def cardinality(self) -> int:
+        return sum(self.lengths) + len(self.lengths)
+
+    def __contains__(self, low: int) -> bool:
+        i = bisect_right(self.starts, low) - 1
+        return i >= 0 and low <= self.starts[i] + self.lengths[i]
+
+    def __iter__(self) -> Iterator[int]:
+        for s, n in zip(self.starts, self.lengths):
+            yield from range(s, s + n + 1)
+
+    def as_int(self) -> int:
+        v = 0
+        for s, n in zip(self.starts, self.lengths):
+            v |= ((2 << n) - 1) << s
+        return v
+
+    def rank(self, low: int) -> int:
+        i = bisect_right(self.starts, low)
+        if not i:
+            return 0
+        total = sum(self.lengths[:i]) + i
+        end = self.starts[i - 1] + self.lengths[i - 1]
+        return total - max(0, end - low)
+
+    def select(self, i: int) -> int:
+        for s, n in zip(self.starts, self.lengths):
+            if i <= n:
+                return s + i
+            i -= n + 1
+        raise IndexError("select index out of range")
+
+    def add(self, low: int) -> '_Container':
+        if low in self:
+            return self
+        return _plain(self.as_int() | (1 << low), self.cardinality() + 1)
+
+    def discard(self, low: int) -> '_Container':
+        if low not in self:
+            return self
+        return _plain(self.as_int() & ~(1 << low), self.cardinality() - 1)
+
+    def copy(self) -> '_RunContainer':
+        return _RunContainer(array('H', self.starts), array('H', self.lengths))
+
+    def serialized(self) -> bytes:
+        runs = array('H', [0]) * (2 * len(self.starts))
+        runs[0::2] = self.starts
+        runs[1::2] = self.lengths
+        return struct.pack('<H', len(self.starts)) + _le(runs)
+
+
+_Container = Union[_ArrayContainer, _BitmapContainer, _RunContainer]
+
+
+def _plain(v: int, card: int) -> _Container:
+    # Array or bitmap, by cardinality
+    if card <= _ARRAY_MAX:
+        return _ArrayContainer(_u16(_bits_of(v.to_bytes(_BITMAP_BYTES, 'little'))))
+    return _BitmapContainer.from_int(v, card)
+
+
+def _best(v: int, card: int) -> Optional[_Container]:
+    """Smallest serialized representation of the 65536-bit set v (None if empty)."""
+    if not card:
+        return None
+    runs = _popcount(v & ~(v << 1))
+    if 2 + 4 * runs < min(2 * card, _BITMAP_BYTES):
+        return _RunContainer.from_int(v)
+    return _plain(v, card)
+
+
+def _from_sorted(values: List[int]) -> Optional[_Container]:
+    if not values:
+        return None
+    if len(values) <= _ARRAY_MAX:
+        return _ArrayContainer(_u16(values))
+    bits = bytearray(_BITMAP_BYTES)
+    for x in values:
+        bits[x >> 3] |= 1 << (x & 7)
+    v = int.from_bytes(bits, 'little')
+    return _best(v, len(values))
+
+
+_SET_OPS = {'and': operator.and_, 'or': operator.or_, 'xor': operator.xor, 'sub': operator.sub}
+_INT_OPS = dict(_SET_OPS, sub=lambda x, y: x & ~y)
+
+
+def _combine(a: _Container, b: _Container, op: str) -> Optional[_Container]:
+    # Hash-set operations for two arrays (C-level, faster than a Python merge
+    # at these sizes), membership filters for array against anything, one
+    # big-int operation otherwise
+    if isinstance(a, _ArrayContainer) and isinstance(b, _ArrayContainer):
+        return _from_sorted(sorted(_SET_OPS[op](set(a.values), set(b.values))))
+    if op == 'and' and isinstance(b, _ArrayContainer):
+        a, b = b, a
+    if op in ('and', 'sub') and isinstance(a, _ArrayContainer):
+        keep = op == 'and'
+        return _from_sorted([x for x in a.values if (x in b) is keep])
+    v = _INT_OPS[op](a.as_int(), b.as_int())
+    return _best(v, _popcount(v))
+
+
+class RoaringBitmap(Container):
+    """
+    Compressed set of 32-bit unsigned integers (Roaring bitmap).
+
+    The 32-bit space is split into 65536 chunks keyed by the high 16 bits.
+    Each non-empty chunk stores its low 16 bits in whichever container is
+    smallest: a sorted array (up to 4096 values), a 65536-bit bitmap, or a
+    list of runs. Set operations work chunk by chunk, so sparse ranges cost
+    a few bytes per value and dense ranges 1 bit per value.
+
+    `serialize()` / `deserialize()` use the portable roaring format shared
+    with CRoaring, Java and Go implementations.
+    """
+    __slots__ = ('_keys', '_containers')
+
+    def __init__(self, values: Optional[Iterable[int]] = None):
+        self._keys = array('H')
+        self._containers: List[_Container] = []
+        if values is not None:
+            self.update(values)
+
+    @classmethod
+    def _build(cls, keys: Iterable[int], containers: Iterable[_Container]) -> 'RoaringBitmap':
+        res = cls.__new__(cls)
+        res._keys = array('H', keys)
+        res._containers = list(containers)
+        return res
+
+    def _locate(self, x: int):
+        if not (0 <= x < 1 << 32):
+            raise OverflowError(f"RoaringBitmap values are 32-bit unsigned, got {x}")
+        hi = x >> 16
+        i = bisect_left(self._keys, hi)
+        return i, hi, i < len(self._keys) and self._keys[i] == hi
+
+    # --------------------- Modifiers ---------------------
+    def add(self, x: int):
+        i, hi, found = self._locate(x)
+        if found:
+            self._containers[i] = self._containers[i].add(x & 0xFFFF)
+        else:
+            self._keys.insert(i, hi)
+            self._containers.insert(i, _ArrayContainer(_u16([x & 0xFFFF])))
+
+    def discard(self, x: int):
+        """Removes x if present."""
+        i, hi, found = self._locate(x)
+        if found:
+            c = self._containers[i].discard(x & 0xFFFF)
+            if c.cardinality():
+                self._containers[i] = c
+            else:
+                del self._keys[i]
+                del self._containers[i]
+
+    def update(self, values: Iterable[int]):
+        """Adds many values: sorted once and merged chunk by chunk."""
+        other = RoaringBitmap._build((), ())
+        values = sorted(set(values))
+        if values and (values[0] < 0 or values[-1] >= 1 << 32):
+            raise OverflowError("RoaringBitmap values are 32-bit unsigned")
+        i, n = 0, len(values)
+        while i < n:
+            hi = values[i] >> 16
+            j = bisect_left(values, (hi + 1) << 16, i)
+            other._keys.append(hi)
+            other._containers.append(_from_sorted(list(map((-(hi << 16)).__add__, values[i:j]))))
+            i = j
+        if self._keys:
+            other = self | other
+        self._keys, self._containers = other._keys, other._containers
+
+    def add_range(self, start: int, stop: int):
+        """Adds every value in [start, stop)."""
+        if start >= stop:
+            return
+        self._locate(start)
+        self._locate(stop - 1)
+        keys, containers = [], []
+        for hi in range((start >> 16), ((stop - 1) >> 16) + 1):
+            lo = max(start, hi << 16) & 0xFFFF
+            top = min(stop - 1, (hi << 16) | 0xFFFF) & 0xFFFF
+            keys.append(hi)
+            containers.append(_RunContainer(_u16([lo]), _u16([top - lo])))
+        self |= RoaringBitmap._build(keys, containers)
+
+    def clear(self):
+        self._keys = array('H')
+        self._containers = []
+
+    # --------------------- Lookup ---------------------
+    def __contains__(self, x: int) -> bool:
+        if not (0 <= x < 1 << 32):
+            return False
+        i, _, found = self._locate(x)
+        return found and (x & 0xFFFF) in self._containers[i]
+
+    def cardinality(self) -> int:
+        return sum(c.cardinality() for c in self._containers)
+
+    def __len__(self) -> int:
+        return self.cardinality()
+
+    def empty(self) -> bool:
+        return not self._keys
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def rank(self, x: int) -> int:
+        """Number of values <= x."""
+        x = min(max(x, -1), (1 << 32) - 1)
+        if x < 0:
+            return 0
+        hi = x >> 16
+        i = bisect_left(self._keys, hi)
+        total = sum(c.cardinality() for c in self._containers[:i])
+        if i < len(self._keys) and self._keys[i] == hi:
+            total += self._containers[i].rank(x & 0xFFFF)
+        return total
+
+    def select(self, i: int) -> int:
+        """The i-th smallest value (0-based)."""
+        if i < 0:
+            raise IndexError("select index out of range")
+        for hi, c in zip(self._keys, self._containers):
+            n = c.cardinality()
+            if i < n:
+                return (hi << 16) | c.select(i)
+            i -= n
+        raise IndexError("select index out of range")
+
+    def min(self) -> int:
+        if not self._keys:
+            raise ValueError("min() of an empty RoaringBitmap")
+        return (self._keys[0] << 16) | self._containers[0].select(0)
+
+    def max(self) -> int:
+        if not self._keys:
+            raise ValueError("max() of an empty RoaringBitmap")
+        c = self._containers[-1]
+        return (self._keys[-1] << 16) | c.select(c.cardinality() - 1)
+
+    # --------------------- Iteration ---------------------
+    def __iter__(self) -> Iterator[int]:
+        for hi, c in zip(self._keys, self._containers):
+            base = hi << 16
+            for low in c:
+                yield base | low
+
+    def tolist(self) -> List[int]:
+        return list(self)
+
+    # --------------------- Set Operations ---------------------
+    def _merge(self, other: 'RoaringBitmap', op: str) -> 'RoaringBitmap':
+        keys: List[int] = []
+        containers: List[_Container] = []
+        a_keys, b_keys = self._keys, other._keys
+        i = j = 0
+        n, m = len(a_keys), len(b_keys)
+        keep_a = op != 'and'           # Chunks only in self
+        keep_b = op in ('or', 'xor')   # Chunks only in other
+        # Containers carried over unchanged are copied: add/discard mutate
+        # them, and the result must not share state with its operands
+        while i < n or j < m:
+            ka = a_keys[i] if i < n else 1 << 16
+            kb = b_keys[j] if j < m else 1 << 16
+            if ka == kb:
+                c = _combine(self._containers[i], other._containers[j], op)
+                if c is not None:
+                    keys.append(ka)
+                    containers.append(c)
+                i += 1
+                j += 1
+            elif ka < kb:
+                if keep_a:
+                    keys.append(ka)
+                    containers.append(self._containers[i].copy())
+                i += 1
+            else:
+                if keep_b:
+                    keys.append(kb)
+                    containers.append(other._containers[j].copy())
+                j += 1
+        return RoaringBitmap._build(keys, containers)
+
+    def __and__(self, other: 'RoaringBitmap') -> 'RoaringBitmap':
+        if not isinstance(other, RoaringBitmap): return NotImplemented
+        return self._merge(other, 'and')
+
+    def __or__(self, other: 'RoaringBitmap') -> 'RoaringBitmap':
+        if not isinstance(other, RoaringBitmap): return NotImplemented
+        return self._merge(other, 'or')
+
+    def __sub__(self, other: 'RoaringBitmap') -> 'RoaringBitmap':
+        if not isinstance(other, RoaringBitmap): return NotImplemented
+        return self._merge(other, 'sub')
+
+    def __xor__(self, other: 'RoaringBitmap') -> 'RoaringBitmap':
+        if not isinstance(other, RoaringBitmap): return NotImplemented
+        return self._merge(other, 'xor')
+
+    def _assign(self, res: 'RoaringBitmap') -> 'RoaringBitmap':
+        self._keys, self._containers = res._keys, res._containers
+        return self
+
+    def __iand__(self, other: 'RoaringBitmap') -> 'RoaringBitmap':
+        if not isinstance(other, RoaringBitmap): return NotImplemented
+        return self._assign(self._merge(other, 'and'))
+
+    def __ior__(self, other: 'RoaringBitmap') -> 'RoaringBitmap':
+        if not isinstance(other, RoaringBitmap): return NotImplemented
+        return self._assign(self._merge(other, 'or'))
+
+    def __isub__(self, other: 'RoaringBitmap') -> 'RoaringBitmap':
+        if not isinstance(other, RoaringBitmap): return NotImplemented
+        return self._assign(self._merge(other, 'sub'))
+
+    def __ixor__(self, other: 'RoaringBitmap') -> 'RoaringBitmap':
+        if not isinstance(other, RoaringBitmap): return NotImplemented
+        return self._assign(self._merge(other, 'xor'))
+
+    # --------------------- Comparisons ---------------------
+    def __eq__(self, other):
+        if not isinstance(other, RoaringBitmap): return False
+        if self._keys != other._keys:
+            return False
+        return all(a is b or a.as_int() == b.as_int()
+                   for a, b in zip(self._containers, other._containers))
+
+    __hash__ = None # Mutable
+
+    # --------------------- Serialization ---------------------
+    def serialize(self) -> bytes:
+        """Portable roaring format bytes (readable by CRoaring / Java / Go)."""
+        n = len(self._keys)
+        is_run = [isinstance(c, _RunContainer) for c in self._containers]
+        parts: List[bytes] = []
+        if any(is_run):
+            flags = bytearray((n + 7) >> 3)
+            for k, r in enumerate(is_run):
+                if r:
+                    flags[k >> 3] |= 1 << (k & 7)
+            parts.append(struct.pack('<I', _SERIAL_COOKIE | ((n - 1) << 16)))
+            parts.append(bytes(flags))
+            with_offsets = n >= _NO_OFFSET_THRESHOLD
+        else:
+            parts.append(struct.pack('<II', _SERIAL_COOKIE_NO_RUNCONTAINER, n))
+            with_offsets = True
+        header = array('H', [0]) * (2 * n)
+        header[0::2] = self._keys
+        header[1::2] = array('H', [c.cardinality() - 1 for c in self._containers])
+        parts.append(_le(header))
+        bodies = [c.serialized() for c in self._containers]
+        if with_offsets:
+            pos = sum(map(len, parts)) + 4 * n
+            offsets = array('I')
+            for body in bodies:
+                offsets.append(pos)
+                pos += len(body)
+            parts.append(_le(offsets))
+        parts.extend(bodies)
+        return b''.join(parts)
+
+    @classmethod
+    def deserialize(cls, data: Union[bytes, bytearray, memoryview]) -> 'RoaringBitmap':
+        """Reads the portable roaring format written by serialize() or other roaring libraries."""
+        view = memoryview(data).cast('B')
+        try:
+            cookie, = struct.unpack_from('<I', view, 0)
+            pos = 4
+            if cookie & 0xFFFF == _SERIAL_COOKIE:
+                n = (cookie >> 16) + 1
+                flags = view[pos:pos + ((n + 7) >> 3)]
+                pos += len(flags)
+                is_run = [bool(flags[k >> 3] >> (k & 7) & 1) for k in range(n)]
+                with_offsets = n >= _NO_OFFSET_THRESHOLD
+            elif cookie == _SERIAL_COOKIE_NO_RUNCONTAINER:
+                n, = struct.unpack_from('<I', view, pos)
+                pos += 4
+                is_run = [False] * n
+                with_offsets = True
+            else:
+                raise ValueError("not a portable roaring bitmap (bad cookie)")
+            header = _from_le('H', view[pos:pos + 4 * n])
+            pos += 4 * n
+            if with_offsets:
+                pos += 4 * n # Containers are read in order; offsets are only for random access
+            keys = header[0::2]
+            containers: List[_Container] = []
+            for k in range(n):
+                card = header[2 * k + 1] + 1
+                if is_run[k]:
+                    nruns, = struct.unpack_from('<H', view, pos)
+                    runs = _from_le('H', view[pos + 2:pos + 2 + 4 * nruns])
+                    pos += 2 + 4 * nruns
+                    containers.append(_RunContainer(runs[0::2], runs[1::2]))
+                elif card <= _ARRAY_MAX:
+                    containers.append(_ArrayContainer(_from_le('H', view[pos:pos + 2 * card])))
+                    pos += 2 * card
+                else:
+                    containers.append(_BitmapContainer(bytearray(view[pos:pos + _BITMAP_BYTES]), card))
+                    pos += _BITMAP_BYTES
+        except struct.error:
+            raise ValueError("truncated roaring bitmap") from None
+        if pos > len(view) or len(keys) != n:
+            raise ValueError("truncated roaring bitmap")
+        return cls._build(keys, containers)
+
+    def __repr__(self):
+        shown = ', '.join(map(str, islice(self, 8)))
+        more = ', ...' if self.cardinality() > 8 else ''
+        return f"RoaringBitmap({{{shown}{more}}})"
@@ -69,5 +69,71 @@ class TestBitset(unittest.TestCase):
         self.assertEqual((b3 << 1).to_string(), "0110")
         self.assertEqual((b3 >> 1).to_string(), "0001")
 
+    def test_large_word_storage(self):
+        n = 200
+        b = Bitset(n)
+        for i in (0, 63, 64, 130, 199):
+            b[i] = True
+        self.assertEqual(b.count(), 5)
+        self.assertEqual(b.to_ulong(), sum(1 << i for i in (0, 63, 64, 130, 199)))
+        b.flip()
+        self.assertEqual(b.count(), n - 5)
+        self.assertFalse(b[64])
+        b.set()
+        self.assertTrue(b.all())
+        self.assertEqual(b.to_ulong(), (1 << n) - 1)
+
+    def test_inplace_ops(self):
+        a = Bitset(130, (1 << 129) | 0b1100)
+        b = Bitset(130, (1 << 129) | 0b1010)
+        words = a._words
+        a &= b
+        self.assertIs(a._words, words)
+        self.assertEqual(a.to_ulong(), (1 << 129) | 0b1000)
+        a |= Bitset(130, 1)
+        self.assertEqual(a.to_ulong(), (1 << 129) | 0b1001)
+        a ^= Bitset(130, 1 << 129)
+        self.assertEqual(a.to_ulong(), 0b1001)
+        a <<= 127 # Bit 3 moves past N and is dropped
+        self.assertEqual(a.to_ulong(), 1 << 127)
+        a >>= 120
+        self.assertEqual(a.to_ulong(), 1 << 7)
+        with self.assertRaises(ValueError):
+            a &= Bitset(8)
+
+    def test_find_and_iterate(self):
+        b = Bitset(300)
+        self.assertEqual(b.find_first(), 300)
+        self.assertEqual(list(b.iter_set_bits()), [])
+        bits = [3, 64, 65, 127, 128, 250, 299]
+        for i in bits:
+            b[i] = True
+        self.assertEqual(b.find_first(), 3)
+        found = []
+        pos = b.find_first()
+        while pos < b.size():
+            found.append(pos)
+            pos = b.find_next(pos)
+        self.assertEqual(found, bits)
+        self.assertEqual(list(b.iter_set_bits()), bits)
+        self.assertEqual(b.find_next(299), 300)
+        self.assertEqual(b.find_next(-1), 3)
+
+    def test_bytes_round_trip(self):
+        b = Bitset(13, 0b1000000000101)
+        self.assertEqual(b.to_bytes(), bytes([0b00000101, 0b00010000]))
+        self.assertEqual(b.to_bytes('big'), bytes([0b10100000, 0b00001000]))
+        self.assertEqual(Bitset.from_bytes(b.to_bytes(), 13), b)
+        self.assertEqual(Bitset.from_bytes(b.to_bytes('big'), 13, 'big'), b)
+        # Bits past N are dropped; the default size is 8 bits per byte
+        self.assertEqual(Bitset.from_bytes(b'\xff', 3).to_ulong(), 7)
+        self.assertEqual(Bitset.from_bytes(b'\x01\x80').size(), 16)
+        big = Bitset(130, (1 << 129) | 1)
+        self.assertEqual(Bitset.from_bytes(big.to_bytes(), 130), big)
+        with self.assertRaises(ValueError):
+            Bitset.from_bytes(b'\x00', 9)
+        with self.assertRaises(ValueError):
+            b.to_bytes('middle')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,109 @@
+import struct
+import unittest
+from cppbitset import BloomFilter, CountingBloomFilter
+
+class TestBloomFilter(unittest.TestCase):
+    def setUp(self):
+        self.items = [f"user:{i}" for i in range(2000)]
+        self.f = BloomFilter(2000, 0.01)
+        self.f.add_many(self.items)
+
+    def test_sizing(self):
+        self.assertEqual((self.f.size(), self.f.num_hashes()), (19171, 7))
+        with self.assertRaises(ValueError):
+            BloomFilter(100, 1.5)
+        with self.assertRaises(ValueError):
+            BloomFilter(0)
+
+    def test_membership(self):
+        self.assertTrue(all(self.f.contains_many(self.items)))
+        self.assertEqual(self.f.contains_many([]), [])
+        misses = self.f.contains_many([f"other:{i}" for i in range(2000)])
+        self.assertLess(sum(misses), 60) # About 1% expected
+        single = BloomFilter(2000, 0.01)
+        for item in self.items:
+            single.add(item)
+        self.assertEqual(single, self.f) # Batched and single adds hash alike
+        self.assertIn(b"user:7", self.f)
+        self.assertAlmostEqual(self.f.estimate_count(), 2000, delta=100)
+
+    def test_union_intersection(self):
+        a = BloomFilter(2000, 0.01)
+        a.add_many(self.items[:500])
+        b = BloomFilter(2000, 0.01)
+        b.add_many(["x", "y"])
+        u = a | b
+        self.assertTrue(all(u.contains_many(self.items[:500] + ["x", "y"])))
+        self.assertEqual(a & self.f, a)
+        a |= b
+        self.assertEqual(a, u)
+        with self.assertRaises(ValueError):
+            a |= BloomFilter(10)
+
+    def test_serialization(self):
+        data = self.f.to_bytes()
+        self.assertEqual(len(data), 16 + (self.f.size() + 7) // 8)
+        self.assertEqual(BloomFilter.from_bytes(data), self.f)
+        with self.assertRaises(ValueError):
+            BloomFilter.from_bytes(data[:-1])
+        with self.assertRaises(ValueError):
+            CountingBloomFilter.from_bytes(data)
+        for k, m in ((0, 8), (3, 0)):
+            with self.assertRaises(ValueError):
+                BloomFilter.from_bytes(struct.pack('<4sIQ', b'BLM1', k, m) + bytes(1))
+            with self.assertRaises(ValueError):
+                CountingBloomFilter.from_bytes(struct.pack('<4sIQ', b'CBL1', k, m) + bytes(m))
+
+class TestCountingBloomFilter(unittest.TestCase):
+    def test_add_remove(self):
+        c = CountingBloomFilter(1000, 0.01)
+        c.add_many(["a", "b", "b", 1, (1, 2)])
+        self.assertEqual(c.contains_many(["a", "b", 1, (1, 2), "zzz"]), [True, True, True, True, False])
+        c.remove("b")
+        self.assertIn("b", c)
+        c.remove("b")
+        self.assertNotIn("b", c)
+        with self.assertRaises(KeyError):
+            c.remove("b")
+        c.discard("b")
+        self.assertIn("a", c)
+
+    def test_remove_repeated_slot(self):
+        # 'a' hits slots 2,1,2,1 and 'q3' hits slot 2 four times: a false
+        # positive whose counter is too low to remove
+        c = CountingBloomFilter.with_size(3, 4)
+        c.add("a")
+        self.assertIn("q3", c)
+        before = bytes(c._counts)
+        with self.assertRaises(KeyError):
+            c.remove("q3")
+        self.assertEqual(bytes(c._counts), before)
+        c.remove("a")
+        self.assertNotIn("a", c)
+
+    def test_saturation(self):
+        c = CountingBloomFilter.with_size(64, 2)
+        for _ in range(300):
+            c.add("hot")
+        for _ in range(300):
+            c.discard("hot")
+        self.assertIn("hot", c) # Saturated counters never drop back
+
+    def test_combine_and_serialize(self):
+        a = CountingBloomFilter(500, 0.01)
+        a.add_many(range(100))
+        b = CountingBloomFilter(500, 0.01)
+        b.add_many(range(50, 150))
+        u = a | b
+        for x in (0, 75, 149):
+            self.assertIn(x, u)
+        both = a & b
+        self.assertTrue(all(both.contains_many(range(50, 100))))
+        self.assertEqual(CountingBloomFilter.from_bytes(u.to_bytes()), u)
+
+        plain = a.to_bloom()
+        self.assertIsInstance(plain, BloomFilter)
+        self.assertTrue(all(plain.contains_many(range(100))))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import pickle
+import tempfile
+import unittest
+from cppbitset import Bitset, MappedBitset
+
+class TestMappedBitset(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        os.remove(self.path)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_create_and_reopen(self):
+        with MappedBitset(self.path, 1000) as m:
+            self.assertEqual(os.path.getsize(self.path), 128) # Whole 64-bit words
+            self.assertTrue(m.none())
+            m[3] = True
+            m |= Bitset(1000, 1 << 999)
+            self.assertEqual(list(m.iter_set_bits()), [3, 999])
+            self.assertIsInstance(m & m, Bitset)
+            self.assertNotIsInstance(m & m, MappedBitset)
+
+        with MappedBitset(self.path, 1000, readonly=True) as r:
+            self.assertEqual(r.count(), 2)
+            self.assertTrue(r[999])
+            self.assertEqual(r, Bitset(1000, (1 << 999) | (1 << 3)))
+            with self.assertRaises(TypeError):
+                r[0] = True
+            for write in (r.flip, r.set, lambda: r.__ior__(Bitset(1000, 1)),
+                          lambda: r.__ixor__(Bitset(1000, 1)), lambda: r.__ilshift__(1)):
+                with self.assertRaises(TypeError):
+                    write()
+            self.assertEqual(r.count(), 2)
+
+    def test_maps_to_bytes_output(self):
+        b = Bitset(128, (1 << 127) | 0b1011)
+        with open(self.path, 'wb') as f:
+            f.write(b.to_bytes())
+        with MappedBitset(self.path) as m:
+            self.assertEqual(m.size(), 128)
+            self.assertEqual(m, b)
+            m.flip()
+            self.assertEqual(m.count(), 124)
+
+    def test_shared_views_and_pickle(self):
+        with MappedBitset(self.path, 64) as a, MappedBitset(self.path, 64) as b:
+            a.set(5)
+            self.assertTrue(b[5])
+            c = pickle.loads(pickle.dumps(a))
+            self.assertEqual(list(c.iter_set_bits()), [5])
+            c.close()
+
+    def test_readonly_errors(self):
+        with self.assertRaises(FileNotFoundError):
+            MappedBitset(self.path, readonly=True)
+        with open(self.path, 'wb') as f:
+            f.write(b'\x01')
+        with self.assertRaises(ValueError):
+            MappedBitset(self.path, readonly=True) # Not a whole word
+
+if __name__ == '__main__':
+    unittest.main()
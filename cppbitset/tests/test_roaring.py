@@ -0,0 +1,114 @@
+import unittest
+import struct
+from cppbitset import RoaringBitmap
+from cppbitset.roaring import _ArrayContainer, _BitmapContainer, _RunContainer
+
+class TestRoaringBitmap(unittest.TestCase):
+    def setUp(self):
+        # Sparse chunk 0, dense chunk 1, one run in chunk 2, top of the range
+        self.values = set(range(0, 60000, 37))
+        self.values |= set(x for x in range(65536, 131072) if x % 3)
+        self.values |= set(range(140000, 150000))
+        self.values.add(2 ** 32 - 1)
+        self.r = RoaringBitmap(self.values)
+
+    def test_containers_chosen_by_density(self):
+        kinds = [type(c) for c in self.r._containers]
+        self.assertEqual(kinds[:3], [_ArrayContainer, _BitmapContainer, _RunContainer])
+        self.assertEqual(self.r.cardinality(), len(self.values))
+        self.assertEqual(list(self.r), sorted(self.values))
+
+    def test_add_discard(self):
+        r = RoaringBitmap()
+        self.assertTrue(r.empty())
+        for x in range(5000):
+            r.add(x * 2)
+        self.assertIsInstance(r._containers[0], _BitmapContainer)
+        for x in range(1000):
+            r.discard(x * 2)
+        self.assertIsInstance(r._containers[0], _ArrayContainer)
+        self.assertEqual(len(r), 4000)
+        self.assertIn(2000, r)
+        self.assertNotIn(2001, r)
+        self.assertNotIn(-1, r)
+        with self.assertRaises(OverflowError):
+            r.add(2 ** 32)
+
+        r.add_range(10, 70000)
+        self.assertEqual(r.min(), 10)
+        self.assertEqual(r.max(), 69999)
+        self.assertEqual(len(r), 69990) # The remaining evens all fall inside the range
+        r.discard(100)
+        self.assertNotIn(100, r)
+
+    def test_set_operations(self):
+        other_values = set(range(0, 200000, 5))
+        other = RoaringBitmap(other_values)
+        self.assertEqual(list(self.r & other), sorted(self.values & other_values))
+        self.assertEqual(list(self.r | other), sorted(self.values | other_values))
+        self.assertEqual(list(self.r - other), sorted(self.values - other_values))
+        self.assertEqual(list(self.r ^ other), sorted(self.values ^ other_values))
+
+        r = RoaringBitmap(self.values)
+        r -= other
+        self.assertEqual(r, self.r - other)
+        self.assertNotEqual(r, self.r)
+
+    def test_rank_select(self):
+        ordered = sorted(self.values)
+        for i in (0, 1, 1500, 1621, 1622, 40000, len(ordered) - 1):
+            self.assertEqual(self.r.select(i), ordered[i])
+            self.assertEqual(self.r.rank(ordered[i]), i + 1)
+            self.assertEqual(self.r.rank(ordered[i] - 1), i)
+        self.assertEqual(self.r.rank(-5), 0)
+        with self.assertRaises(IndexError):
+            self.r.select(len(ordered))
+
+    def test_portable_serialization(self):
+        data = self.r.serialize()
+        cookie, = struct.unpack_from('<I', data)
+        self.assertEqual(cookie & 0xFFFF, 12347)  # Has run containers
+        self.assertEqual((cookie >> 16) + 1, 4)
+        self.assertEqual(RoaringBitmap.deserialize(data), self.r)
+
+        plain = RoaringBitmap([1, 2, 1000, 70000])
+        data = plain.serialize()
+        # No-run layout: cookie, count, (key, card - 1) pairs, offsets, arrays
+        self.assertEqual(data[:8], struct.pack('<II', 12346, 2))
+        self.assertEqual(data[8:16], struct.pack('<4H', 0, 2, 1, 0))
+        self.assertEqual(data[16:24], struct.pack('<2I', 24, 30))
+        self.assertEqual(data[24:], struct.pack('<4H', 1, 2, 1000, 70000 - 65536))
+        self.assertEqual(RoaringBitmap.deserialize(data), plain)
+
+        self.assertEqual(RoaringBitmap.deserialize(RoaringBitmap().serialize()), RoaringBitmap())
+        with self.assertRaises(ValueError):
+            RoaringBitmap.deserialize(b'\x00' * 8)
+        with self.assertRaises(ValueError):
+            RoaringBitmap.deserialize(data[:-2])
+
+    def test_results_do_not_share_containers(self):
+        a = RoaringBitmap([1])
+        b = RoaringBitmap([1 << 20])
+        c = a | b
+        c.add(2)
+        c.add((1 << 20) + 1)
+        self.assertEqual(a.tolist(), [1])
+        self.assertEqual(b.tolist(), [1 << 20])
+
+        dense = RoaringBitmap(range(0, 20000, 2)) # Bitmap container
+        d = dense - RoaringBitmap([1 << 20])
+        d.add(1)
+        d.discard(0)
+        self.assertIn(0, dense)
+        self.assertNotIn(1, dense)
+
+        a |= b
+        a.discard(1 << 20)
+        self.assertEqual(b.tolist(), [1 << 20])
+        r = RoaringBitmap()
+        r.update(b)
+        r.add((1 << 20) + 5)
+        self.assertEqual(b.tolist(), [1 << 20])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,7 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     install_requires=["cppbase"],
+    extras_require={"numpy": ["numpy"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -1,3 +1,3 @@
-from .flat_map import FlatMap
+from .flat_map import FlatMap, FlatMapKeysView, FlatMapValuesView, FlatMapItemsView
 
-__all__ = ['FlatMap']
+__all__ = ['FlatMap', 'FlatMapKeysView', 'FlatMapValuesView', 'FlatMapItemsView']
@@ -1,7 +1,28 @@
-from typing import TypeVar, Generic, Tuple, Iterator, Any, List, Optional
+from typing import TypeVar, Generic, Tuple, Iterator, Any, List, Optional, Iterable, Dict
+from collections.abc import Sequence as _SequenceABC
 from cppbase import Associative
+from cppbase.buffer import check_dtype
+from cppbase.search import lower_bound_many as _lower_bound_many
+from operator import itemgetter
+from array import array
 import bisect
 
+try: # Optional: vectorised merge and batched search for typed storage
+    import numpy as _np
+except ImportError: # pragma: no cover
+    _np = None
+
+
+def _exact_probes(keys: List[Any], dtype: str) -> Optional[Any]:
+    """keys as a NumPy array of dtype, or None unless every key converts unchanged
+    (2.5 against 'q', or ints beyond its range, must be searched as themselves)."""
+    try:
+        probes = _np.asarray(keys, dtype=dtype)
+    except (OverflowError, TypeError, ValueError):
+        return None
+    return probes if probes.tolist() == keys else None
+
+
 K = TypeVar('K')
 V = TypeVar('V')
 
@@ -15,19 +36,41 @@ class FlatMap(Associative, Generic[K, V]):
     
     Search is O(log N).
     Insertion/Erasure is O(N).
+
+    Write-optimised mode (buffered=True): new keys are staged in a small hash
+    buffer instead of being inserted into the sorted arrays one at a time.
+    The buffer is merged in a single pass once it grows past
+    max(_MIN_BUFFER, size of the sorted arrays), or on the first ordered read
+    (iteration, bounds, keys/values/items). Point lookups check both, so bulk
+    loading unsorted keys costs O(N log N) instead of O(N^2). Unhashable keys
+    skip the buffer and are inserted directly.
+
+    Typed columns (key_dtype / value_dtype = an array typecode such as 'q' or
+    'd'): the column is an `array.array` instead of a list of boxed objects,
+    about 8 bytes per entry. With NumPy installed, merges and batched
+    searches on typed keys run vectorised.
     """
-    __slots__ = ('_keys', '_values')
+    __slots__ = ('_keys', '_values', '_pending', '_buffered', '_key_dtype', '_value_dtype')
 
-    def __init__(self, items: Optional[Any] = None):
+    _MIN_BUFFER = 256
+
+    def __init__(self, items: Optional[Any] = None, buffered: bool = False,
+                 key_dtype: Optional[str] = None, value_dtype: Optional[str] = None):
         """
         Construct a FlatMap.
         
         Args:
             items: Optional list of (key, value) tuples or mapping to initialize with.
                    Note: Bulk initialization sorts the data once (O(N log N)).
+            buffered: Enable the write-optimised staging buffer for new keys.
+            key_dtype / value_dtype: array typecode for typed column storage.
         """
-        self._keys: List[K] = []
-        self._values: List[V] = []
+        self._key_dtype = check_dtype(key_dtype)
+        self._value_dtype = check_dtype(value_dtype)
+        self._keys: List[K] = self._new_column(key_dtype)
+        self._values: List[V] = self._new_column(value_dtype)
+        self._pending: Dict[K, V] = {} # Staged new keys (never present in _keys)
+        self._buffered = buffered
         
         if items:
             if isinstance(items, dict):
@@ -51,17 +94,28 @@ class FlatMap(Associative, Generic[K, V]):
 
     # --------------------- Capacity ---------------------
     def empty(self) -> bool:
-        return len(self._keys) == 0
+        return len(self._keys) == 0 and not self._pending
 
     def size(self) -> int:
-        return len(self._keys)
+        return len(self._keys) + len(self._pending)
+
+    def __len__(self) -> int:
+        return self.size()
 
     def max_size(self) -> int:
         return 9223372036854775807
 
+    def key_dtype(self) -> Optional[str]:
+        return self._key_dtype
+
+    def value_dtype(self) -> Optional[str]:
+        return self._value_dtype
+
     # --------------------- Element Access ---------------------
     def at(self, key: K) -> V:
         """Returns the value associated with the key. Raises KeyError if not found."""
+        if self._pending and self._is_pending(key):
+            return self._pending[key]
         idx = bisect.bisect_left(self._keys, key)
         if idx < len(self._keys) and self._keys[idx] == key:
             return self._values[idx]
@@ -76,15 +130,11 @@ class FlatMap(Associative, Generic[K, V]):
 
     def __setitem__(self, key: K, value: V):
         """Insert or assign (operator[] in C++)."""
-        idx = bisect.bisect_left(self._keys, key)
-        if idx < len(self._keys) and self._keys[idx] == key:
-            self._values[idx] = value
-        else:
-            self._keys.insert(idx, key)
-            self._values.insert(idx, value)
+        self.insert_or_assign(key, value)
 
     # --------------------- Iteration ---------------------
     def begin(self) -> Iterator[K]: # Iterating C++ map yields pairs usually, but Python dict yields keys
+        self._flush_if_pending()
         return iter(self._keys)
 
     def end(self):
@@ -93,17 +143,36 @@ class FlatMap(Associative, Generic[K, V]):
 
     def __iter__(self) -> Iterator[K]:
         # Pythonic: iterate keys
+        self._flush_if_pending()
         return iter(self._keys)
 
-    def items(self) -> Iterator[Tuple[K, V]]:
-        # Helper for key-value iteration
-        return zip(self._keys, self._values)
+    # Views read the columns in place and are read-only. Like iterators,
+    # a sliced (or irange) view addresses index positions, so it no longer
+    # tracks the same keys once the map is modified; whole-map views do.
+    def items(self) -> 'FlatMapItemsView[K, V]':
+        return FlatMapItemsView(self)
+
+    def keys(self) -> 'FlatMapKeysView[K]':
+        return FlatMapKeysView(self)
 
-    def keys(self) -> List[K]:
-        return self._keys # Return direct reference or copy? List view.
+    def values(self) -> 'FlatMapValuesView[V]':
+        return FlatMapValuesView(self)
 
-    def values(self) -> List[V]:
-        return self._values
+    def irange(self, lo: Optional[K] = None, hi: Optional[K] = None,
+               inclusive: Tuple[bool, bool] = (True, False)) -> 'FlatMapItemsView[K, V]':
+        """
+        Items with lo <= key < hi (bounds per `inclusive`; None = unbounded)
+        as a view, found with two binary searches: O(log N), no copy.
+        """
+        self._flush_if_pending()
+        keys = self._keys
+        start = 0
+        stop = len(keys)
+        if lo is not None:
+            start = (bisect.bisect_left if inclusive[0] else bisect.bisect_right)(keys, lo)
+        if hi is not None:
+            stop = (bisect.bisect_right if inclusive[1] else bisect.bisect_left)(keys, hi)
+        return FlatMapItemsView(self, start, max(start, stop))
 
     # --------------------- Modifiers ---------------------
     def insert(self, key: K, value: V) -> bool:
@@ -111,11 +180,12 @@ class FlatMap(Associative, Generic[K, V]):
         Inserts value if key not present.
         Returns True if inserted, False if key already existed.
         """
+        if self._pending and self._is_pending(key):
+            return False
         idx = bisect.bisect_left(self._keys, key)
         if idx < len(self._keys) and self._keys[idx] == key:
             return False
-        self._keys.insert(idx, key)
-        self._values.insert(idx, value)
+        self._insert_new(idx, key, value)
         return True
 
     def insert_or_assign(self, key: K, value: V) -> bool:
@@ -123,16 +193,64 @@ class FlatMap(Associative, Generic[K, V]):
         Inserts or updates value.
         Returns True if inserted (new), False if assigned (updated).
         """
+        if self._pending and self._is_pending(key):
+            self._pending[key] = value
+            return False
         idx = bisect.bisect_left(self._keys, key)
         if idx < len(self._keys) and self._keys[idx] == key:
             self._values[idx] = value
             return False
-        self._keys.insert(idx, key)
-        self._values.insert(idx, value)
+        self._insert_new(idx, key, value)
         return True
 
+    def insert_range(self, items: Iterable[Tuple[K, V]], sorted_unique: bool = False):
+        """
+        Inserts many (key, value) pairs with one sort and one merge pass
+        (C++23 flat_map::insert(sorted_unique, first, last)).
+        Keys already in the map are not overwritten; among duplicate keys in
+        `items` the first one wins. With sorted_unique=True the caller
+        guarantees `items` is sorted by key with no duplicates, and the sort
+        is skipped.
+        """
+        if isinstance(items, dict):
+            items = items.items()
+        if sorted_unique:
+            pairs = list(items)
+        else:
+            pairs = []
+            for k, v in sorted(items, key=itemgetter(0)): # Stable: first duplicate wins
+                if pairs and pairs[-1][0] == k:
+                    continue
+                pairs.append((k, v))
+        if self._key_dtype:
+            array(self._key_dtype, [k for k, _ in pairs]) # Validate, as _insert_new does
+        self._flush_if_pending()
+        keys = self._keys
+        n = len(keys)
+        positions = self._search_many([k for k, _ in pairs])
+        new_keys: List[K] = []
+        new_values: List[V] = []
+        for (k, v), idx in zip(pairs, positions):
+            if idx < n and keys[idx] == k:
+                continue
+            new_keys.append(k)
+            new_values.append(v)
+        self._merge_sorted(new_keys, new_values)
+
+    def flush(self):
+        """Merges the write buffer into the sorted arrays (no-op when empty)."""
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = {}
+        new_keys = sorted(pending)
+        self._merge_sorted(new_keys, [pending[k] for k in new_keys])
+
     def erase(self, key: K) -> int:
         """Removes the element with the given key. Returns 1 if removed, 0 if not found."""
+        if self._pending and self._is_pending(key):
+            del self._pending[key]
+            return 1
         idx = bisect.bisect_left(self._keys, key)
         if idx < len(self._keys) and self._keys[idx] == key:
             del self._keys[idx]
@@ -143,44 +261,323 @@ class FlatMap(Associative, Generic[K, V]):
     def swap(self, other: 'FlatMap[K, V]'):
         self._keys, other._keys = other._keys, self._keys
         self._values, other._values = other._values, self._values
+        self._pending, other._pending = other._pending, self._pending
+        self._buffered, other._buffered = other._buffered, self._buffered
+        self._key_dtype, other._key_dtype = other._key_dtype, self._key_dtype
+        self._value_dtype, other._value_dtype = other._value_dtype, self._value_dtype
 
     def clear(self):
-        self._keys.clear()
-        self._values.clear()
+        self._keys = self._new_column(self._key_dtype)
+        self._values = self._new_column(self._value_dtype)
+        self._pending.clear()
 
     # --------------------- Lookup ---------------------
     def count(self, key: K) -> int:
+        if self._pending and self._is_pending(key):
+            return 1
         idx = bisect.bisect_left(self._keys, key)
         if idx < len(self._keys) and self._keys[idx] == key:
             return 1
         return 0
 
-    def find(self, key: K) -> Iterator[Tuple[K, V]]:
-        """Returns iterator to element if found, else None/End (simulated)."""
+    def find(self, key: K) -> 'FlatMapItemsView[K, V]':
+        """
+        Items view holding just the matching element, or an empty (falsy)
+        view when the key is absent (the `end()` of C++).
+        """
+        if self._pending and self._is_pending(key):
+            self.flush()
         idx = bisect.bisect_left(self._keys, key)
         if idx < len(self._keys) and self._keys[idx] == key:
-            # Yield single item
-            yield (self._keys[idx], self._values[idx])
-        # Else empty iterator
+            return FlatMapItemsView(self, idx, idx + 1)
+        return FlatMapItemsView(self, idx, idx)
 
     def contains(self, key: K) -> bool:
         return self.count(key) > 0
 
+    # --------------------- Batched Lookup ---------------------
+    # Batches are expected in ascending key order: each search then resumes
+    # from the previous answer (galloping or a merge walk, picked by batch
+    # size vs map size). Typed keys use NumPy searchsorted when available.
+    # Unsorted batches still give correct answers, just without the speedup.
+    def lower_bound_many(self, keys: Iterable[K]) -> array:
+        """lower_bound() of every key, as an array('q') of indices."""
+        self._flush_if_pending()
+        return array('q', self._search_many(list(keys)))
+
+    def contains_many(self, keys: Iterable[K]) -> List[bool]:
+        self._flush_if_pending()
+        keys = list(keys)
+        column = self._keys
+        n = len(column)
+        return [i < n and column[i] == k for k, i in zip(keys, self._search_many(keys))]
+
+    def get_many(self, keys: Iterable[K], default: Any = None) -> List[V]:
+        """Value for every key (`default` where missing)."""
+        self._flush_if_pending()
+        keys = list(keys)
+        column, values = self._keys, self._values
+        n = len(column)
+        return [values[i] if i < n and column[i] == k else default
+                for k, i in zip(keys, self._search_many(keys))]
+
     def lower_bound(self, key: K) -> int:
         """Returns index of first element >= key."""
+        self._flush_if_pending()
         return bisect.bisect_left(self._keys, key)
 
     def upper_bound(self, key: K) -> int:
         """Returns index of first element > key."""
+        self._flush_if_pending()
         return bisect.bisect_right(self._keys, key)
     
     # --------------------- Comparison ---------------------
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, FlatMap):
             return NotImplemented
+        self._flush_if_pending()
+        other._flush_if_pending()
+        if type(self._keys) is not type(other._keys) or type(self._values) is not type(other._values):
+            return list(self._keys) == list(other._keys) and list(self._values) == list(other._values)
         return self._keys == other._keys and self._values == other._values
 
     def __repr__(self) -> str:
         # dict-like repr
+        self._flush_if_pending()
         kvs = [f"{repr(k)}: {repr(v)}" for k, v in zip(self._keys, self._values)]
         return f"FlatMap({{{', '.join(kvs)}}})"
+
+    # --------------------- Internal ---------------------
+    def _insert_new(self, idx: int, key: K, value: V):
+        # `idx` is the bisect position of a key known to be absent
+        if self._buffered:
+            if self._key_dtype:
+                array(self._key_dtype, (key,)) # Validate now, not at flush time
+            if self._value_dtype:
+                array(self._value_dtype, (value,))
+            try:
+                self._pending[key] = value
+            except TypeError: # Unhashable key: insert directly
+                pass
+            else:
+                if len(self._pending) >= max(self._MIN_BUFFER, len(self._keys)):
+                    self.flush()
+                return
+        self._keys.insert(idx, key)
+        self._values.insert(idx, value)
+
+    def _flush_if_pending(self):
+        if self._pending:
+            self.flush()
+
+    def _is_pending(self, key: K) -> bool:
+        try:
+            return key in self._pending
+        except TypeError: # Unhashable keys bypass the buffer (see _insert_new)
+            return False
+
+    @staticmethod
+    def _new_column(dtype: Optional[str], data: Iterable = ()) -> Any:
+        return array(dtype, data) if dtype else list(data)
+
+    def _search_many(self, keys: List[K]) -> List[int]:
+        """bisect_left position of each key (NumPy searchsorted for typed keys)."""
+        if _np is not None and self._key_dtype and keys:
+            column = _np.frombuffer(self._keys, dtype=self._key_dtype) if self._keys \
+                else _np.empty(0, dtype=self._key_dtype)
+            probes = _exact_probes(keys, self._key_dtype)
+            if probes is not None:
+                return _np.searchsorted(column, probes).tolist()
+        return _lower_bound_many(self._keys, keys)
+
+    def _merge_sorted(self, new_keys: List[K], new_values: List[V]):
+        """Merges sorted keys (all absent from the map) into the arrays in O(N + M)."""
+        if not new_keys:
+            return
+        keys, values = self._keys, self._values
+        if not keys or keys[-1] < new_keys[0]:
+            # Pure append (e.g. ascending bulk load)
+            keys.extend(new_keys)
+            values.extend(new_values)
+            return
+        if _np is not None and self._key_dtype:
+            # array() type-checks the new entries; a NumPy cast would coerce them
+            all_keys = _np.concatenate([_np.frombuffer(keys, dtype=self._key_dtype),
+                                        _np.frombuffer(array(self._key_dtype, new_keys),
+                                                       dtype=self._key_dtype)])
+            order = _np.argsort(all_keys, kind='stable')
+            self._keys = array(self._key_dtype, all_keys[order].tobytes())
+            if self._value_dtype:
+                all_values = _np.concatenate([_np.frombuffer(values, dtype=self._value_dtype),
+                                              _np.frombuffer(array(self._value_dtype, new_values),
+                                                             dtype=self._value_dtype)])
+                self._values = array(self._value_dtype, all_values[order].tobytes())
+            else:
+                all_values = values + list(new_values)
+                self._values = [all_values[i] for i in order.tolist()]
+            return
+        # Timsort recognises the two sorted runs and merges them in a single
+        # linear pass; sorting positions lets the values follow their keys.
+        all_keys = list(keys) + list(new_keys)
+        all_values = list(values) + list(new_values)
+        order = sorted(range(len(all_keys)), key=all_keys.__getitem__)
+        self._keys = self._new_column(self._key_dtype, [all_keys[i] for i in order])
+        self._values = self._new_column(self._value_dtype, [all_values[i] for i in order])
+
+
+class _FlatMapView(_SequenceABC):
+    """
+    Read-only Sequence over the index range [start, stop) of a FlatMap's
+    sorted columns. stop=None means "to the end", so a whole-map view stays
+    current as the map changes. Slicing with step 1 returns another view.
+    Concrete views define _get(i) and _iter(start, stop).
+    """
+    __slots__ = ('_map', '_start', '_stop')
+
+    def __init__(self, fmap: FlatMap, start: int = 0, stop: Optional[int] = None):
+        self._map = fmap
+        self._start = start
+        self._stop = stop
+
+    def _bounds(self) -> Tuple[int, int]:
+        fmap = self._map
+        fmap._flush_if_pending()
+        n = len(fmap._keys)
+        stop = n if self._stop is None else min(self._stop, n)
+        return min(self._start, stop), stop
+
+    def __len__(self) -> int:
+        start, stop = self._bounds()
+        return stop - start
+
+    def __getitem__(self, index):
+        start, stop = self._bounds()
+        n = stop - start
+        if isinstance(index, slice):
+            lo, hi, step = index.indices(n)
+            if step == 1:
+                return type(self)(self._map, start + lo, start + max(lo, hi))
+            return [self._get(start + i) for i in range(lo, hi, step)]
+        if index < 0:
+            index += n
+        if not (0 <= index < n):
+            raise IndexError("FlatMap view index out of range")
+        return self._get(start + index)
+
+    def __iter__(self) -> Iterator[Any]:
+        start, stop = self._bounds()
+        return self._iter(start, stop)
+
+    def __reversed__(self) -> Iterator[Any]:
+        start, stop = self._bounds()
+        return map(self._get, range(stop - 1, start - 1, -1))
+
+    def __eq__(self, other):
+        if isinstance(other, (_FlatMapView, list, tuple, array)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class _ColumnView(_FlatMapView):
+    # Views over a single column, returned by the subclass's _column()
+    __slots__ = ()
+
+    def _get(self, i: int) -> Any:
+        return self._column()[i]
+
+    def _iter(self, start: int, stop: int) -> Iterator[Any]:
+        column = self._column()
+        if start == 0 and stop == len(column):
+            return iter(column)
+        return map(column.__getitem__, range(start, stop))
+
+    def memoryview(self) -> memoryview:
+        """
+        Zero-copy buffer over the range of a typed column. The map cannot
+        grow or shrink while the buffer is alive; release it first.
+        """
+        column = self._column()
+        if not isinstance(column, array):
+            raise TypeError("memoryview requires a typed column (key_dtype / value_dtype)")
+        start, stop = self._bounds()
+        return memoryview(column)[start:stop]
+
+
+class FlatMapKeysView(_ColumnView, Generic[K]):
+    """Sorted keys of a FlatMap; membership and index() are binary searches."""
+    __slots__ = ()
+
+    def _column(self) -> Any:
+        return self._map._keys
+
+    def _find(self, key: K) -> int:
+        start, stop = self._bounds()
+        keys = self._map._keys
+        i = bisect.bisect_left(keys, key, start, stop)
+        return i - start if i < stop and keys[i] == key else -1
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            return self._find(key) >= 0
+        except TypeError: # Not comparable with the keys
+            return False
+
+    def index(self, key: K, start: int = 0, stop: Optional[int] = None) -> int:
+        i = self._find(key)
+        if i < 0 or i < start or (stop is not None and i >= stop):
+            raise ValueError(f"{key!r} is not in view")
+        return i
+
+    def count(self, key: K) -> int:
+        return 1 if key in self else 0
+
+
+class FlatMapValuesView(_ColumnView, Generic[V]):
+    """Values of a FlatMap, in key order."""
+    __slots__ = ()
+
+    def _column(self) -> Any:
+        return self._map._values
+
+
+class FlatMapItemsView(_FlatMapView, Generic[K, V]):
+    """(key, value) pairs of a FlatMap, in key order."""
+    __slots__ = ()
+
+    def _get(self, i: int) -> Tuple[K, V]:
+        fmap = self._map
+        return (fmap._keys[i], fmap._values[i])
+
+    def _iter(self, start: int, stop: int) -> Iterator[Tuple[K, V]]:
+        fmap = self._map
+        keys, values = fmap._keys, fmap._values
+        if start == 0 and stop == len(keys):
+            return zip(keys, values)
+        return zip(map(keys.__getitem__, range(start, stop)),
+                   map(values.__getitem__, range(start, stop)))
+
+    def __contains__(self, item: object) -> bool:
+        try:
+            key, value = item
+        except (TypeError, ValueError):
+            return False
+        try:
+            i = self.keys()._find(key)
+        except TypeError:
+            return False
+        return i >= 0 and self[i][1] == value
+
+    def keys(self) -> FlatMapKeysView[K]:
+        return FlatMapKeysView(self._map, self._start, self._stop)
+
+    def values(self) -> FlatMapValuesView[V]:
+        return FlatMapValuesView(self._map, self._start, self._stop)
@@ -78,5 +78,139 @@ class TestFlatMap(unittest.TestCase):
         self.assertFalse(is_new)
         self.assertEqual(m[1], "ONE")
 
+    def test_buffered_writes(self):
+        m = FlatMap({5: 'e'}, buffered=True)
+        for k in [3, 9, 1, 7]:
+            m[k] = str(k)
+        self.assertEqual(m.size(), 5)
+        self.assertEqual(m[9], '9')       # Served from the write buffer
+        self.assertTrue(m.contains(1))
+        self.assertFalse(m.insert(3, 'x'))
+        m[3] = 'three'
+        self.assertEqual(m.erase(7), 1)
+
+        # First ordered read merges the buffer
+        self.assertEqual(list(m.items()), [(1, '1'), (3, 'three'), (5, 'e'), (9, '9')])
+        self.assertEqual(m.lower_bound(4), 2)
+
+    def test_buffered_unhashable_keys(self):
+        # Orderable but unhashable keys skip the write buffer
+        m = FlatMap(buffered=True)
+        m[(3, 'c')] = 3            # Staged
+        m[(2, [0])] = 2            # Unhashable: inserted directly
+        self.assertEqual(m[(2, [0])], 2)
+        self.assertTrue(m.contains((2, [0])))
+        self.assertFalse(m.insert((2, [0]), 9))
+        m[(1, [1])] = 1
+        self.assertEqual(m.erase((1, [1])), 1)
+        self.assertEqual(list(m.keys()), [(2, [0]), (3, 'c')])
+
+    def test_buffered_bulk_load(self):
+        import random
+        keys = list(range(2000))
+        random.shuffle(keys)
+        m = FlatMap(buffered=True)
+        for k in keys:
+            m[k] = k * 2
+        self.assertEqual(len(m), 2000)
+        self.assertEqual(list(m), list(range(2000)))
+        self.assertEqual(m[1234], 2468)
+
+    def test_insert_range(self):
+        m = FlatMap({2: 'b', 4: 'd'})
+        m.insert_range([(5, 'e'), (1, 'a'), (2, 'X'), (1, 'dup')])
+        self.assertEqual(list(m.items()), [(1, 'a'), (2, 'b'), (4, 'd'), (5, 'e')])
+
+        m.insert_range([(6, 'f'), (7, 'g')], sorted_unique=True)
+        self.assertEqual(list(m), [1, 2, 4, 5, 6, 7])
+
+    def test_typed_columns(self):
+        from array import array
+        m = FlatMap([(30, 3.0), (10, 1.0), (20, 2.0)], key_dtype='q', value_dtype='d')
+        with m.keys().memoryview() as buf:
+            self.assertEqual(buf.format, 'q')
+        m[15] = 1.5
+        self.assertEqual(list(m.items()), [(10, 1.0), (15, 1.5), (20, 2.0), (30, 3.0)])
+
+        m.insert_range([(25, 2.5), (5, 0.5), (10, 9.9)])
+        self.assertEqual(list(m), [5, 10, 15, 20, 25, 30])
+        self.assertEqual(m[10], 1.0)
+        self.assertEqual(m, FlatMap({5: 0.5, 10: 1.0, 15: 1.5, 20: 2.0, 25: 2.5, 30: 3.0}))
+
+        with self.assertRaises(TypeError):
+            m['x'] = 1.0
+        with self.assertRaises(ValueError):
+            FlatMap(key_dtype='u')
+
+        b = FlatMap(buffered=True, key_dtype='q')
+        for k in [3, 1, 2]:
+            b[k] = str(k)
+        self.assertEqual(list(b.items()), [(1, '1'), (2, '2'), (3, '3')])
+        self.assertEqual(b.key_dtype(), 'q')
+
+    def test_batched_lookup(self):
+        m = FlatMap({k: k * 10 for k in range(0, 1000, 3)})
+        for batch in ([1, 3, 4, 999, 2000], list(range(0, 1000, 7)), [999, 3, 0]):
+            self.assertEqual(m.get_many(batch), [m[k] if m.contains(k) else None for k in batch])
+            self.assertEqual(m.contains_many(batch), [m.contains(k) for k in batch])
+            self.assertEqual(list(m.lower_bound_many(batch)), [m.lower_bound(k) for k in batch])
+        self.assertEqual(m.get_many([1, 3], default=-1), [-1, 30])
+
+        t = FlatMap({k: float(k) for k in range(0, 100, 2)}, key_dtype='q', value_dtype='d')
+        self.assertEqual(t.get_many([2, 3, 98]), [2.0, None, 98.0])
+
+    def test_views(self):
+        m = FlatMap({k: str(k) for k in range(0, 20, 2)})
+        keys = m.keys()
+        self.assertEqual(len(keys), 10)
+        self.assertEqual(keys[-1], 18)
+        self.assertIn(4, keys)
+        self.assertNotIn(5, keys)
+        self.assertEqual(keys.index(6), 3)
+        with self.assertRaises(TypeError):
+            keys[0] = 99
+        self.assertEqual(list(keys[2:5]), [4, 6, 8])
+        self.assertEqual(keys[::-3], [18, 12, 6, 0])
+        self.assertEqual(list(reversed(m.values()[:3])), ['4', '2', '0'])
+
+        m[1] = '1' # Whole-map views stay current
+        self.assertEqual(keys[:3], [0, 1, 2])
+
+        r = m.irange(4, 10)
+        self.assertEqual(list(r), [(4, '4'), (6, '6'), (8, '8')])
+        self.assertEqual(list(r.keys()), [4, 6, 8])
+        self.assertIn((6, '6'), r)
+        self.assertNotIn((6, 'x'), r)
+        self.assertNotIn(10, r.keys())
+        self.assertEqual(list(m.irange(4, 10, inclusive=(False, True)).keys()), [6, 8, 10])
+        self.assertEqual(list(m.irange(hi=2).values()), ['0', '1'])
+        self.assertEqual(len(m.irange(100)), 0)
+
+        self.assertEqual(list(m.find(6)), [(6, '6')])
+        self.assertEqual(m.find(6)[0], (6, '6'))
+        self.assertFalse(m.find(7))
+
+        with self.assertRaises(TypeError):
+            m.keys().memoryview()
+        t = FlatMap({k: k / 2 for k in range(10)}, key_dtype='q', value_dtype='d')
+        with t.irange(2, 5).values().memoryview() as buf:
+            self.assertEqual(buf.tolist(), [1.0, 1.5, 2.0])
+
+    def test_typed_insert_range_validates_keys(self):
+        m = FlatMap({1: 'a', 5: 'b'}, key_dtype='q')
+        with self.assertRaises(TypeError):
+            m.insert_range([(1.5, 'c')])
+        self.assertEqual(list(m.items()), [(1, 'a'), (5, 'b')])
+        v = FlatMap({1: 1, 5: 2}, key_dtype='q', value_dtype='q')
+        with self.assertRaises(TypeError):
+            v.insert_range([(3, 2.5)])
+
+    def test_batched_lookup_matches_single(self):
+        m = FlatMap({1: 'a', 2: 'b', 3: 'c'}, key_dtype='q')
+        probes = [2.5, 2 ** 70, -2 ** 70, 2]
+        self.assertEqual(list(m.lower_bound_many(probes)), [m.lower_bound(k) for k in probes])
+        self.assertEqual(m.contains_many(probes), [m.contains(k) for k in probes])
+        self.assertEqual(m.get_many([2.0, 2 ** 70]), ['b', None])
+
 if __name__ == '__main__':
     unittest.main()
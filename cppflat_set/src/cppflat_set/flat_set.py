@@ -1,7 +1,28 @@
 from typing import TypeVar, Generic, Iterable, Iterator, Any, List, Optional
 from cppbase import Associative
+from cppbase.buffer import check_dtype
+from cppbase.search import lower_bound_many as _lower_bound_many
+from cppbase.search import (sorted_union, sorted_intersection, sorted_difference,
+                            sorted_symmetric_difference, sorted_includes)
+from array import array
 import bisect
 
+try: # Optional: vectorised sort/unique and set algebra for typed storage
+    import numpy as _np
+except ImportError: # pragma: no cover
+    _np = None
+
+
+def _exact_probes(keys: List[Any], dtype: str) -> Optional[Any]:
+    """keys as a NumPy array of dtype, or None unless every key converts unchanged
+    (2.5 against 'q', or ints beyond its range, must be searched as themselves)."""
+    try:
+        probes = _np.asarray(keys, dtype=dtype)
+    except (OverflowError, TypeError, ValueError):
+        return None
+    return probes if probes.tolist() == keys else None
+
+
 T = TypeVar('T')
 
 class FlatSet(Associative, Generic[T]):
@@ -13,13 +34,28 @@ class FlatSet(Associative, Generic[T]):
     
     Search is O(log N).
     Insertion/Erasure is O(N).
+
+    With dtype set to an array typecode (e.g. 'q'), keys are stored in an
+    `array.array` instead of a list of boxed objects.
+
+    Set algebra (| & - ^ and their in-place forms, issubset...) works on the
+    sorted storage directly: one merge pass, or galloping through the larger
+    set when the sizes are far apart, never a re-sort. Two typed sets with the
+    same dtype use NumPy searchsorted when available and give a typed result;
+    mixing dtypes gives an untyped one.
     """
-    __slots__ = ('_data')
+    __slots__ = ('_data', '_dtype')
 
-    def __init__(self, data: Optional[Iterable[T]] = None):
-        self._data: List[T] = []
+    def __init__(self, data: Optional[Iterable[T]] = None, dtype: Optional[str] = None):
+        self._dtype = check_dtype(dtype)
+        self._data: List[T] = array(dtype) if dtype else []
         
-        if data:
+        if data and dtype and _np is not None:
+            # Vectorised sort + unique straight into the typed buffer. array()
+            # validates the values first, as the pure path's append does.
+            typed = _np.frombuffer(array(dtype, data), dtype=dtype)
+            self._data = array(dtype, _np.unique(typed).tobytes())
+        elif data:
             # Sort and deduplicate
             # Sort O(N log N)
             sorted_data = sorted(data)
@@ -41,6 +77,9 @@ class FlatSet(Associative, Generic[T]):
     def max_size(self) -> int:
         return 9223372036854775807
 
+    def dtype(self) -> Optional[str]:
+        return self._dtype
+
     # --------------------- Iteration ---------------------
     def __iter__(self) -> Iterator[T]:
         return iter(self._data)
@@ -72,10 +111,11 @@ class FlatSet(Associative, Generic[T]):
         return 0
 
     def clear(self):
-        self._data.clear()
+        self._data = array(self._dtype) if self._dtype else []
 
     def swap(self, other: 'FlatSet[T]'):
         self._data, other._data = other._data, self._data
+        self._dtype, other._dtype = other._dtype, self._dtype
 
     # --------------------- Lookup ---------------------
     def count(self, value: T) -> int:
@@ -92,12 +132,106 @@ class FlatSet(Associative, Generic[T]):
     def contains(self, value: T) -> bool:
         return self.count(value) > 0
 
+    # --------------------- Batched Lookup ---------------------
+    # Batches are expected in ascending order: each search resumes from the
+    # previous answer (galloping or a merge walk, picked by batch size vs
+    # set size). Typed sets use NumPy searchsorted when available.
+    def lower_bound_many(self, values: Iterable[T]) -> array:
+        """lower_bound() of every value, as an array('q') of indices."""
+        return array('q', self._search_many(list(values)))
+
+    def contains_many(self, values: Iterable[T]) -> List[bool]:
+        values = list(values)
+        data = self._data
+        n = len(data)
+        return [i < n and data[i] == v for v, i in zip(values, self._search_many(values))]
+
+    def _search_many(self, values: List[T]) -> List[int]:
+        if _np is not None and self._dtype and values:
+            column = _np.frombuffer(self._data, dtype=self._dtype) if self._data \
+                else _np.empty(0, dtype=self._dtype)
+            probes = _exact_probes(values, self._dtype)
+            if probes is not None:
+                return _np.searchsorted(column, probes).tolist()
+        return _lower_bound_many(self._data, values)
+
     def lower_bound(self, value: T) -> int:
         return bisect.bisect_left(self._data, value)
 
     def upper_bound(self, value: T) -> int:
         return bisect.bisect_right(self._data, value)
 
+    # --------------------- Set Algebra ---------------------
+    def __or__(self, other: 'FlatSet[T]') -> 'FlatSet[T]':
+        return self._combine(other, _np_union, sorted_union)
+
+    def __and__(self, other: 'FlatSet[T]') -> 'FlatSet[T]':
+        return self._combine(other, _np_intersection, sorted_intersection)
+
+    def __sub__(self, other: 'FlatSet[T]') -> 'FlatSet[T]':
+        return self._combine(other, _np_difference, sorted_difference)
+
+    def __xor__(self, other: 'FlatSet[T]') -> 'FlatSet[T]':
+        return self._combine(other, _np_symmetric_difference, sorted_symmetric_difference)
+
+    def __ior__(self, other: 'FlatSet[T]') -> 'FlatSet[T]':
+        return self._assign(self | other)
+
+    def __iand__(self, other: 'FlatSet[T]') -> 'FlatSet[T]':
+        return self._assign(self & other)
+
+    def __isub__(self, other: 'FlatSet[T]') -> 'FlatSet[T]':
+        return self._assign(self - other)
+
+    def __ixor__(self, other: 'FlatSet[T]') -> 'FlatSet[T]':
+        return self._assign(self ^ other)
+
+    def issubset(self, other: 'FlatSet[T]') -> bool:
+        if self._same_numpy_dtype(other):
+            return bool(_np_member(self._as_numpy(), other._as_numpy()).all())
+        return sorted_includes(other._data, self._data)
+
+    def issuperset(self, other: 'FlatSet[T]') -> bool:
+        return other.issubset(self)
+
+    def isdisjoint(self, other: 'FlatSet[T]') -> bool:
+        if self._same_numpy_dtype(other):
+            return not _np_member(self._as_numpy(), other._as_numpy()).any()
+        return not sorted_intersection(self._data, other._data)
+
+    def _combine(self, other: 'FlatSet[T]', np_op, py_op) -> 'FlatSet[T]':
+        if not isinstance(other, FlatSet):
+            return NotImplemented
+        # Typed only when both sides share the dtype: a mixed result can hold
+        # values (floats, wider ints) that self's dtype cannot store
+        dtype = self._dtype if self._dtype == other._dtype else None
+        if self._same_numpy_dtype(other):
+            data = array(dtype, np_op(self._as_numpy(), other._as_numpy()).tobytes())
+        else:
+            data = py_op(self._data, other._data)
+            if dtype:
+                data = array(dtype, data)
+        # Already sorted and unique: bypass the constructor's sort
+        result = FlatSet.__new__(type(self))
+        result._dtype = dtype
+        result._data = data
+        return result
+
+    def _assign(self, result: 'FlatSet[T]') -> 'FlatSet[T]':
+        if result is NotImplemented:
+            return NotImplemented
+        self._dtype = result._dtype
+        self._data = result._data
+        return self
+
+    def _same_numpy_dtype(self, other: 'FlatSet[T]') -> bool:
+        return _np is not None and self._dtype is not None and self._dtype == other._dtype
+
+    def _as_numpy(self):
+        if not self._data:
+            return _np.empty(0, dtype=self._dtype)
+        return _np.frombuffer(self._data, dtype=self._dtype)
+
     # --------------------- Operations ---------------------
     def __repr__(self) -> str:
         return f"FlatSet([{', '.join(map(str, self._data))}])"
@@ -105,4 +239,46 @@ class FlatSet(Associative, Generic[T]):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, FlatSet):
             return NotImplemented
+        if type(self._data) is not type(other._data):
+            return list(self._data) == list(other._data)
         return self._data == other._data
+
+
+
+# Vectorised set algebra over sorted unique NumPy arrays: membership is a
+# searchsorted of one side into the other, and a union inserts the missing
+# values at their searchsorted positions, so nothing is re-sorted.
+def _np_member(values, column):
+    """Boolean mask: values[i] is in the sorted array column."""
+    if not len(column):
+        return _np.zeros(len(values), dtype=bool)
+    idx = _np.searchsorted(column, values)
+    _np.minimum(idx, len(column) - 1, out=idx)
+    return column[idx] == values
+
+
+def _np_merge(a, b):
+    """Merges sorted arrays with no common values."""
+    if len(a) < len(b):
+        a, b = b, a
+    return _np.insert(a, _np.searchsorted(a, b), b)
+
+
+def _np_union(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    return _np_merge(a, b[~_np_member(b, a)])
+
+
+def _np_intersection(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    return b[_np_member(b, a)]
+
+
+def _np_difference(a, b):
+    return a[~_np_member(a, b)]
+
+
+def _np_symmetric_difference(a, b):
+    return _np_merge(a[~_np_member(a, b)], b[~_np_member(b, a)])
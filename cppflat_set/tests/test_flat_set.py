@@ -36,6 +36,93 @@ class TestFlatSet(unittest.TestCase):
         s = FlatSet([10, 20, 30])
         self.assertEqual(s.lower_bound(15), 1) # index of 20
         self.assertEqual(s.upper_bound(20), 2) # index of 30
-        
+
+    def test_typed_storage(self):
+        from array import array
+        s = FlatSet([5, 1, 3, 1, 5], dtype='q')
+        self.assertIsInstance(s._data, array)
+        self.assertEqual(list(s), [1, 3, 5])
+        s.insert(2)
+        s.erase(5)
+        self.assertEqual(list(s), [1, 2, 3])
+        self.assertEqual(s, FlatSet([1, 2, 3]))
+        self.assertEqual(s.dtype(), 'q')
+
+        with self.assertRaises(TypeError):
+            s.insert(1.5)
+        s.clear()
+        self.assertTrue(s.empty())
+
+    def test_batched_lookup(self):
+        for dtype in (None, 'q'):
+            s = FlatSet(range(0, 10000, 5), dtype=dtype)
+            batch = [0, 4, 5, 6000, 9995, 10000]
+            self.assertEqual(s.contains_many(batch), [True, False, True, True, True, False])
+            self.assertEqual(list(s.lower_bound_many(batch)), [s.lower_bound(v) for v in batch])
+
+    def test_set_algebra(self):
+        import random
+        rng = random.Random(7)
+        for dtype in (None, 'q'):
+            # Similar sizes (merge walk) and very different sizes (galloping)
+            for na, nb in ((300, 250), (2000, 5), (3, 1500), (0, 40)):
+                a = set(rng.sample(range(4000), na))
+                b = set(rng.sample(range(4000), nb))
+                fa, fb = FlatSet(a, dtype=dtype), FlatSet(b, dtype=dtype)
+                self.assertEqual(list(fa | fb), sorted(a | b))
+                self.assertEqual(list(fa & fb), sorted(a & b))
+                self.assertEqual(list(fa - fb), sorted(a - b))
+                self.assertEqual(list(fb - fa), sorted(b - a))
+                self.assertEqual(list(fa ^ fb), sorted(a ^ b))
+                self.assertEqual(fa.issubset(fb), a <= b)
+                self.assertEqual(fa.isdisjoint(fb), a.isdisjoint(b))
+                self.assertEqual((fa | fb).dtype(), dtype)
+
+        s = FlatSet([1, 2, 3, 4])
+        alias = s
+        s &= FlatSet([2, 4, 6])
+        self.assertIs(s, alias)
+        self.assertEqual(list(s), [2, 4])
+        s |= FlatSet([1])
+        s -= FlatSet([4])
+        s ^= FlatSet([2, 9])
+        self.assertEqual(list(s), [1, 9])
+        self.assertTrue(FlatSet([1, 9]).issuperset(FlatSet([9])))
+        self.assertTrue(FlatSet().issubset(s))
+        self.assertEqual(list(FlatSet([1, 3], dtype='q') | FlatSet([2])), [1, 2, 3])
+        with self.assertRaises(TypeError):
+            s | {1}
+
+    def test_typed_construction_validates(self):
+        with self.assertRaises(TypeError):
+            FlatSet([1.5, 2.7], dtype='q')
+        with self.assertRaises(OverflowError):
+            FlatSet([300], dtype='b')
+        self.assertEqual(list(FlatSet([3, 1, 3], dtype='q')), [1, 3])
+
+    def test_batched_lookup_matches_single(self):
+        s = FlatSet([1, 2, 3], dtype='q')
+        probes = [2.5, 2 ** 70, 3]
+        self.assertEqual(list(s.lower_bound_many(probes)), [s.lower_bound(v) for v in probes])
+        self.assertEqual(s.contains_many(probes), [s.contains(v) for v in probes])
+        f = FlatSet([0.5, 1.5], dtype='f')
+        self.assertEqual(f.contains_many([0.1, 1.5]), [False, True])
+
+    def test_mixed_dtype_algebra(self):
+        q = FlatSet(range(10), dtype='q')
+        floats = FlatSet([1.0, 2.5])
+        self.assertEqual(list(q | floats), sorted(set(range(10)) | {2.5}))
+        self.assertEqual(list(q ^ floats), [0, 2, 2.5] + list(range(3, 10)))
+        self.assertEqual((q | floats).dtype(), None)
+        self.assertEqual(list(q | FlatSet([2 ** 70])), list(range(10)) + [2 ** 70])
+        big = FlatSet(range(1000), dtype='q')
+        self.assertEqual(list(big & floats), [1.0])
+        self.assertEqual(list(q & FlatSet([3], dtype='b')), [3])
+        self.assertEqual((q - FlatSet([3], dtype='b')).dtype(), None)
+
+        q |= floats
+        self.assertEqual(q.dtype(), None)
+        self.assertIn(2.5, q)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,34 @@
+import sys
+import os
+import random
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'cppbase', 'src')))
+
+from cppforward_list.forward_list import ForwardList
+
+def copy_out_sort(fl):
+    # The workaround this benchmark compares against: materialise, sort, rebuild.
+    return ForwardList(sorted(fl))
+
+def run_benchmark(sizes=(1_000, 10_000, 100_000), repeat=3):
+    print("=========================================")
+    print("   ForwardList.sort vs copy-out sort")
+    print("=========================================")
+    for n in sizes:
+        data = [random.random() for _ in range(n)]
+
+        in_place = min(timeit.repeat(
+            "fl.sort()", setup="fl = ForwardList(data)",
+            globals={'ForwardList': ForwardList, 'data': data}, number=1, repeat=repeat))
+        copy_out = min(timeit.repeat(
+            "copy_out_sort(fl)", setup="fl = ForwardList(data)",
+            globals={'ForwardList': ForwardList, 'data': data, 'copy_out_sort': copy_out_sort},
+            number=1, repeat=repeat))
+
+        print(f"  n={n:>8}: in-place {in_place * 1000:8.2f} ms | copy-out {copy_out * 1000:8.2f} ms"
+              f" (copy-out allocates {n} new nodes + a {n}-slot list)")
+
+if __name__ == "__main__":
+    run_benchmark()
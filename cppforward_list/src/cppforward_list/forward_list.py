@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TypeVar, Generic, Iterable, Iterator, Any
+from typing import TypeVar, Generic, Iterable, Iterator, Any, Callable, Optional
 
 T = TypeVar('T')
 
@@ -10,12 +10,32 @@ class ForwardNode(Generic[T]):
         self.value = value
         self.next = next_node
 
-from cppbase import Sequence
+class _BeforeBegin:
+    """Stand-in node for before_begin(): its `next` is the list's head."""
+    __slots__ = ('_list',)
+
+    def __init__(self, owner: 'ForwardList'):
+        self._list = owner
+
+    @property
+    def next(self):
+        return self._list._head
+
+    @next.setter
+    def next(self, node):
+        self._list._head = node
+
+    @property
+    def value(self):
+        raise IndexError("dereferencing before_begin() iterator")
+
+from cppbase import Sequence, NodePool
+from cppbase.pool import make_pool
 
 class ForwardList(Sequence, Generic[T]):
-    __slots__ = ('_head', '_size')
+    __slots__ = ('_head', '_size', '_pool')
 
-    def __init__(self, source: Iterable[T] | None = None):
+    def __init__(self, source: Iterable[T] | None = None, pool: NodePool | bool | None = None):
         """
         std::forward_list implementation (Singly Linked List).
         
@@ -25,7 +45,11 @@ class ForwardList(Sequence, Generic[T]):
         Does NOT support size() in constant time in strict C++11, 
         but we will track it O(1) for Python convenience, 
         as removing it is too painful for Python devs.
+
+        `pool` opts into node recycling: True for a private NodePool, or a
+        shared NodePool(ForwardNode) instance.
         """
+        self._pool = make_pool(pool, ForwardNode)
         self._head: ForwardNode[T] | None = None
         self._size = 0
         
@@ -35,7 +59,7 @@ class ForwardList(Sequence, Generic[T]):
             # Efficient list build: keep tail pointer locally during init.
             tail = None
             for x in source:
-                new_node = ForwardNode(x)
+                new_node = self._new_node(x, None)
                 if tail:
                     tail.next = new_node
                 else:
@@ -43,17 +67,29 @@ class ForwardList(Sequence, Generic[T]):
                 tail = new_node
                 self._size += 1
 
+    # --------------------- Allocator ---------------------
+    def get_allocator(self) -> NodePool | None:
+        return self._pool
+
+    def _new_node(self, value: T, next_node: ForwardNode[T] | None) -> ForwardNode[T]:
+        if self._pool is None:
+            return ForwardNode(value, next_node)
+        return self._pool.acquire(value, next_node)
+
     # --------------------- Modifiers ---------------------
     def push_front(self, value: T):
-        self._head = ForwardNode(value, self._head)
+        self._head = self._new_node(value, self._head)
         self._size += 1
 
     def pop_front(self) -> T:
         if not self._head:
             raise IndexError("pop_front from empty forward_list")
-        val = self._head.value
-        self._head = self._head.next
+        node = self._head
+        val = node.value
+        self._head = node.next
         self._size -= 1
+        if self._pool is not None:
+            self._pool.release(node)
         return val
 
     def insert_after(self, pos_iterator: 'ForwardListIterator', value: T):
@@ -66,7 +102,7 @@ class ForwardList(Sequence, Generic[T]):
             raise ValueError("Iterator is invalid")
         
         node = pos_iterator.current
-        new_node = ForwardNode(value, node.next)
+        new_node = self._new_node(value, node.next)
         node.next = new_node
         self._size += 1
 
@@ -80,14 +116,23 @@ class ForwardList(Sequence, Generic[T]):
         node_to_remove = pos_iterator.current.next
         pos_iterator.current.next = node_to_remove.next
         self._size -= 1
+        if self._pool is not None:
+            self._pool.release(node_to_remove)
 
     def clear(self):
+        if self._pool is not None:
+            curr = self._head
+            while curr:
+                next_node = curr.next
+                self._pool.release(curr)
+                curr = next_node
         self._head = None
         self._size = 0
 
     def swap(self, other: 'ForwardList'):
         self._head, other._head = other._head, self._head
         self._size, other._size = other._size, self._size
+        self._pool, other._pool = other._pool, self._pool # Nodes go back where they came from
 
     # --------------------- Access ---------------------
     def front(self) -> T:
@@ -113,6 +158,133 @@ class ForwardList(Sequence, Generic[T]):
             current = next_node
         self._head = prev
 
+    def remove(self, value: T) -> int:
+        """Erases every element equal to value; returns the number removed."""
+        return self.remove_if(lambda x: x == value)
+
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+        """Erases every element for which predicate(x) is true, relinking in place."""
+        removed = 0
+        prev = None
+        curr = self._head
+        while curr:
+            next_node = curr.next
+            if predicate(curr.value):
+                if prev:
+                    prev.next = next_node
+                else:
+                    self._head = next_node
+                if self._pool is not None:
+                    self._pool.release(curr)
+                removed += 1
+            else:
+                prev = curr
+            curr = next_node
+        self._size -= removed
+        return removed
+
+    def unique(self, binary_predicate: Optional[Callable[[T, T], bool]] = None) -> int:
+        """Erases all but the first of each run of consecutive equal elements."""
+        removed = 0
+        curr = self._head
+        while curr and curr.next:
+            nxt = curr.next
+            if (nxt.value == curr.value if binary_predicate is None
+                    else binary_predicate(curr.value, nxt.value)):
+                curr.next = nxt.next
+                if self._pool is not None:
+                    self._pool.release(nxt)
+                removed += 1
+            else:
+                curr = nxt
+        self._size -= removed
+        return removed
+
+    def merge(self, other: 'ForwardList', comparator: Optional[Callable[[T, T], bool]] = None):
+        """
+        Merges the sorted list `other` into this sorted list by relinking nodes.
+        `other` is left empty. Stable: on ties, elements of self come first.
+        """
+        if other is self or not other._head:
+            return
+        head, _ = _merge_runs(self._head, other._head, comparator, ForwardNode(None))
+        self._head = head
+        self._size += other._size
+        other._head = None
+        other._size = 0
+
+    def sort(self, comparator: Optional[Callable[[T, T], bool]] = None):
+        """
+        Stable in-place sort (bottom-up merge sort on the nodes).
+        comparator(a, b) -> bool means "a < b"; defaults to `<`.
+        Nodes are relinked, never copied, and extra memory is O(1).
+        """
+        n = self._size
+        if n < 2:
+            return
+        dummy = ForwardNode(None)
+        scratch = ForwardNode(None)
+        dummy.next = self._head
+        width = 1
+        while width < n:
+            tail = dummy
+            curr = dummy.next
+            while curr:
+                left = curr
+                right = _split_after(left, width)
+                curr = _split_after(right, width)
+                head, last = _merge_runs(left, right, comparator, scratch)
+                tail.next = head
+                tail = last
+            width *= 2
+        self._head = dummy.next
+
+    def splice_after(self, pos_iterator: 'ForwardListIterator', other: 'ForwardList',
+                     first: 'ForwardListIterator | None' = None,
+                     last: 'ForwardListIterator | None' = None):
+        """
+        Moves nodes from `other` to just after `pos_iterator` without copying.
+        - splice_after(pos, other): all elements of other.
+        - splice_after(pos, other, it): the single element after `it`.
+        - splice_after(pos, other, first, last): the open range (first, last).
+        `other` may be this list for the single-element and range forms.
+        """
+        pos = pos_iterator.current
+        if not pos:
+            raise ValueError("Iterator is invalid")
+        if first is None:
+            if other is self or not other._head:
+                return
+            start, before = other._head, _BeforeBegin(other)
+            stop = None
+        else:
+            before = first.current
+            if not before or not before.next:
+                return
+            start = before.next
+            if last is None:
+                stop = start.next
+            else:
+                stop = last.current
+                if start is stop:
+                    return
+        if pos is before or (first is not None and last is None and pos is start):
+            return
+
+        # Find the last node of the moved range, counting as we go.
+        end = start
+        moved = 1
+        while end.next is not stop:
+            end = end.next
+            moved += 1
+
+        before.next = stop
+        end.next = pos.next
+        pos.next = start
+        if other is not self:
+            other._size -= moved
+            self._size += moved
+
     # --------------------- Iterators ---------------------
     def __iter__(self) -> Iterator[T]:
         current = self._head
@@ -126,11 +298,11 @@ class ForwardList(Sequence, Generic[T]):
     def before_begin(self) -> 'ForwardListIterator':
         """
         Returns an iterator to a "hypothetical" element before begin.
-        Essential for insert_after() at the very start?
-        Actually, trickier in Python without sentinel nodes.
-        We'll skip before_begin strictness and just rely on push_front for head ops.
+        There is no sentinel node; instead the iterator points at a small proxy
+        whose `next` reads and writes the head, so insert_after(), erase_after()
+        and splice_after() work at the very start. It must not be dereferenced.
         """
-        pass
+        return ForwardListIterator(_BeforeBegin(self))
 
     def __repr__(self):
         # Avoid infinite loop if cyclic (not expected standard usage but possible)
@@ -158,3 +330,46 @@ class ForwardListIterator:
     def next(self): # C++ style advance
         if self.current:
             self.current = self.current.next
+
+
+# --------------------- Node helpers (sort / merge) ---------------------
+def _split_after(node: ForwardNode | None, count: int) -> ForwardNode | None:
+    """Cuts the chain after `count` nodes; returns the head of the remainder."""
+    for _ in range(count - 1):
+        if not node:
+            return None
+        node = node.next
+    if not node:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+def _merge_runs(a: ForwardNode | None, b: ForwardNode | None,
+                comparator: Optional[Callable[[Any, Any], bool]], scratch: ForwardNode):
+    """Stable merge of two sorted chains; returns (head, tail)."""
+    tail = scratch
+    if comparator is None:
+        while a and b:
+            if b.value < a.value:
+                tail.next = b
+                b = b.next
+            else:
+                tail.next = a
+                a = a.next
+            tail = tail.next
+    else:
+        while a and b:
+            if comparator(b.value, a.value):
+                tail.next = b
+                b = b.next
+            else:
+                tail.next = a
+                a = a.next
+            tail = tail.next
+    tail.next = a if a else b
+    while tail.next:
+        tail = tail.next
+    head = scratch.next
+    scratch.next = None
+    return head, tail
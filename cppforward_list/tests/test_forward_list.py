@@ -45,5 +45,82 @@ class TestForwardList(unittest.TestCase):
         fl.reverse()
         self.assertEqual(list(fl), [3, 2, 1])
 
+    def test_node_pool(self):
+        fl = ForwardList([1, 2, 3], pool=True)
+        pool = fl.get_allocator()
+        fl.erase_after(fl.begin())
+        fl.pop_front()
+        self.assertEqual(pool.free_count(), 2)
+
+        fl.push_front(7)
+        fl.insert_after(fl.begin(), 8)
+        self.assertEqual(list(fl), [7, 8, 3])
+        self.assertEqual(pool.stats()['hits'], 2)
+        self.assertEqual(pool.free_count(), 0)
+
+        other = ForwardList([9])
+        fl.swap(other)
+        self.assertIs(other.get_allocator(), pool)
+        self.assertIsNone(fl.get_allocator())
+        other.pop_front()
+        self.assertEqual(pool.free_count(), 1)
+
+    def test_sort(self):
+        fl = ForwardList([5, 3, 8, 1, 9, 2, 7])
+        fl.sort()
+        self.assertEqual(list(fl), [1, 2, 3, 5, 7, 8, 9])
+
+        fl.sort(lambda a, b: a > b)
+        self.assertEqual(list(fl), [9, 8, 7, 5, 3, 2, 1])
+
+        # Stable: equal keys keep their original order
+        pairs = ForwardList([(1, 'a'), (0, 'b'), (1, 'c'), (0, 'd')])
+        pairs.sort(lambda a, b: a[0] < b[0])
+        self.assertEqual(list(pairs), [(0, 'b'), (0, 'd'), (1, 'a'), (1, 'c')])
+
+    def test_merge(self):
+        a = ForwardList([1, 4, 6])
+        b = ForwardList([2, 3, 7, 8])
+        a.merge(b)
+        self.assertEqual(list(a), [1, 2, 3, 4, 6, 7, 8])
+        self.assertEqual(len(list(b)), 0)
+        self.assertTrue(b.empty())
+
+    def test_unique_and_remove(self):
+        fl = ForwardList([1, 1, 2, 2, 2, 3, 1, 1], pool=True)
+        self.assertEqual(fl.unique(), 4)
+        self.assertEqual(list(fl), [1, 2, 3, 1])
+
+        self.assertEqual(fl.remove(1), 2)
+        self.assertEqual(list(fl), [2, 3])
+        self.assertEqual(fl.remove_if(lambda x: x % 2 == 0), 1)
+        self.assertEqual(list(fl), [3])
+        self.assertEqual(fl.get_allocator().free_count(), 7)
+
+    def test_splice_after(self):
+        a = ForwardList([1, 2])
+        b = ForwardList([10, 20, 30, 40])
+
+        a.splice_after(a.begin(), b, b.begin())     # moves 20
+        self.assertEqual(list(a), [1, 20, 2])
+        self.assertEqual(list(b), [10, 30, 40])
+
+        first = b.before_begin()
+        last = b.begin()
+        last.next()                                 # 30
+        a.splice_after(a.before_begin(), b, first, last)  # moves (before_begin, 30) = 10
+        self.assertEqual(list(a), [10, 1, 20, 2])
+
+        a.splice_after(a.begin(), b)                # moves everything left
+        self.assertEqual(list(a), [10, 30, 40, 1, 20, 2])
+        self.assertTrue(b.empty())
+
+    def test_before_begin(self):
+        fl = ForwardList([2])
+        fl.insert_after(fl.before_begin(), 1)
+        self.assertEqual(list(fl), [1, 2])
+        fl.erase_after(fl.before_begin())
+        self.assertEqual(list(fl), [2])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,16 +1,95 @@
 from __future__ import annotations
-from typing import TypeVar, Generic, Iterator, Any, List, Optional
+from typing import TypeVar, Generic, Iterator, Any, List, Dict, Optional
+from array import array
 from cppbase import Container
 
 T = TypeVar('T')
 
+class _Block:
+    """
+    One element block of a Hive.
+
+    `skipfield` is a low-complexity jump-counting skipfield (as in plf::colony):
+    0 marks a live slot, and for every run of erased slots (a "skipblock") the
+    first and last entries hold the run length. Iteration can therefore jump
+    over any run of erased slots in O(1). It has one extra trailing 0 so that
+    `skipfield[i + 1]` is always readable.
+    """
+    __slots__ = ('elements', 'skipfield', 'capacity', 'high', 'size', 'free_runs', 'prev', 'next')
+
+    def __init__(self, capacity: int):
+        self.elements: List[Any] = [None] * capacity
+        self.skipfield = array('l', [0]) * (capacity + 1)
+        self.capacity = capacity
+        self.high = 0        # Slots [0, high) have been used at least once
+        self.size = 0        # Live elements
+        self.free_runs: Dict[int, None] = {} # Start index of every skipblock
+        self.prev: _Block | None = None
+        self.next: _Block | None = None
+
+    def first(self) -> int:
+        return self.skipfield[0]
+
+    def erase(self, i: int):
+        skip = self.skipfield
+        left = skip[i - 1] if i > 0 else 0
+        right = skip[i + 1]
+        self.elements[i] = None # Drop the reference for GC
+        if not left and not right:
+            skip[i] = 1
+            self.free_runs[i] = None
+        elif not right:
+            # Extend the run on the left; its start is unchanged
+            length = left + 1
+            skip[i - left] = length
+            skip[i] = length
+        elif not left:
+            # Prepend to the run on the right; i becomes its start
+            length = right + 1
+            skip[i] = length
+            skip[i + right] = length
+            del self.free_runs[i + 1]
+            self.free_runs[i] = None
+        else:
+            # Join both runs
+            length = left + right + 1
+            skip[i - left] = length
+            skip[i + right] = length
+            skip[i] = length # Interior value only needs to be non-zero
+            del self.free_runs[i + 1]
+        self.size -= 1
+
+    def reset(self):
+        """Returns the block to its freshly allocated state (for recycling)."""
+        high = self.high
+        self.elements[:high] = [None] * high
+        self.skipfield[:high + 1] = array('l', [0]) * (high + 1)
+        self.high = 0
+        self.size = 0
+        self.free_runs = {}
+        self.prev = self.next = None
+
+    def reuse(self) -> int:
+        """Fills the first slot of the most recently freed skipblock."""
+        start, _ = self.free_runs.popitem()
+        skip = self.skipfield
+        length = skip[start]
+        skip[start] = 0
+        if length > 1:
+            skip[start + 1] = length - 1
+            skip[start + length - 1] = length - 1
+            self.free_runs[start + 1] = None
+        self.size += 1
+        return start
+
+
 class HiveIterator(Generic[T]):
     """Iterator for Hive."""
-    __slots__ = ('_hive', '_block_idx', '_slot_idx')
+    __slots__ = ('_hive', '_block', '_slot_idx')
 
-    def __init__(self, hive: Hive[T], block_idx: int, slot_idx: int):
+    def __init__(self, hive: Hive[T], block: _Block | None, slot_idx: int):
         self._hive = hive
-        self._block_idx = block_idx
+        self._block = block
         self._slot_idx = slot_idx
 
     def __iter__(self):
@@ -20,138 +99,242 @@ class HiveIterator(Generic[T]):
         # Check if we are at end or invalid
         if not self._is_valid():
             raise StopIteration
-        
+
         # Get current value
-        val = self._hive._get_value(self._block_idx, self._slot_idx)
-        
+        val = self._hive._get_value(self._block, self._slot_idx)
+
         # Advance
         self._advance()
-        
+
         return val
 
     def _is_valid(self):
-        if self._block_idx >= len(self._hive._blocks):
-            return False
-        return True
+        return self._block is not None
 
     def _advance(self):
-        # Find next valid slot
-        # This naive skip algorithm is O(skip), but optimized implementation would use skipfield
-        # Here we just linear scan.
-        # Next slot in current block?
-        self._slot_idx += 1
-        return self._seek_valid()
-
-    def _seek_valid(self):
-        while self._block_idx < len(self._hive._blocks):
-            block = self._hive._blocks[self._block_idx]
-            while self._slot_idx < len(block):
-                if block[self._slot_idx] is not self._hive._TOMBSTONE:
-                    return # Found valid
-                self._slot_idx += 1
-            
-            # Move to next block
-            self._block_idx += 1
-            self._slot_idx = 0
-            
+        # Next slot, then jump over any skipblock in O(1) via the skipfield
+        block = self._block
+        i = self._slot_idx + 1
+        i += block.skipfield[i]
+        if i >= block.high:
+            # Empty blocks are unlinked from the chain, so the next block
+            # always has a live element at its first unskipped slot.
+            block = block.next
+            i = block.first() if block else 0
+            self._block = block
+        self._slot_idx = i
+
     def value(self) -> T:
         """Access value at current position without advancing."""
-        return self._hive._get_value(self._block_idx, self._slot_idx)
+        return self._hive._get_value(self._block, self._slot_idx)
+
+    def __eq__(self, other):
+        return (isinstance(other, HiveIterator)
+                and self._block is other._block and self._slot_idx == other._slot_idx)
+
+    def __ne__(self, other):
+        return not (self == other)
 
 class Hive(Container, Generic[T]):
     """
     A Python implementation of plf::hive (colony).
     A bucket-array container that allows O(1) insertion and erasure with stable iterators.
-    Elements are not moved in memory (in Python: their position/index tuple is stable).
+    Elements are not moved in memory (in Python: their (block, slot) position is stable).
+
+    Blocks grow geometrically between `min_block_capacity` and
+    `max_block_capacity`. Blocks that become empty are kept as reserved
+    capacity and recycled by later inserts; `trim()` releases them.
     """
-    __slots__ = ('_blocks', '_size', '_free_slots', '_TOMBSTONE')
-    
-    def __init__(self, source=None):
-        self._blocks: List[List[Any]] = []
+    __slots__ = ('_head', '_tail', '_size', '_free_blocks', '_reserved', '_capacity',
+                 '_min_block', '_max_block')
+
+    def __init__(self, source=None, min_block_capacity: int = 8, max_block_capacity: int = 8192):
+        if not (1 <= min_block_capacity <= max_block_capacity):
+            raise ValueError("invalid block capacity limits")
+        self._min_block = min_block_capacity
+        self._max_block = max_block_capacity
+        # Doubly linked chain of blocks that hold at least one element
+        self._head: _Block | None = None
+        self._tail: _Block | None = None
         self._size = 0
-        self._free_slots: List[tuple[int, int]] = [] # Stack of (block_idx, slot_idx)
-        self._TOMBSTONE = object() # Unique sentinel for erased slots
-        
+        self._capacity = 0 # Slots in active + reserved blocks
+        # Partially free blocks, most recently used last; insert fills these
+        # first so new elements land next to live ones instead of a new block.
+        self._free_blocks: Dict[_Block, None] = {}
+        self._reserved: List[_Block] = [] # Empty blocks kept for recycling
+
         if source is not None:
             for x in source:
                 self.insert(x)
 
     def insert(self, value: T):
         """Inserts value and returns an iterator to it."""
-        # Reuse free slot
-        if self._free_slots:
-            b_idx, s_idx = self._free_slots.pop()
-            self._blocks[b_idx][s_idx] = value
+        # Reuse an erased slot
+        if self._free_blocks:
+            block, _ = self._free_blocks.popitem() # Most recently used block
+            s_idx = block.reuse()
+            if block.free_runs:
+                self._free_blocks[block] = None # Stays preferred for the next insert
+            block.elements[s_idx] = value
             self._size += 1
-            return HiveIterator(self, b_idx, s_idx)
-        
+            return HiveIterator(self, block, s_idx)
+
         # Or append
-        if not self._blocks:
-            self._add_block()
-        
-        last_block = self._blocks[-1]
-        # Check if last block is full (assuming we respect capacities or just handle list growth)
-        # Hive usually has geometric block growth.
-        # For simplicity in Python, we can just let lists grow or enforce a cap.
-        # Strict hive enforces capacity.
-        # Let's say block cap: 8, 16, 32...
-        current_block_cap = 8 * (2 ** (len(self._blocks) - 1))
-        
-        if len(last_block) < current_block_cap:
-            last_block.append(value)
-            b_idx = len(self._blocks) - 1
-            s_idx = len(last_block) - 1
-            self._size += 1
-            return HiveIterator(self, b_idx, s_idx)
-        else:
-            self._add_block()
-            self._blocks[-1].append(value)
-            b_idx = len(self._blocks) - 1
-            s_idx = 0
-            self._size += 1
-            return HiveIterator(self, b_idx, s_idx)
+        block = self._tail
+        if block is None or block.high == block.capacity:
+            block = self._next_block()
+
+        s_idx = block.high
+        block.elements[s_idx] = value
+        block.high += 1
+        block.size += 1
+        self._size += 1
+        return HiveIterator(self, block, s_idx)
 
     def erase(self, iterator: HiveIterator):
-        """Erases element at iterator. Iterator becomes invalid (points to tombstone)."""
-        b_idx, s_idx = iterator._block_idx, iterator._slot_idx
-        if self._blocks[b_idx][s_idx] is self._TOMBSTONE:
+        """Erases element at iterator. Iterator becomes invalid."""
+        block, s_idx = iterator._block, iterator._slot_idx
+        if block is None or s_idx >= block.high or block.skipfield[s_idx]:
             return # Already erased
-        
-        self._blocks[b_idx][s_idx] = self._TOMBSTONE
-        self._free_slots.append((b_idx, s_idx))
+
+        had_free = bool(block.free_runs)
+        block.erase(s_idx)
         self._size -= 1
+        if block.size == 0:
+            # Fully erased: take the block out of the iteration chain and
+            # keep it as reserved capacity
+            self._free_blocks.pop(block, None)
+            self._unlink_block(block)
+            block.reset()
+            self._reserved.append(block)
+        elif not had_free:
+            self._free_blocks[block] = None
 
     def clear(self):
-        self._blocks.clear()
-        self._free_slots.clear()
+        """Erases all elements; their blocks are kept as reserved capacity."""
+        block = self._head
+        while block:
+            next_block = block.next
+            block.reset()
+            self._reserved.append(block)
+            block = next_block
+        self._head = None
+        self._tail = None
+        self._free_blocks.clear()
         self._size = 0
 
+    # --------------------- Capacity ---------------------
+    def capacity(self) -> int:
+        return self._capacity
+
+    def block_capacity_limits(self) -> tuple:
+        return (self._min_block, self._max_block)
+
+    def reserve(self, n: int):
+        """Allocates reserved blocks until capacity() >= n."""
+        while self._capacity < n:
+            cap = min(max(n - self._capacity, self._min_block), self._max_block)
+            self._reserved.append(_Block(cap))
+            self._capacity += cap
+
+    def trim(self):
+        """Releases all reserved (empty) blocks. Iterators stay valid."""
+        for block in self._reserved:
+            self._capacity -= block.capacity
+        self._reserved = []
+
+    def shrink_to_fit(self):
+        """
+        Compacts the elements into as few blocks as possible and releases the
+        rest, so that capacity() is close to size(). Invalidates all iterators.
+        """
+        values = list(self)
+        self._head = self._tail = None
+        self._free_blocks.clear()
+        self._reserved = []
+        self._capacity = 0
+        self._size = 0
+        remaining = len(values)
+        pos = 0
+        while remaining:
+            cap = min(max(remaining, self._min_block), self._max_block)
+            block = _Block(cap)
+            self._capacity += cap
+            self._link_block(block)
+            count = min(cap, remaining)
+            block.elements[:count] = values[pos:pos + count]
+            block.high = block.size = count
+            pos += count
+            remaining -= count
+        self._size = len(values)
+
     def empty(self) -> bool:
         return self._size == 0
-    
+
     def size(self) -> int:
         return self._size
-    
+
     def __len__(self) -> int:
         return self._size
 
+    def begin(self) -> HiveIterator[T]:
+        block = self._head
+        return HiveIterator(self, block, block.first() if block else 0)
+
+    def end(self) -> HiveIterator[T]:
+        return HiveIterator(self, None, 0)
+
     def __iter__(self) -> Iterator[T]:
-        for block in self._blocks:
-            for item in block:
-                if item is not self._TOMBSTONE:
-                    yield item
+        block = self._head
+        while block:
+            elements = block.elements
+            skip = block.skipfield
+            high = block.high
+            i = skip[0]
+            while i < high:
+                yield elements[i]
+                i += 1
+                i += skip[i]
+            block = block.next
 
     # --------------------- Internal ---------------------
-    def _add_block(self):
-        self._blocks.append([])
-
-    def _get_value(self, b_idx, s_idx):
-        if b_idx >= len(self._blocks): raise IndexError("Iterator out of bounds")
-        if s_idx >= len(self._blocks[b_idx]): raise IndexError("Iterator out of bounds")
-        val = self._blocks[b_idx][s_idx]
-        if val is self._TOMBSTONE:
+    def _next_block(self) -> _Block:
+        # Recycle a reserved block before allocating; otherwise grow
+        # geometrically (8, 16, 32...) up to the maximum block capacity.
+        if self._reserved:
+            block = self._reserved.pop()
+        else:
+            tail = self._tail
+            cap = self._min_block if tail is None else min(tail.capacity * 2, self._max_block)
+            block = _Block(cap)
+            self._capacity += cap
+        self._link_block(block)
+        return block
+
+    def _link_block(self, block: _Block):
+        block.prev = self._tail
+        if self._tail:
+            self._tail.next = block
+        else:
+            self._head = block
+        self._tail = block
+
+    def _unlink_block(self, block: _Block):
+        if block.prev:
+            block.prev.next = block.next
+        else:
+            self._head = block.next
+        if block.next:
+            block.next.prev = block.prev
+        else:
+            self._tail = block.prev
+        block.prev = block.next = None
+
+    def _get_value(self, block, s_idx):
+        if block is None or s_idx >= block.high: raise IndexError("Iterator out of bounds")
+        if block.skipfield[s_idx]:
             raise ValueError("Iterator points to erased element")
-        return val
+        return block.elements[s_idx]
 
     def splice(self, other: Hive):
         """Moves elements from other hive to this one (Not strictly possible efficiently in Python without header manipulation, but we can simulate transfer)"""
@@ -159,6 +342,6 @@ class Hive(Container, Generic[T]):
         for x in other:
             self.insert(x)
         other.clear()
-        
+
     def __repr__(self):
         return f"Hive(size={self._size}, items={list(self)})"
@@ -55,12 +55,75 @@ class TestHive(unittest.TestCase):
     def test_iterator_traversal(self):
         h = Hive([10, 20, 30])
         it = h.insert(40) # return iterator to 40
-        
+        self.assertEqual(it.value(), 40)
+
         # Traverse manual
-        # Since HiveIterator is constructed manually usually by insert, 
-        # we can't easily get 'begin()' iterator as an object unless we implement begin() returning HiveIterator.
-        # But __iter__ works.
-        pass
+        self.assertEqual(list(h.begin()), [10, 20, 30, 40])
+        self.assertEqual(list(h.end()), [])
+
+    def test_skipfield_runs(self):
+        h = Hive()
+        its = [h.insert(i) for i in range(24)] # blocks of 8 and 16
+
+        # Erase in an order that exercises extend-left, prepend-right and join
+        for i in [3, 4, 6, 5, 10, 12, 11, 9, 13]:
+            h.erase(its[i])
+        expected = [i for i in range(24) if i not in (3, 4, 5, 6, 9, 10, 11, 12, 13)]
+        self.assertEqual(list(h), expected)
+        self.assertEqual(list(h.begin()), expected)
+
+        # Reuse fills skipblocks from their start
+        h.insert(100)
+        h.insert(101)
+        self.assertEqual(sorted(h), sorted(expected + [100, 101]))
+        self.assertEqual(h.size(), len(expected) + 2)
+
+    def test_empty_blocks_leave_chain(self):
+        h = Hive()
+        its = [h.insert(i) for i in range(24)]
+        for it in its[:8]:
+            h.erase(it) # Empties the whole first block
+        self.assertEqual(list(h), list(range(8, 24)))
+        self.assertEqual(h.begin().value(), 8)
+
+        with self.assertRaises(ValueError):
+            h.erase(its[8])
+            its[8].value() # Erased element
+
+    def test_block_recycling(self):
+        h = Hive()
+        its = [h.insert(i) for i in range(24)] # blocks of 8 and 16
+        self.assertEqual(h.capacity(), 24)
+        for it in its[8:]:
+            h.erase(it)
+        self.assertEqual(list(h), list(range(8)))
+
+        # The emptied 16-slot block is recycled instead of allocating
+        for i in range(16):
+            h.insert(i)
+        self.assertEqual(h.capacity(), 24)
+
+        h.clear()
+        self.assertTrue(h.empty())
+        self.assertEqual(h.capacity(), 24)
+        h.trim()
+        self.assertEqual(h.capacity(), 0)
+
+    def test_reserve_and_shrink(self):
+        h = Hive(max_block_capacity=64)
+        h.reserve(100)
+        self.assertGreaterEqual(h.capacity(), 100)
+        its = [h.insert(i) for i in range(100)]
+        self.assertLessEqual(h.capacity(), 128)
+
+        for it in its[::2]:
+            h.erase(it)
+        h.shrink_to_fit()
+        self.assertEqual(list(h), list(range(1, 100, 2)))
+        self.assertEqual(h.capacity(), 50)
+
+        h.insert(-1)
+        self.assertEqual(h.size(), 51)
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import TypeVar, Generic, Iterator, Any, List, overload
+from array import array
 from cppbase import Sequence
+from cppbase.buffer import check_dtype, typed_fill
 
 T = TypeVar('T')
 
@@ -9,22 +11,30 @@ class InplaceVector(Sequence, Generic[T]):
     A Python implementation of C++26 std::inplace_vector.
     A dynamically-resizable vector with fixed maximum capacity.
     Does not allocate memory on insertion (storage is pre-allocated).
+
+    With dtype set to an array typecode (e.g. 'd'), the storage is a
+    fixed-size `array.array` of machine values exposing the buffer protocol.
     """
-    __slots__ = ('_data', '_size', '_capacity')
+    __slots__ = ('_data', '_size', '_capacity', '_dtype')
 
-    def __init__(self, capacity: int):
+    def __init__(self, capacity: int, dtype: str | None = None):
         """
         Initialize with a fixed capacity.
         Args:
             capacity: The maximum number of elements this vector can hold.
+            dtype: Optional array typecode for typed storage.
         """
         if capacity < 0:
             raise ValueError("Capacity must be non-negative")
         self._capacity = capacity
+        self._dtype = check_dtype(dtype)
         # Pre-allocate storage. 
         # In Python, a list of None is efficient enough. 
         # We could use standard vector backing (ctypes) but list is more Pythonic for "slots".
-        self._data = [None] * capacity 
+        if dtype:
+            self._data = array(dtype, bytes(capacity * array(dtype).itemsize))
+        else:
+            self._data = [None] * capacity 
         self._size = 0
 
     # --------------------- Capacity ---------------------
@@ -32,6 +42,7 @@ class InplaceVector(Sequence, Generic[T]):
     def max_size(self) -> int: return self._capacity
     def capacity(self) -> int: return self._capacity
     def empty(self) -> bool: return self._size == 0
+    def dtype(self) -> str | None: return self._dtype
     
     # --------------------- Modifiers ---------------------
     def push_back(self, value: T):
@@ -46,11 +57,12 @@ class InplaceVector(Sequence, Generic[T]):
         if self._size == 0:
             raise IndexError("pop_back from empty InplaceVector")
         self._size -= 1
-        self._data[self._size] = None # Help GC
+        if not self._dtype:
+            self._data[self._size] = None # Help GC
 
     def clear(self):
-        for i in range(self._size):
-            self._data[i] = None
+        if not self._dtype:
+            self._data[:self._size] = [None] * self._size
         self._size = 0
         
     def resize(self, n: int, value: T | None = None):
@@ -58,23 +70,57 @@ class InplaceVector(Sequence, Generic[T]):
             raise MemoryError("resize exceeded capacity")
         if n < self._size:
             # Shrink
-            for i in range(n, self._size):
-                self._data[i] = None
+            if not self._dtype:
+                self._data[n:self._size] = [None] * (self._size - n)
             self._size = n
         elif n > self._size:
             # Grow
-            for i in range(self._size, n):
-                self._data[i] = value
+            if self._dtype:
+                typed_fill(self._data, 0 if value is None else value, self._size, n)
+            else:
+                self._data[self._size:n] = [value] * (n - self._size)
             self._size = n
 
+    def swap(self, other: 'InplaceVector[T]'):
+        """Exchanges contents with another InplaceVector of the same capacity."""
+        if not isinstance(other, InplaceVector):
+            raise TypeError("Can only swap with another InplaceVector")
+        if self._capacity != other._capacity:
+            raise ValueError("Can only swap InplaceVectors of the same capacity")
+        self._data, other._data = other._data, self._data
+        self._size, other._size = other._size, self._size
+        self._dtype, other._dtype = other._dtype, self._dtype
+
     # --------------------- Access ---------------------
+    def _slice(self, s: slice) -> slice:
+        # Clamp a slice to the live elements [0, size)
+        start, stop, step = s.indices(self._size)
+        if step < 0 and stop < 0:
+            stop = None
+        return slice(start, stop, step)
+
     def __getitem__(self, i: int) -> T:
+        if isinstance(i, slice):
+            return self._data[self._slice(i)] # list, or array.array for typed storage
         if i < 0: i += self._size
         if not (0 <= i < self._size):
             raise IndexError("InplaceVector index out of range")
         return self._data[i]
     
     def __setitem__(self, i: int, value: T):
+        if isinstance(i, slice):
+            # Slice writes copy in C but never change the size
+            s = self._slice(i)
+            count = len(range(*i.indices(self._size)))
+            if self._dtype:
+                if not (isinstance(value, array) and value.typecode == self._dtype):
+                    value = array(self._dtype, value)
+            else:
+                value = list(value)
+            if len(value) != count:
+                raise ValueError("InplaceVector slice assignment cannot change the size")
+            self._data[s] = value
+            return
         if i < 0: i += self._size
         if not (0 <= i < self._size):
             raise IndexError("InplaceVector index out of range")
@@ -96,10 +142,22 @@ class InplaceVector(Sequence, Generic[T]):
         self._size += 1
         return True
 
+    def data(self) -> List[T] | array:
+        """Underlying storage (all `capacity()` slots)."""
+        return self._data
+
+    def memoryview(self) -> memoryview:
+        """Zero-copy buffer over the live elements of typed storage."""
+        if not self._dtype:
+            raise TypeError("memoryview requires typed storage (dtype=...)")
+        return memoryview(self._data)[:self._size]
+
+    def __buffer__(self, flags: int) -> memoryview: # Buffer protocol (Python 3.12+)
+        return self.memoryview()
+
     # --------------------- Iteration ---------------------
     def __iter__(self) -> Iterator[T]:
-        for i in range(self._size):
-            yield self._data[i]
+        return iter(self._data[:self._size])
             
     def __len__(self) -> int:
         return self._size
@@ -107,3 +165,44 @@ class InplaceVector(Sequence, Generic[T]):
     def __repr__(self):
         # InplaceVector[3/10](1, 2, 3)
         return f"InplaceVector[{self._size}/{self._capacity}]({', '.join(repr(self[i]) for i in range(self._size))})"
+
+    # --------------------- Comparisons ---------------------
+    # Lexicographic. Typed vectors of the same dtype compare their buffers in C.
+    def _operands(self, other: 'InplaceVector') -> tuple:
+        a, b = self._data[:self._size], other._data[:other._size]
+        if self._dtype and self._dtype == other._dtype:
+            return a, b
+        return list(a), list(b)
+
+    def __eq__(self, other):
+        if not isinstance(other, InplaceVector) or self._size != other._size:
+            return False
+        a, b = self._operands(other)
+        return a == b
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __lt__(self, other):
+        if not isinstance(other, InplaceVector):
+            return NotImplemented
+        a, b = self._operands(other)
+        return a < b
+
+    def __le__(self, other):
+        if not isinstance(other, InplaceVector):
+            return NotImplemented
+        a, b = self._operands(other)
+        return a <= b
+
+    def __gt__(self, other):
+        if not isinstance(other, InplaceVector):
+            return NotImplemented
+        a, b = self._operands(other)
+        return a > b
+
+    def __ge__(self, other):
+        if not isinstance(other, InplaceVector):
+            return NotImplemented
+        a, b = self._operands(other)
+        return a >= b
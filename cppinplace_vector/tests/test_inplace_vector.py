@@ -37,5 +37,52 @@ class TestInplaceVector(unittest.TestCase):
         with self.assertRaises(MemoryError):
             v.resize(11)
 
+    def test_slices_and_comparisons(self):
+        v = InplaceVector(8)
+        for x in range(5):
+            v.push_back(x)
+        self.assertEqual(v[1:3], [1, 2])
+        self.assertEqual(v[::-1], [4, 3, 2, 1, 0])
+        self.assertEqual(v[3:100], [3, 4])
+        v[0:2] = ['a', 'b']
+        self.assertEqual(list(v), ['a', 'b', 2, 3, 4])
+        with self.assertRaises(ValueError):
+            v[0:2] = []
+
+        w = InplaceVector(8)
+        w.resize(2, 'a')
+        self.assertTrue(w < v)
+        self.assertNotEqual(w, v)
+        w.swap(v)
+        self.assertEqual(len(w), 5)
+        with self.assertRaises(ValueError):
+            w.swap(InplaceVector(3))
+
+    def test_typed_storage(self):
+        v = InplaceVector(10, dtype='q')
+        self.assertEqual(v.dtype(), 'q')
+        v.push_back(5)
+        v.resize(4, 7)
+        self.assertEqual(list(v), [5, 7, 7, 7])
+        with self.assertRaises(TypeError):
+            v.push_back(1.5)
+        v.resize(6)
+        self.assertEqual(list(v), [5, 7, 7, 7, 0, 0])
+        v[4:6] = [1, 2]
+        self.assertEqual(list(v[3:]), [7, 1, 2])
+
+        with v.memoryview() as view:
+            self.assertEqual(len(view), 6)
+            self.assertEqual(view.tolist(), [5, 7, 7, 7, 1, 2])
+
+        u = InplaceVector(10)
+        for x in [5, 7, 7, 7, 1, 2]:
+            u.push_back(x)
+        self.assertEqual(u, v)
+        v.pop_back()
+        self.assertTrue(v < u)
+        v.clear()
+        self.assertTrue(v.empty())
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,4 @@
 from .list import List
+from .compact_list import CompactList, CompactListIterator
 
-__all__ = ['List']
+__all__ = ['List', 'CompactList', 'CompactListIterator']
@@ -0,0 +1,334 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Iterable, Iterator, Any, List as PyList
+from array import array
+
+T = TypeVar('T')
+
+_NIL = -1
+
+from cppbase import Sequence
+
+class CompactList(Sequence, Generic[T]):
+    """
+    Doubly linked list stored in parallel columns instead of node objects.
+
+    Slot `i` of the list is `_values[i]`, linked through `_prev[i]` / `_next[i]`
+    (typed `array('l')` columns, -1 = null). Erased slots are chained through
+    `_next` on a free-index list and reused by later inserts, so a slot index
+    stays valid (a stable iterator) until its own element is erased.
+
+    Per element this costs one list pointer plus two machine-word links,
+    instead of a full `ListNode` object.
+    """
+    __slots__ = ('_values', '_prev', '_next', '_head', '_tail', '_free', '_size')
+
+    def __init__(self, source: Iterable[T] | None = None):
+        self._values: PyList[Any] = []
+        self._prev = array('l')
+        self._next = array('l')
+        self._head = _NIL
+        self._tail = _NIL
+        self._free = _NIL
+        self._size = 0
+        if source is not None:
+            self.assign(source)
+
+    # --------------------- Slots ---------------------
+    def _alloc(self, value: T, prev: int, next: int) -> int:
+        slot = self._free
+        if slot != _NIL:
+            self._free = self._next[slot]
+            self._values[slot] = value
+            self._prev[slot] = prev
+            self._next[slot] = next
+        else:
+            slot = len(self._values)
+            self._values.append(value)
+            self._prev.append(prev)
+            self._next.append(next)
+        return slot
+
+    def _dealloc(self, slot: int):
+        self._values[slot] = None # Drop the reference for GC
+        self._prev[slot] = _NIL
+        self._next[slot] = self._free
+        self._free = slot
+
+    def _link_before(self, pos: int, value: T) -> int:
+        # pos == _NIL means "before end", i.e. push_back.
+        prev = self._tail if pos == _NIL else self._prev[pos]
+        slot = self._alloc(value, prev, pos)
+        if prev == _NIL:
+            self._head = slot
+        else:
+            self._next[prev] = slot
+        if pos == _NIL:
+            self._tail = slot
+        else:
+            self._prev[pos] = slot
+        self._size += 1
+        return slot
+
+    def _unlink(self, slot: int) -> T:
+        prev = self._prev[slot]
+        next = self._next[slot]
+        if prev == _NIL:
+            self._head = next
+        else:
+            self._next[prev] = next
+        if next == _NIL:
+            self._tail = prev
+        else:
+            self._prev[next] = prev
+        val = self._values[slot]
+        self._dealloc(slot)
+        self._size -= 1
+        return val
+
+    def _slot_at(self, index: int) -> int:
+        # Optimization: traverse from closest end
+        if index < self._size // 2:
+            slot = self._head
+            for _ in range(index):
+                slot = self._next[slot]
+        else:
+            slot = self._tail
+            for _ in range(self._size - 1 - index):
+                slot = self._prev[slot]
+        return slot
+
+    # --------------------- Modifiers ---------------------
+    def assign(self, source: Iterable[T] | int, value: T | None = None):
+        self.clear()
+        if isinstance(source, int):
+            source = [value] * source
+        # Bulk build: the columns are laid out in list order.
+        values = list(source)
+        n = len(values)
+        if not n:
+            return
+        self._values = values
+        self._prev = array('l', range(-1, n - 1))
+        self._next = array('l', range(1, n + 1))
+        self._next[n - 1] = _NIL
+        self._head = 0
+        self._tail = n - 1
+        self._size = n
+
+    def push_back(self, value: T):
+        self._link_before(_NIL, value)
+
+    def push_front(self, value: T):
+        self._link_before(self._head, value)
+
+    def pop_back(self) -> T:
+        if self._tail == _NIL:
+            raise IndexError("pop_back from empty list")
+        return self._unlink(self._tail)
+
+    def pop_front(self) -> T:
+        if self._head == _NIL:
+            raise IndexError("pop_front from empty list")
+        return self._unlink(self._head)
+
+    def clear(self):
+        self._values = []
+        self._prev = array('l')
+        self._next = array('l')
+        self._head = _NIL
+        self._tail = _NIL
+        self._free = _NIL
+        self._size = 0
+
+    def insert(self, index: int, value: T):
+        if index < 0: index += self._size
+        if index > self._size: # allow appending at end
+             index = self._size
+        if index < 0: index = 0
+        pos = _NIL if index == self._size else self._slot_at(index)
+        self._link_before(pos, value)
+
+    def erase(self, index: int):
+        if index < 0: index += self._size
+        if not (0 <= index < self._size):
+            raise IndexError("list erase index out of range")
+        self._unlink(self._slot_at(index))
+
+    def swap(self, other: 'CompactList'):
+        if self is other:
+            return
+        for name in CompactList.__slots__:
+            mine, theirs = getattr(self, name), getattr(other, name)
+            setattr(self, name, theirs)
+            setattr(other, name, mine)
+
+    def shrink_to_fit(self):
+        """Compacts the columns into list order, dropping free slots.
+        Invalidates all iterators."""
+        values = list(self)
+        self.clear()
+        self.assign(values)
+
+    def capacity(self) -> int:
+        return len(self._values)
+
+    # --------------------- Iterator operations ---------------------
+    def begin(self) -> 'CompactListIterator':
+        return CompactListIterator(self, self._head)
+
+    def end(self) -> 'CompactListIterator':
+        return CompactListIterator(self, _NIL)
+
+    def insert_before(self, pos: 'CompactListIterator', value: T) -> 'CompactListIterator':
+        """Inserts before `pos` in O(1); returns an iterator to the new element."""
+        self._check_owner(pos)
+        return CompactListIterator(self, self._link_before(pos.current, value))
+
+    def erase_at(self, pos: 'CompactListIterator') -> 'CompactListIterator':
+        """Erases the element at `pos` in O(1); returns an iterator to the next one."""
+        self._check_owner(pos)
+        if pos.current == _NIL:
+            raise IndexError("erase_at(end())")
+        next = self._next[pos.current]
+        self._unlink(pos.current)
+        return CompactListIterator(self, next)
+
+    def splice(self, pos: 'CompactListIterator', first: 'CompactListIterator',
+               last: 'CompactListIterator | None' = None):
+        """
+        Moves [first, last) before `pos`, within this list, in O(1).
+        With `last` omitted only the element at `first` is moved.
+        No element is copied and all iterators stay valid.
+        `pos` must not lie inside [first, last).
+        """
+        self._check_owner(pos)
+        self._check_owner(first)
+        start = first.current
+        if start == _NIL:
+            return
+        if last is None:
+            stop = self._next[start]
+        else:
+            self._check_owner(last)
+            stop = last.current
+        if start == stop or pos.current == start or pos.current == stop:
+            return
+        end = self._tail if stop == _NIL else self._prev[stop]
+
+        # Detach [start, end]
+        before = self._prev[start]
+        if before == _NIL:
+            self._head = stop
+        else:
+            self._next[before] = stop
+        if stop == _NIL:
+            self._tail = before
+        else:
+            self._prev[stop] = before
+
+        # Re-attach before pos
+        target = pos.current
+        prev = self._tail if target == _NIL else self._prev[target]
+        self._prev[start] = prev
+        self._next[end] = target
+        if prev == _NIL:
+            self._head = start
+        else:
+            self._next[prev] = start
+        if target == _NIL:
+            self._tail = end
+        else:
+            self._prev[target] = end
+
+    def _check_owner(self, it: 'CompactListIterator'):
+        if it._list is not self:
+            raise ValueError("Iterator does not belong to this list")
+
+    # --------------------- Access ---------------------
+    def front(self) -> T:
+        if self._head == _NIL:
+            raise IndexError("front on empty list")
+        return self._values[self._head]
+
+    def back(self) -> T:
+        if self._tail == _NIL:
+            raise IndexError("back on empty list")
+        return self._values[self._tail]
+
+    def size(self) -> int: return self._size
+    def empty(self) -> bool: return self._size == 0
+
+    def __len__(self): return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        values = self._values
+        nxt = self._next
+        slot = self._head
+        while slot != _NIL:
+            yield values[slot]
+            slot = nxt[slot]
+
+    def __repr__(self):
+        data = ', '.join(repr(x) for x in self)
+        return f"CompactList[{self._size}]({data})"
+
+    # --------------------- Comparisons ---------------------
+    def __eq__(self, other): return list(self) == list(other)
+    def __ne__(self, other): return not (self == other)
+    def __lt__(self, other): return list(self) < list(other)
+    def __le__(self, other): return list(self) <= list(other)
+    def __gt__(self, other): return list(self) > list(other)
+    def __ge__(self, other): return list(self) >= list(other)
+
+
+class CompactListIterator:
+    """Bidirectional iterator holding a slot index; valid until that element is erased."""
+    __slots__ = ('_list', 'current')
+
+    def __init__(self, lst: CompactList, slot: int):
+        self._list = lst
+        self.current = slot
+
+    @property
+    def value(self) -> Any:
+        if self.current == _NIL:
+            raise IndexError("dereferencing end() iterator")
+        return self._list._values[self.current]
+
+    @value.setter
+    def value(self, v: Any):
+        if self.current == _NIL:
+            raise IndexError("dereferencing end() iterator")
+        self._list._values[self.current] = v
+
+    def __next__(self):
+        if self.current == _NIL:
+            raise StopIteration
+        val = self._list._values[self.current]
+        self.current = self._list._next[self.current]
+        return val
+
+    def __iter__(self):
+        return self
+
+    def next(self): # C++ style ++it
+        if self.current != _NIL:
+            self.current = self._list._next[self.current]
+        return self
+
+    def prev(self): # C++ style --it (--end() is the last element)
+        if self.current == _NIL:
+            self.current = self._list._tail
+        else:
+            self.current = self._list._prev[self.current]
+        return self
+
+    def copy(self) -> 'CompactListIterator':
+        return CompactListIterator(self._list, self.current)
+
+    def __eq__(self, other):
+        return (isinstance(other, CompactListIterator)
+                and self._list is other._list and self.current == other.current)
+
+    def __ne__(self, other):
+        return not (self == other)
@@ -12,18 +12,31 @@ class ListNode(Generic[T]):
         self.prev = prev
         self.next = next
 
-from cppbase import Sequence
+from cppbase import Sequence, NodePool
+from cppbase.pool import make_pool
 
 class List(Sequence, Generic[T]):
-    __slots__ = ('_head', '_tail', '_size')
+    __slots__ = ('_head', '_tail', '_size', '_pool')
 
-    def __init__(self, source: Iterable[T] | None = None):
+    def __init__(self, source: Iterable[T] | None = None, pool: NodePool | bool | None = None):
+        # pool=True gives this list a private NodePool; pass a NodePool(ListNode)
+        # to share recycled nodes between several lists.
+        self._pool = make_pool(pool, ListNode)
         self._head: ListNode[T] | None = None
         self._tail: ListNode[T] | None = None
         self._size = 0
         if source is not None:
             self.assign(source)
 
+    # --------------------- Allocator ---------------------
+    def get_allocator(self) -> NodePool | None:
+        return self._pool
+
+    def _new_node(self, value: T, prev: ListNode[T] | None, next: ListNode[T] | None) -> ListNode[T]:
+        if self._pool is None:
+            return ListNode(value, prev, next)
+        return self._pool.acquire(value, prev, next)
+
     # --------------------- Modifiers ---------------------
     def assign(self, source: Iterable[T] | int, value: T | None = None):
         self.clear()
@@ -35,7 +48,7 @@ class List(Sequence, Generic[T]):
                 self.push_back(x)
 
     def push_back(self, value: T):
-        new_node = ListNode(value, prev=self._tail, next=None)
+        new_node = self._new_node(value, self._tail, None)
         if self._tail:
             self._tail.next = new_node
         self._tail = new_node
@@ -44,7 +57,7 @@ class List(Sequence, Generic[T]):
         self._size += 1
 
     def push_front(self, value: T):
-        new_node = ListNode(value, prev=None, next=self._head)
+        new_node = self._new_node(value, None, self._head)
         if self._head:
             self._head.prev = new_node
         self._head = new_node
@@ -55,8 +68,9 @@ class List(Sequence, Generic[T]):
     def pop_back(self) -> T:
         if not self._tail:
             raise IndexError("pop_back from empty list")
-        val = self._tail.value
-        prev_node = self._tail.prev
+        node = self._tail
+        val = node.value
+        prev_node = node.prev
         if prev_node:
             prev_node.next = None
             self._tail = prev_node
@@ -64,13 +78,16 @@ class List(Sequence, Generic[T]):
             self._head = None
             self._tail = None
         self._size -= 1
+        if self._pool is not None:
+            self._pool.release(node)
         return val
 
     def pop_front(self) -> T:
         if not self._head:
             raise IndexError("pop_front from empty list")
-        val = self._head.value
-        next_node = self._head.next
+        node = self._head
+        val = node.value
+        next_node = node.next
         if next_node:
             next_node.prev = None
             self._head = next_node
@@ -78,11 +95,20 @@ class List(Sequence, Generic[T]):
             self._head = None
             self._tail = None
         self._size -= 1
+        if self._pool is not None:
+            self._pool.release(node)
         return val
 
     def clear(self):
         # In Python, clearing references is enough for GC
         # strict C++ might iterate and destroy, but here we just detach
+        # (unless a pool wants the nodes back).
+        if self._pool is not None:
+            curr = self._head
+            while curr:
+                next_node = curr.next
+                self._pool.release(curr)
+                curr = next_node
         self._head = None
         self._tail = None
         self._size = 0
@@ -115,7 +141,7 @@ class List(Sequence, Generic[T]):
         # curr is the node that will be AFTER the new node
         # previous node -> new_node -> curr
         prev_node = curr.prev # type: ignore
-        new_node = ListNode(value, prev=prev_node, next=curr)
+        new_node = self._new_node(value, prev_node, curr)
         if prev_node:
             prev_node.next = new_node
         curr.prev = new_node # type: ignore
@@ -152,6 +178,8 @@ class List(Sequence, Generic[T]):
             next_node.prev = prev_node
         
         self._size -= 1
+        if self._pool is not None:
+            self._pool.release(node_to_delete)
         
     def swap(self, other: 'List'):
         if self is other:
@@ -159,6 +187,7 @@ class List(Sequence, Generic[T]):
         (self._head, other._head) = (other._head, self._head)
         (self._tail, other._tail) = (other._tail, self._tail)
         (self._size, other._size) = (other._size, self._size)
+        (self._pool, other._pool) = (other._pool, self._pool) # Nodes go back where they came from
 
     # --------------------- Access ---------------------
     def front(self) -> T:
@@ -0,0 +1,66 @@
+import unittest
+from cpplist import CompactList, List
+
+class TestCompactList(unittest.TestCase):
+    def test_list_api(self):
+        l = CompactList([1, 2, 3])
+        l.push_front(0)
+        l.push_back(4)
+        self.assertEqual(list(l), [0, 1, 2, 3, 4])
+        self.assertEqual(l.pop_back(), 4)
+        self.assertEqual(l.pop_front(), 0)
+        l.insert(1, 99)
+        l.erase(-1)
+        self.assertEqual(list(l), [1, 99, 2])
+        self.assertEqual((l.front(), l.back(), l.size()), (1, 2, 3))
+        self.assertEqual(l, List([1, 99, 2]))
+        self.assertEqual(repr(l), "CompactList[3](1, 99, 2)")
+
+        with self.assertRaises(IndexError):
+            CompactList().pop_front()
+
+    def test_free_slots_reused(self):
+        l = CompactList(range(5))
+        l.erase(1)
+        l.erase(2)
+        self.assertEqual(l.capacity(), 5)
+        l.push_back(10)
+        l.push_front(11)
+        self.assertEqual(l.capacity(), 5)
+        self.assertEqual(list(l), [11, 0, 2, 4, 10])
+
+        l.shrink_to_fit()
+        self.assertEqual(l.capacity(), 5)
+        self.assertEqual(list(l), [11, 0, 2, 4, 10])
+
+    def test_stable_iterators(self):
+        l = CompactList([1, 2, 3])
+        it = l.begin().next()             # -> 2
+        l.push_front(0)
+        l.erase(3)                        # erase 3
+        l.insert_before(it, 5)
+        self.assertEqual(it.value, 2)
+        self.assertEqual(list(l), [0, 1, 5, 2])
+
+        nxt = l.erase_at(it)
+        self.assertEqual(nxt, l.end())
+        self.assertEqual(list(l), [0, 1, 5])
+        self.assertEqual(l.end().prev().value, 5)
+
+    def test_splice(self):
+        l = CompactList([1, 2, 3, 4, 5])
+        first = l.begin().next()          # 2
+        last = first.copy().next().next() # 4
+        l.splice(l.end(), first, last)
+        self.assertEqual(list(l), [1, 4, 5, 2, 3])
+        self.assertEqual(l.back(), 3)
+
+        l.splice(l.begin(), l.end().prev())
+        self.assertEqual(list(l), [3, 1, 4, 5, 2])
+        self.assertEqual(first.value, 2)
+
+        with self.assertRaises(ValueError):
+            l.splice(CompactList([9]).begin(), l.begin())
+
+if __name__ == '__main__':
+    unittest.main()
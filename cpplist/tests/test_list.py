@@ -1,5 +1,6 @@
+from cppbase import NodePool
 import unittest
-from cpplist.list import List
+from cpplist.list import List, ListNode
 
 class TestList(unittest.TestCase):
     def test_init_and_push(self):
@@ -56,5 +57,44 @@ class TestList(unittest.TestCase):
         self.assertNotEqual(l1, l3)
         self.assertTrue(l1 < l3)
 
+    def test_node_pool(self):
+        l = List([1, 2, 3], pool=True)
+        pool = l.get_allocator()
+        self.assertEqual(pool.stats()['misses'], 3)
+
+        l.pop_front()
+        l.erase(1)
+        self.assertEqual(pool.free_count(), 2)
+
+        l.push_back(4)
+        l.insert(0, 0)
+        self.assertEqual(list(l), [0, 2, 4])
+        self.assertEqual(pool.stats()['hits'], 2)
+        self.assertEqual(pool.hit_rate(), 2 / 5)
+
+        l.clear()
+        self.assertEqual(pool.free_count(), 3)
+
+    def test_shared_node_pool(self):
+        pool = NodePool(ListNode)
+        a = List([1, 2], pool=pool)
+        b = List(pool=pool)
+        a.pop_back()
+        b.push_back(5)
+        self.assertEqual(list(b), [5])
+        self.assertEqual(pool.stats()['hits'], 1)
+        with self.assertRaises(TypeError):
+            List(pool=NodePool(object))
+
+    def test_swap_exchanges_pools(self):
+        a = List([1, 2], pool=True)
+        b = List([3])
+        pa = a.get_allocator()
+        a.swap(b)
+        self.assertIs(b.get_allocator(), pa)
+        self.assertIsNone(a.get_allocator())
+        b.pop_front()
+        self.assertEqual(pa.free_count(), 1)
+
 if __name__ == '__main__':
     unittest.main()
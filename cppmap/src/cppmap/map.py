@@ -15,10 +15,11 @@ class _Node(Generic[K, V]):
         self.color = color # True = Red, False = Black
         self.parent = parent
 
-from cppbase import Associative
+from cppbase import Associative, NodePool
+from cppbase.pool import make_pool
 
 class Map(Associative, Generic[K, V]):
-    __slots__ = ('_root', '_size')
+    __slots__ = ('_root', '_size', '_pool')
     
     # Red-Black Tree Implementation
     # For brevity in this initial version, we use a standard BST approach for insertion/lookup
@@ -28,7 +29,9 @@ class Map(Associative, Generic[K, V]):
     # 
     # UPDATE: We will implement standard BST. It is O(N) worst case but O(log N) average.
     
-    def __init__(self, source=None):
+    def __init__(self, source=None, pool: NodePool | bool | None = None):
+        # Opt-in node recycling: pool=True (private) or a shared NodePool(_Node).
+        self._pool = make_pool(pool, _Node)
         self._root: _Node[K,V] | None = None
         self._size = 0
         
@@ -41,13 +44,22 @@ class Map(Associative, Generic[K, V]):
                 for k, v in source:
                     self[k] = v
 
+    # --------------------- Allocator ---------------------
+    def get_allocator(self) -> NodePool | None:
+        return self._pool
+
+    def _new_node(self, key: K, value: V, color: bool, parent: _Node[K,V] | None) -> _Node[K,V]:
+        if self._pool is None:
+            return _Node(key, value, color, parent)
+        return self._pool.acquire(key, value, color, parent)
+
     # --------------------- Modifiers ---------------------
     def insert(self, key: K, value: V):
         self[key] = value
 
     def __setitem__(self, key: K, value: V):
         if not self._root:
-            self._root = _Node(key, value, False)
+            self._root = self._new_node(key, value, False, None)
             self._size += 1
             return
 
@@ -58,7 +70,7 @@ class Map(Associative, Generic[K, V]):
                 if curr.left:
                     curr = curr.left
                 else:
-                    curr.left = _Node(key, value, True, curr)
+                    curr.left = self._new_node(key, value, True, curr)
                     self._size += 1
                     # self._rebalance_insert(curr.left) # TODO: Implement RB fixup
                     break
@@ -66,7 +78,7 @@ class Map(Associative, Generic[K, V]):
                 if curr.right:
                     curr = curr.right
                 else:
-                    curr.right = _Node(key, value, True, curr)
+                    curr.right = self._new_node(key, value, True, curr)
                     self._size += 1
                     break
             else:
@@ -82,8 +94,19 @@ class Map(Associative, Generic[K, V]):
         # BST Deletion logic
         self._delete_node(node)
         self._size -= 1
+        if self._pool is not None:
+            self._pool.release(node)
 
     def clear(self):
+        if self._pool is not None and self._root:
+            stack = [self._root]
+            while stack:
+                node = stack.pop()
+                if node.left:
+                    stack.append(node.left)
+                if node.right:
+                    stack.append(node.right)
+                self._pool.release(node)
         self._root = None
         self._size = 0
 
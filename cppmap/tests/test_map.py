@@ -47,5 +47,16 @@ class TestMap(unittest.TestCase):
         self.assertEqual(m.upper_bound(30), 40)
         self.assertEqual(m.upper_bound(40), None)
 
+    def test_node_pool(self):
+        m = Map({2: 'b', 1: 'a', 3: 'c'}, pool=True)
+        pool = m.get_allocator()
+        m.erase(2)
+        m[4] = 'd'
+        self.assertEqual(list(m.items()), [(1, 'a'), (3, 'c'), (4, 'd')])
+        self.assertEqual(pool.stats()['hits'], 1)
+
+        m.clear()
+        self.assertEqual(pool.free_count(), 3)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import TypeVar, Generic, Tuple, Iterator, Any, List
-from cppbase import Associative
+from cppbase import Associative, EqualRange
 
 K = TypeVar('K')
 V = TypeVar('V')
@@ -19,12 +19,17 @@ class MultiMap(Associative, Generic[K, V]):
     """
     Sorted associative container that contains key-value pairs with NOT unique keys.
     Keys are sorted. Multiple elements with the same key are allowed.
+
+    With compact=True each key gets a single node whose `value` is the list of
+    its mapped values (in insertion order), so count() is O(log N) and
+    equal_range() returns a lazy EqualRange view.
     """
-    __slots__ = ('_root', '_size')
+    __slots__ = ('_root', '_size', '_compact')
     
-    def __init__(self, source=None):
+    def __init__(self, source=None, compact: bool = False):
         self._root: _Node[K,V] | None = None
         self._size = 0
+        self._compact = compact
         
         if source is not None:
             # Source should be iterable of (k, v)
@@ -38,6 +43,9 @@ class MultiMap(Associative, Generic[K, V]):
     # --------------------- Modifiers ---------------------
     def insert(self, key: K, value: V):
         """Inserts element, even if key exists."""
+        if self._compact:
+            self._insert_grouped(key, value)
+            return
         if not self._root:
             self._root = _Node(key, value)
             self._size += 1
@@ -66,6 +74,13 @@ class MultiMap(Associative, Generic[K, V]):
     
     def erase(self, key: K) -> int:
         """Removes ALL elements with key. Returns count removed."""
+        if self._compact:
+            node = self._find_first_node(key)
+            if not node:
+                return 0
+            self._delete_node(node)
+            self._size -= len(node.value)
+            return len(node.value)
         count = 0
         while True:
             node = self._find_first_node(key)
@@ -96,9 +111,14 @@ class MultiMap(Associative, Generic[K, V]):
         node = self._find_first_node(key)
         # In C++, find returns iterator to *one* of the elements.
         # Pythonic: we'll return the (key, value)
+        if node and self._compact:
+            return (node.key, node.value[0])
         return (node.key, node.value) if node else None
 
     def count(self, key: K) -> int:
+        if self._compact:
+            node = self._find_first_node(key)
+            return len(node.value) if node else 0
         c = 0
         # Iterate and count matches
         # This is O(N) worst case in standard BST without metadata.
@@ -124,6 +144,14 @@ class MultiMap(Associative, Generic[K, V]):
 
     def equal_range(self, key: K) -> Iterator[Tuple[K,V]]:
         """Returns iterator yielding all pairs satisfying key."""
+        if self._compact:
+            return EqualRange(self._find_first_node(key), mapped=True)
+        return self._equal_range_scan(key)
+
+    def is_compact(self) -> bool:
+        return self._compact
+
+    def _equal_range_scan(self, key: K) -> Iterator[Tuple[K,V]]:
         stack = []
         curr = self._root
         while True:
@@ -156,7 +184,11 @@ class MultiMap(Associative, Generic[K, V]):
                 curr = curr.left
             elif stack:
                 curr = stack.pop()
-                yield curr.key
+                if self._compact:
+                    for _ in curr.value:
+                        yield curr.key
+                else:
+                    yield curr.key
                 curr = curr.right
             else:
                 break
@@ -171,12 +203,39 @@ class MultiMap(Associative, Generic[K, V]):
                 curr = curr.left
             elif stack:
                 curr = stack.pop()
-                yield (curr.key, curr.value)
+                if self._compact:
+                    for v in curr.value:
+                        yield (curr.key, v)
+                else:
+                    yield (curr.key, curr.value)
                 curr = curr.right
             else:
                 break
 
     # --------------------- Internal ---------------------
+    def _insert_grouped(self, key: K, value: V):
+        self._size += 1
+        if not self._root:
+            self._root = _Node(key, [value])
+            return
+        curr = self._root
+        while True:
+            if key < curr.key:
+                if curr.left:
+                    curr = curr.left
+                else:
+                    curr.left = _Node(key, [value], curr)
+                    return
+            elif key > curr.key:
+                if curr.right:
+                    curr = curr.right
+                else:
+                    curr.right = _Node(key, [value], curr)
+                    return
+            else:
+                curr.value.append(value)
+                return
+
     def _find_first_node(self, key: K) -> _Node[K,V] | None:
         curr = self._root
         found = None
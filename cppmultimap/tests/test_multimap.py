@@ -47,5 +47,23 @@ class TestMultiMap(unittest.TestCase):
         values = sorted([v for k, v in er])
         self.assertEqual(values, ['x', 'y'])
 
+    def test_compact_mode(self):
+        mm = MultiMap(compact=True)
+        mm.insert(2, 'x')
+        mm.insert(1, 'a')
+        mm.insert(1, 'b')
+        self.assertEqual(mm.count(1), 2)
+        self.assertEqual(list(mm.items()), [(1, 'a'), (1, 'b'), (2, 'x')])
+        self.assertEqual(list(mm), [1, 1, 2])
+
+        r = mm.equal_range(1)
+        mm.insert(1, 'c') # The view is lazy
+        self.assertEqual(list(r), [(1, 'a'), (1, 'b'), (1, 'c')])
+        self.assertEqual(r[-1], (1, 'c'))
+        self.assertEqual(mm.find(1), (1, 'a'))
+
+        self.assertEqual(mm.erase(1), 3)
+        self.assertEqual(mm.size(), 1)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import TypeVar, Generic, Iterator, Any, List
-from cppbase import Associative
+from cppbase import Associative, EqualRange
 
 T = TypeVar('T')
 
@@ -13,16 +13,30 @@ class _Node(Generic[T]):
         self.right: _Node[T] | None = None
         self.parent = parent
 
+class _CountedNode(Generic[T]):
+    __slots__ = ('key', 'count', 'left', 'right', 'parent')
+
+    def __init__(self, key: T, parent: _CountedNode[T] | None = None):
+        self.key = key
+        self.count = 1
+        self.left: _CountedNode[T] | None = None
+        self.right: _CountedNode[T] | None = None
+        self.parent = parent
+
 class MultiSet(Associative, Generic[T]):
     """
     Sorted associative container that contains non-unique keys.
     Keys are sorted. Multiple elements with the same key are allowed.
+
+    With compact=True each distinct key is stored once with a repeat counter,
+    so count() is O(log N) and memory does not grow with duplicates.
     """
-    __slots__ = ('_root', '_size')
+    __slots__ = ('_root', '_size', '_compact')
     
-    def __init__(self, source=None):
+    def __init__(self, source=None, compact: bool = False):
         self._root: _Node[T] | None = None
         self._size = 0
+        self._compact = compact
         
         if source is not None:
             for x in source:
@@ -30,6 +44,9 @@ class MultiSet(Associative, Generic[T]):
 
     # --------------------- Modifiers ---------------------
     def insert(self, key: T):
+        if self._compact:
+            self._insert_counted(key)
+            return
         if not self._root:
             self._root = _Node(key)
             self._size += 1
@@ -54,6 +71,13 @@ class MultiSet(Associative, Generic[T]):
                     break
     
     def erase(self, key: T) -> int:
+        if self._compact:
+            node = self._find_first_node(key)
+            if not node:
+                return 0
+            self._delete_node(node)
+            self._size -= node.count
+            return node.count
         count = 0
         while True:
             node = self._find_first_node(key)
@@ -74,6 +98,9 @@ class MultiSet(Associative, Generic[T]):
         return node.key if node else None
 
     def count(self, key: T) -> int:
+        if self._compact:
+            node = self._find_first_node(key)
+            return node.count if node else 0
         c = 0
         stack = []
         curr = self._root
@@ -95,6 +122,15 @@ class MultiSet(Associative, Generic[T]):
     def contains(self, key: T) -> bool:
         return self._find_first_node(key) is not None
 
+    def equal_range(self, key: T) -> Iterator[T]:
+        """All elements equal to key (a lazy EqualRange view in compact mode)."""
+        if self._compact:
+            return EqualRange(self._find_first_node(key))
+        return iter([key] * self.count(key))
+
+    def is_compact(self) -> bool:
+        return self._compact
+
     def empty(self) -> bool: return self._size == 0
     def size(self) -> int: return self._size
     def __len__(self) -> int: return self._size
@@ -110,12 +146,39 @@ class MultiSet(Associative, Generic[T]):
                 curr = curr.left
             elif stack:
                 curr = stack.pop()
-                yield curr.key
+                if self._compact:
+                    for _ in range(curr.count):
+                        yield curr.key
+                else:
+                    yield curr.key
                 curr = curr.right
             else:
                 break
 
     # --------------------- Internal ---------------------
+    def _insert_counted(self, key: T):
+        self._size += 1
+        if not self._root:
+            self._root = _CountedNode(key)
+            return
+        curr = self._root
+        while True:
+            if key < curr.key:
+                if curr.left:
+                    curr = curr.left
+                else:
+                    curr.left = _CountedNode(key, curr)
+                    return
+            elif key > curr.key:
+                if curr.right:
+                    curr = curr.right
+                else:
+                    curr.right = _CountedNode(key, curr)
+                    return
+            else:
+                curr.count += 1
+                return
+
     def _find_first_node(self, key: T) -> _Node[T] | None:
         curr = self._root
         while curr:
@@ -29,5 +29,22 @@ class TestMultiSet(unittest.TestCase):
         self.assertTrue(ms.contains(200))
         self.assertFalse(ms.contains(100))
 
+    def test_compact_mode(self):
+        ms = MultiSet([3, 1, 3, 3, 2], compact=True)
+        for _ in range(1000):
+            ms.insert(2)
+        self.assertEqual(ms.count(2), 1001)
+        self.assertEqual(ms.size(), 1005)
+        self.assertEqual(list(MultiSet([3, 1, 3], compact=True)), [1, 3, 3])
+
+        r = ms.equal_range(3)
+        self.assertEqual(len(r), 3)
+        self.assertEqual(list(r), [3, 3, 3])
+        self.assertEqual(len(ms.equal_range(99)), 0)
+
+        self.assertEqual(ms.erase(2), 1001)
+        self.assertEqual(ms.size(), 4)
+        self.assertEqual(list(ms), [1, 3, 3, 3])
+
 if __name__ == '__main__':
     unittest.main()
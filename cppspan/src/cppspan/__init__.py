@@ -1,3 +1,4 @@
 from .span import Span
+from .mdspan import MdSpan
 
-__all__ = ['Span']
+__all__ = ['Span', 'MdSpan']
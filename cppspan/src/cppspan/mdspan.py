@@ -0,0 +1,215 @@
+from __future__ import annotations
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+from .span import Span
+
+Index = Union[int, slice, Tuple[Union[int, slice], ...]]
+
+
+def _layout_strides(shape: Tuple[int, ...], layout: str) -> Tuple[int, ...]:
+    strides = [0] * len(shape)
+    step = 1
+    order = reversed(range(len(shape))) if layout == 'right' else range(len(shape))
+    for r in order:
+        strides[r] = step
+        step *= shape[r]
+    return tuple(strides)
+
+
+class MdSpan:
+    """
+    A Python implementation of C++23 std::mdspan.
+
+    A multi-dimensional, non-owning view: `shape` (the extents) plus a layout
+    mapping that turns an index tuple into a position in the flat source,
+    `offset + sum(i[r] * strides[r])`. `layout='right'` is row-major
+    (layout_right), `'left'` column-major (layout_left); explicit `strides`
+    give layout_stride. Slicing with ranges produces another MdSpan over the
+    same memory (submdspan); integer indices drop that dimension.
+
+    The source is anything Span accepts; buffer-backed sources are indexed
+    through their memoryview, and contiguous row-major views convert with
+    one `memoryview.cast` in `tolist` / `tobytes`.
+    """
+    __slots__ = ('_span', '_flat', '_offset', '_shape', '_strides')
+
+    def __init__(self, data: Any, shape: Optional[Sequence[int]] = None,
+                 strides: Optional[Sequence[int]] = None, layout: str = 'right',
+                 offset: int = 0):
+        span = data if isinstance(data, Span) else Span(data)
+        if shape is None:
+            view = getattr(data, 'shape', None) if not isinstance(data, Span) else None
+            shape = tuple(view) if view is not None else (len(span),)
+        shape = tuple(int(n) for n in shape)
+        if any(n < 0 for n in shape):
+            raise ValueError(f"MdSpan extents must be non-negative, got {shape}")
+        if strides is None:
+            if layout not in ('right', 'left'):
+                raise ValueError(f"unknown layout {layout!r} (expected 'right' or 'left')")
+            strides = _layout_strides(shape, layout)
+        elif len(strides) != len(shape):
+            raise ValueError("strides must have one entry per extent")
+        self._span = span
+        self._flat = span._view if span._view is not None else span
+        self._offset = offset
+        self._shape = shape
+        self._strides = tuple(int(s) for s in strides)
+        if self.size():
+            lo = offset + sum(min(0, (n - 1) * s) for n, s in zip(shape, self._strides))
+            hi = offset + sum(max(0, (n - 1) * s) for n, s in zip(shape, self._strides))
+            if lo < 0 or hi >= len(span):
+                raise IndexError(f"MdSpan of extents {shape} does not fit a source of size {len(span)}")
+
+    def _derive(self, offset: int, shape: Tuple[int, ...], strides: Tuple[int, ...]) -> MdSpan:
+        m = MdSpan.__new__(MdSpan)
+        m._span = self._span
+        m._flat = self._flat
+        m._offset = offset
+        m._shape = shape
+        m._strides = strides
+        return m
+
+    # --------------------- Extents ---------------------
+    def rank(self) -> int:
+        return len(self._shape)
+
+    def extents(self) -> Tuple[int, ...]:
+        return self._shape
+
+    def extent(self, r: int) -> int:
+        return self._shape[r]
+
+    def size(self) -> int:
+        n = 1
+        for e in self._shape:
+            n *= e
+        return n
+
+    def empty(self) -> bool:
+        return self.size() == 0
+
+    def __len__(self) -> int:
+        return self._shape[0] if self._shape else 1
+
+    def size_bytes(self) -> int:
+        if not isinstance(self._flat, memoryview):
+            raise TypeError("size_bytes() needs a buffer-backed MdSpan (element size is unknown)")
+        return self.size() * self._flat.itemsize
+
+    # --------------------- Layout Mapping ---------------------
+    def strides(self) -> Tuple[int, ...]:
+        return self._strides
+
+    def stride(self, r: int) -> int:
+        return self._strides[r]
+
+    def mapping(self, *indices: int) -> int:
+        """Position in the flat source of the element at `indices`."""
+        if len(indices) != len(self._shape):
+            raise IndexError(f"expected {len(self._shape)} indices, got {len(indices)}")
+        pos = self._offset
+        for i, n, s in zip(indices, self._shape, self._strides):
+            if i < 0: i += n
+            if not (0 <= i < n):
+                raise IndexError("MdSpan index out of range")
+            pos += i * s
+        return pos
+
+    def is_contiguous(self) -> bool:
+        """True for an exhaustive row-major mapping over unit-stride memory."""
+        return self._strides == _layout_strides(self._shape, 'right')
+
+    # --------------------- Access ---------------------
+    def _normalize(self, key: Index) -> Tuple[Union[int, slice], ...]:
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > len(self._shape):
+            raise IndexError(f"too many indices for MdSpan of rank {len(self._shape)}")
+        return key + (slice(None),) * (len(self._shape) - len(key))
+
+    def __getitem__(self, key: Index) -> Any:
+        key = self._normalize(key)
+        if all(isinstance(k, int) for k in key):
+            return self._flat[self.mapping(*key)]
+        offset = self._offset
+        shape: List[int] = []
+        strides: List[int] = []
+        for k, n, s in zip(key, self._shape, self._strides):
+            if isinstance(k, slice):
+                start, stop, step = k.indices(n)
+                offset += start * s
+                shape.append(len(range(start, stop, step)))
+                strides.append(s * step)
+            else:
+                if k < 0: k += n
+                if not (0 <= k < n):
+                    raise IndexError("MdSpan index out of range")
+                offset += k * s
+        return self._derive(offset, tuple(shape), tuple(strides))
+
+    def __setitem__(self, key: Index, value: Any):
+        key = self._normalize(key)
+        if not all(isinstance(k, int) for k in key):
+            raise TypeError("MdSpan assignment takes a full index tuple")
+        self._flat[self.mapping(*key)] = value
+
+    def __iter__(self) -> Iterator[Any]:
+        # Along the first extent, like iterating a nested list
+        if not self._shape:
+            yield self._flat[self._offset]
+            return
+        for i in range(self._shape[0]):
+            yield self[i]
+
+    # --------------------- Bulk Conversions ---------------------
+    def _row(self, start: int, n: int, s: int) -> List[Any]:
+        flat = self._flat
+        if isinstance(flat, memoryview) and s > 0 and n:
+            return flat[start:start + (n - 1) * s + 1:s].tolist()
+        return [flat[start + k * s] for k in range(n)]
+
+    def _nested(self, offset: int, dim: int) -> Any:
+        n, s = self._shape[dim], self._strides[dim]
+        if dim == len(self._shape) - 1:
+            return self._row(offset, n, s)
+        return [self._nested(offset + k * s, dim + 1) for k in range(n)]
+
+    def _contiguous_view(self) -> Optional[memoryview]:
+        flat = self._flat
+        if isinstance(flat, memoryview) and flat.c_contiguous and self.is_contiguous():
+            return flat[self._offset:self._offset + self.size()]
+        return None
+
+    def tolist(self) -> Any:
+        """Nested lists in row-major order (a scalar for rank 0)."""
+        if not self._shape:
+            return self._flat[self._offset]
+        view = self._contiguous_view()
+        if view is not None and self.size():
+            fmt = view.format
+            return view.cast('B').cast(fmt, self._shape).tolist()
+        return self._nested(self._offset, 0)
+
+    def tobytes(self) -> bytes:
+        """The elements' bytes in row-major order."""
+        if not isinstance(self._flat, memoryview):
+            raise TypeError("MdSpan is not backed by a buffer")
+        view = self._contiguous_view()
+        if view is not None:
+            return view.tobytes()
+        rows: List[bytes] = []
+        self._collect_rows(self._offset, 0, rows)
+        return b''.join(rows)
+
+    def _collect_rows(self, offset: int, dim: int, rows: List[bytes]):
+        n, s = (self._shape[dim], self._strides[dim]) if self._shape else (1, 1)
+        if dim >= len(self._shape) - 1:
+            if n and s > 0:
+                rows.append(self._flat[offset:offset + (n - 1) * s + 1:s].tobytes())
+            else:
+                rows.extend(self._flat[offset + k * s:offset + k * s + 1].tobytes() for k in range(n))
+            return
+        for k in range(n):
+            self._collect_rows(offset + k * s, dim + 1, rows)
+
+    def __repr__(self) -> str:
+        return f"MdSpan(extents={self._shape}, strides={self._strides})"
@@ -1,48 +1,112 @@
 from __future__ import annotations
-from typing import TypeVar, Generic, Sequence, Iterator, Any, overload
+from typing import TypeVar, Generic, Sequence, Iterator, Any, List, Optional, overload
+from array import array
+import mmap
+import sys
 from cppbase import Sequence as BaseSequence
+from cppbase.buffer import check_dtype, TYPECODES as _TYPECODES
 
 T = TypeVar('T')
 
+_NATIVE = '<' if sys.byteorder == 'little' else '>'
+
+
+def _flatten(view: memoryview, dtype: Optional[str] = None) -> memoryview:
+    """1-D view of a buffer with a plain struct format, reinterpreted as dtype if given."""
+    fmt = view.format
+    if len(fmt) == 2 and fmt[0] in '@=' + _NATIVE:
+        fmt = fmt[1]
+    if dtype is not None and dtype != fmt:
+        if not view.c_contiguous:
+            raise ValueError("reinterpreting a Span requires a contiguous buffer")
+        return view.cast('B').cast(dtype)
+    if view.ndim == 1 and view.format == fmt:
+        return view
+    if not view.c_contiguous:
+        raise ValueError("Span requires a C-contiguous buffer")
+    return view.cast('B') if fmt == 'B' else view.cast('B').cast(fmt)
+
+
+def _as_memoryview(data: Any) -> Optional[memoryview]:
+    """A memoryview over data if it exposes a buffer, else None (generic sequence)."""
+    if isinstance(data, (memoryview, bytes, bytearray, array, mmap.mmap)):
+        return memoryview(data)
+    if isinstance(data, (list, tuple, str)):
+        return None
+    # cpparray.Array / InplaceVector / StringView expose memoryview();
+    # __buffer__ covers NumericVector before Python 3.12
+    for name in ('memoryview', '__buffer__'):
+        method = getattr(data, name, None)
+        if method is not None:
+            try:
+                return method() if name == 'memoryview' else method(0)
+            except TypeError: # e.g. untyped storage
+                return None
+    try:
+        return memoryview(data) # NumPy arrays, ctypes arrays, ...
+    except TypeError:
+        return None
+
+
 class Span(BaseSequence, Generic[T]):
     """
     A Python implementation of C++ std::span.
     Top-level view over a contiguous sequence (list, array, tuple, vector, etc.).
     Does not own the data.
+
+    Objects that expose a buffer (bytes, bytearray, array.array, mmap,
+    memoryview, NumPy arrays, typed cpparray.Array / NumericVector) are
+    viewed through a `memoryview`: element access, strided slicing,
+    `tobytes` and `tolist` then run in C, and slices and `reshape` never
+    copy. Other sequences are indexed directly.
     """
-    __slots__ = ('_data', '_offset', '_count')
+    __slots__ = ('_data', '_offset', '_count', '_step', '_view')
 
-    def __init__(self, data: Any, offset: int = 0, count: int = -1):
+    def __init__(self, data: Any, offset: int = 0, count: int = -1, dtype: Optional[str] = None):
         """
         Construct a Span from a container or another Span.
-        
+
         Args:
-            data: The source container (Sequence) or another Span.
+            data: The source container (Sequence), a buffer, or another Span.
             offset: Start index in the source.
             count: Number of elements. -1 means "until the end".
+            dtype: For buffers, an array typecode to reinterpret the bytes as.
         """
         # Unwrap if data is already a Span to avoid nesting chains
         if isinstance(data, Span):
             self._data = data._data
             base_offset = data._offset
             base_count = data._count
-            
+            self._step = data._step
+            view = data._view
+            if dtype is not None:
+                if view is None:
+                    raise TypeError("dtype requires a buffer-backed Span")
+                view = _flatten(view, check_dtype(dtype))
+                base_count = len(view)
+
             # Validate and adjust bounds relative to the parent Span
             if offset < 0: offset = 0
-            if offset > base_count: 
+            if offset > base_count:
                 raise IndexError(f"Span offset {offset} out of range for source span of size {base_count}")
-            
-            self._offset = base_offset + offset
+
+            self._offset = base_offset + offset * self._step
             max_available = base_count - offset
         else:
             self._data = data
-            container_len = len(data)
-            
+            view = _as_memoryview(data)
+            if view is not None:
+                view = _flatten(view, check_dtype(dtype))
+            elif dtype is not None:
+                raise TypeError("dtype requires a buffer-protocol source")
+            container_len = len(data) if view is None else len(view)
+
             if offset < 0: offset = 0
             if offset > container_len:
                 raise IndexError(f"Span offset {offset} out of range for container of size {container_len}")
-                
+
             self._offset = offset
+            self._step = 1
             max_available = container_len - offset
 
         if count == -1:
@@ -52,11 +116,47 @@ class Span(BaseSequence, Generic[T]):
                 raise IndexError(f"Span count {count} exceeds available elements {max_available}")
             self._count = count
 
+        # Buffer-backed spans keep a view of exactly their elements
+        if view is not None and (offset or self._count != len(view)):
+            view = view[offset:offset + self._count]
+        self._view = view
+
+    def _derive(self, offset: int, count: int, step: int, view: Optional[memoryview]) -> Span[T]:
+        span = Span.__new__(Span)
+        span._data = self._data
+        span._offset = offset
+        span._count = count
+        span._step = step
+        span._view = view
+        return span
+
     # --------------------- Iteration ---------------------
     def __iter__(self) -> Iterator[T]:
+        if self._view is not None:
+            return iter(self._view)
+        items = self._native_items()
+        return iter(items) if items is not None else self._iter_items()
+
+    def _bounds(self) -> slice:
+        # The span's elements as a slice of the source
+        step = self._step
+        if not self._count:
+            return slice(self._offset, self._offset, 1)
+        stop = self._offset + (self._count - 1) * step + (1 if step > 0 else -1)
+        return slice(self._offset, stop if stop >= 0 else None, step)
+
+    def _native_items(self) -> Optional[list]:
+        # Lists and tuples slice in C, which beats indexing element by element
+        data = self._data
+        if isinstance(data, (list, tuple)):
+            return data[self._bounds()]
+        return None
+
+    def _iter_items(self) -> Iterator[T]:
         # Iterate over the virtual slice
+        data, offset, step = self._data, self._offset, self._step
         for i in range(self._count):
-            yield self._data[self._offset + i]
+            yield data[offset + i * step]
 
     def __len__(self) -> int:
         return self._count
@@ -65,20 +165,25 @@ class Span(BaseSequence, Generic[T]):
     def __getitem__(self, index: int | slice) -> T | Span[T]:
         if isinstance(index, slice):
             start, stop, step = index.indices(self._count)
-            if step != 1:
-                raise ValueError("Span currently supports only contiguous slicing (step=1)")
-            return Span(self._data, self._offset + start, stop - start)
-        
+            count = len(range(start, stop, step))
+            view = self._view[index] if self._view is not None else None # Strided memoryview
+            return self._derive(self._offset + start * self._step, count, self._step * step, view)
+
         if index < 0: index += self._count
         if not (0 <= index < self._count):
             raise IndexError("Span index out of range")
-        return self._data[self._offset + index]
+        if self._view is not None:
+            return self._view[index]
+        return self._data[self._offset + index * self._step]
 
     def __setitem__(self, index: int, value: T):
         if index < 0: index += self._count
         if not (0 <= index < self._count):
             raise IndexError("Span index out of range")
-        self._data[self._offset + index] = value
+        if self._view is not None:
+            self._view[index] = value
+        else:
+            self._data[self._offset + index * self._step] = value
 
     def front(self) -> T:
         if self._count == 0: raise IndexError("front() on empty Span")
@@ -92,11 +197,184 @@ class Span(BaseSequence, Generic[T]):
         # Best effort return of underlying data structure
         return self._data
 
+    # --------------------- Buffer Access ---------------------
+    def memoryview(self) -> memoryview:
+        """The zero-copy memoryview over a buffer-backed span's elements."""
+        if self._view is None:
+            raise TypeError("Span is not backed by a buffer")
+        return self._view
+
+    def dtype(self) -> Optional[str]:
+        """Element typecode of a buffer-backed span (None for generic sequences)."""
+        return None if self._view is None else self._view.format
+
+    def tobytes(self) -> bytes:
+        return self.memoryview().tobytes()
+
+    def tolist(self) -> List[T]:
+        if self._view is not None:
+            return self._view.tolist()
+        items = self._native_items()
+        return list(items) if items is not None else list(self._iter_items())
+
+    def as_bytes(self) -> Span[int]:
+        """std::as_bytes: the same contiguous memory viewed as unsigned bytes."""
+        view = self.memoryview()
+        if not view.c_contiguous:
+            raise ValueError("as_bytes requires a contiguous Span")
+        return self._derive(0, view.nbytes, 1, view.cast('B'))
+
+    def reshape(self, *shape: int, layout: str = 'right') -> 'MdSpan':
+        """An MdSpan over this span's elements with the given extents (no copy)."""
+        from .mdspan import MdSpan
+        if len(shape) == 1 and isinstance(shape[0], (tuple, list)):
+            shape = tuple(shape[0])
+        return MdSpan(self, shape, layout=layout)
+
+    # --------------------- Bulk Operations ---------------------
+    # Buffer-backed spans use memoryview slice assignment (memmove) and
+    # memoryview.tolist(); list / tuple sources use slice operations; any
+    # other source falls back to an element loop.
+    def fill(self, value: T):
+        """Assigns value to every element."""
+        n = self._count
+        if not n:
+            return
+        view = self._view
+        if view is not None:
+            view[0] = value
+            filled = 1
+            while filled < n: # Doubling copies: O(log n) memmoves
+                chunk = min(filled, n - filled)
+                view[filled:filled + chunk] = view[0:chunk]
+                filled += chunk
+        elif isinstance(self._data, list):
+            self._data[self._bounds()] = [value] * n
+        else:
+            for i in range(n):
+                self[i] = value
+
+    def _source_view(self, source: Any) -> Optional[memoryview]:
+        # A buffer with this span's element format, or None
+        if isinstance(source, Span):
+            view = source._view
+        else:
+            view = _as_memoryview(source)
+            if view is not None:
+                try:
+                    view = _flatten(view)
+                except ValueError:
+                    return None
+        if view is not None and view.format == self._view.format:
+            return view
+        return None
+
+    def copy_from(self, source: Any) -> int:
+        """
+        Copies the elements of source into the start of this span (std::copy
+        into span.begin()) and returns how many were copied. Raises
+        ValueError if source is longer than the span.
+        """
+        view = self._view
+        src = self._source_view(source) if view is not None else None
+        if src is None:
+            if isinstance(source, Span):
+                src = source.tolist()
+            elif not isinstance(source, (list, tuple)):
+                src = list(source)
+            else:
+                src = source
+            if view is not None and view.format in _TYPECODES:
+                src = array(view.format, src)
+        n = len(src)
+        if n > self._count:
+            raise ValueError(f"cannot copy {n} elements into a Span of size {self._count}")
+        if view is not None and isinstance(src, (memoryview, array)):
+            view[:n] = src # memmove (memoryview copes with overlapping views)
+        elif view is None and isinstance(self._data, list):
+            self._data[self[:n]._bounds()] = list(src)
+        else:
+            for i in range(n):
+                self[i] = src[i]
+        return n
+
+    def copy_to(self, dest: Any) -> int:
+        """Copies this span's elements to the start of dest; returns the count."""
+        if not isinstance(dest, Span):
+            if _as_memoryview(dest) is None and not callable(getattr(dest, '__setitem__', None)):
+                raise TypeError("copy_to requires an indexable destination")
+            dest = Span(dest)
+        return dest.copy_from(self)
+
+    def _comparable(self, other: Any) -> Optional[Any]:
+        if isinstance(other, Span):
+            return other
+        if isinstance(other, (list, tuple)):
+            return other
+        if _as_memoryview(other) is not None:
+            return Span(other)
+        return None
+
+    def __eq__(self, other: object) -> bool:
+        other = self._comparable(other)
+        if other is None:
+            return NotImplemented
+        if len(other) != self._count:
+            return False
+        if isinstance(other, Span) and self._view is not None and other._view is not None:
+            return self._view == other._view # Compared in C
+        mine = self.tolist()
+        return mine == (other.tolist() if isinstance(other, Span) else list(other))
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None # A mutable view
+
+    def find(self, value: T, start: int = 0) -> int:
+        """Index of the first element equal to value at or after start, or -1."""
+        if start < 0:
+            start = max(0, start + self._count)
+        if start >= self._count:
+            return -1
+        if self._view is not None:
+            items = self._view[start:].tolist()
+        else:
+            items = self._native_items()
+            if items is None:
+                for i in range(start, self._count):
+                    if self[i] == value:
+                        return i
+                return -1
+            items = items[start:] if start else items
+        try:
+            return items.index(value) + start
+        except ValueError:
+            return -1
+
+    def index(self, value: T, start: int = 0) -> int:
+        """Like list.index: raises ValueError when value is absent."""
+        i = self.find(value, start)
+        if i < 0:
+            raise ValueError(f"{value!r} is not in Span")
+        return i
+
+    def count(self, value: T) -> int:
+        if self._view is not None:
+            return self._view.tolist().count(value)
+        items = self._native_items()
+        if items is not None:
+            return items.count(value)
+        return sum(1 for item in self._iter_items() if item == value)
+
     # --------------------- Capacity ---------------------
     def size(self) -> int: return self._count
     def empty(self) -> bool: return self._count == 0
     def size_bytes(self) -> int:
-        raise NotImplementedError("size_bytes() not supported in generic Python Span")
+        if self._view is None:
+            raise TypeError("size_bytes() needs a buffer-backed Span (element size is unknown)")
+        return self._count * self._view.itemsize
 
     # --------------------- Operations ---------------------
     def subspan(self, offset: int, count: int = -1) -> Span[T]:
@@ -107,7 +385,7 @@ class Span(BaseSequence, Generic[T]):
 
     def last(self, count: int) -> Span[T]:
         return self.subspan(self._count - count, count)
-    
+
     def __repr__(self):
         # Preview first few elements
         limit = 10
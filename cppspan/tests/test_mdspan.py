@@ -0,0 +1,73 @@
+import unittest
+from array import array
+from cppspan import Span, MdSpan
+
+
+class TestMdSpan(unittest.TestCase):
+    def test_layouts(self):
+        buf = array('d', range(12))
+        m = MdSpan(buf, (3, 4))
+        self.assertEqual(m.rank(), 2)
+        self.assertEqual(m.extents(), (3, 4))
+        self.assertEqual(m.strides(), (4, 1))
+        self.assertEqual(m[1, 2], 6.0)
+        self.assertEqual(m.mapping(2, 3), 11)
+        self.assertEqual(m.size_bytes(), 12 * buf.itemsize)
+        m[2, 0] = -1.0
+        self.assertEqual(buf[8], -1.0)
+        self.assertEqual(m.tolist()[2], [-1.0, 9.0, 10.0, 11.0])
+
+        col = MdSpan(buf, (3, 4), layout='left') # Column-major
+        self.assertEqual(col.strides(), (1, 3))
+        self.assertEqual(col[1, 2], 7.0)
+        self.assertEqual(col.tolist()[0], [0.0, 3.0, 6.0, 9.0])
+
+        self.assertRaises(IndexError, MdSpan, buf, (4, 4))
+        self.assertRaises(IndexError, m.__getitem__, (3, 0))
+
+    def test_submdspan(self):
+        data = array('i', range(24))
+        m = Span(data).reshape(2, 3, 4)
+        self.assertTrue(m.is_contiguous())
+        plane = m[1] # Drops the first extent
+        self.assertEqual(plane.extents(), (3, 4))
+        self.assertEqual(plane[0, 0], 12)
+        block = m[:, 1:, ::2]
+        self.assertEqual(block.extents(), (2, 2, 2))
+        self.assertFalse(block.is_contiguous())
+        self.assertEqual(block.tolist(), [[[4, 6], [8, 10]], [[16, 18], [20, 22]]])
+        self.assertEqual(block.tobytes(), array('i', [4, 6, 8, 10, 16, 18, 20, 22]).tobytes())
+        block[1, 1, 1] = 0 # Writes through to the source
+        self.assertEqual(data[22], 0)
+        self.assertEqual(m[0, :, -1].tolist(), [3, 7, 11])
+        self.assertEqual(m[0, ::-1, 0].tolist(), [8, 4, 0])
+        self.assertEqual([row.tolist() for row in m[0]][1], [4, 5, 6, 7])
+
+    def test_strided_and_sequences(self):
+        # layout_stride over a plain list: every other element, 2 x 3
+        data = list(range(12))
+        m = MdSpan(data, (2, 3), strides=(6, 2))
+        self.assertEqual(m.tolist(), [[0, 2, 4], [6, 8, 10]])
+        self.assertRaises(TypeError, m.size_bytes)
+        self.assertRaises(TypeError, m.tobytes)
+
+        # Reshaping a strided span keeps addressing the same memory
+        buf = array('h', range(12))
+        evens = Span(buf)[::2].reshape(2, 3)
+        self.assertEqual(evens.tolist(), [[0, 2, 4], [6, 8, 10]])
+
+    def test_numpy_shape(self):
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        a = np.arange(6, dtype=np.int64).reshape(2, 3)
+        m = MdSpan(a)
+        self.assertEqual(m.extents(), (2, 3))
+        self.assertEqual(m.tolist(), a.tolist())
+        m[1, 1] = 40
+        self.assertEqual(a[1, 1], 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
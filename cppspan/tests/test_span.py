@@ -94,5 +94,95 @@ class TestSpan(unittest.TestCase):
         self.assertEqual(len(s2), 2)
         self.assertEqual(s2[0], 2)
         
+    def test_buffer_backed(self):
+        from array import array
+        buf = array('i', range(10))
+        s = Span(buf)
+        self.assertEqual(s.dtype(), 'i')
+        self.assertEqual(s.size_bytes(), 10 * buf.itemsize)
+        evens = s[::2] # Strided, no copy
+        self.assertEqual(evens.tolist(), [0, 2, 4, 6, 8])
+        self.assertEqual(evens.size_bytes(), 5 * buf.itemsize)
+        evens[1] = 20
+        self.assertEqual(buf[2], 20)
+        rev = s[1:8][::-3]
+        self.assertEqual(list(rev), [7, 4, 1])
+        self.assertEqual(s.subspan(8).tobytes(), array('i', [8, 9]).tobytes())
+        self.assertEqual(len(s.as_bytes()), s.size_bytes())
+        self.assertRaises(ValueError, evens.as_bytes)
+
+        raw = bytearray(8)
+        words = Span(raw, dtype='H') # Reinterpreted as 4 uint16
+        self.assertEqual(len(words), 4)
+        words[3] = 0xFFFF
+        self.assertEqual(raw[6:], b'\xff\xff')
+        self.assertEqual(Span(b"abc")[1], ord("b"))
+
+        # Generic sequences support strides too, but have no byte size
+        data = list(range(6))
+        odds = Span(data)[1::2]
+        self.assertEqual(odds.tolist(), [1, 3, 5])
+        odds[0] = 10
+        self.assertEqual(data[1], 10)
+        self.assertEqual(odds.subspan(1).tolist(), [3, 5])
+        self.assertRaises(TypeError, odds.size_bytes)
+        self.assertRaises(TypeError, odds.tobytes)
+
+    def test_numeric_containers(self):
+        try:
+            from cppvector import NumericVector
+        except ImportError:
+            return
+        v = NumericVector(range(100), dtype='d')
+        stage = Span(v).subspan(10, 5)
+        self.assertEqual(stage.dtype(), 'd')
+        stage[0] = -1.0
+        self.assertEqual(v[10], -1.0)
+        self.assertEqual(stage.tolist(), [-1.0, 11.0, 12.0, 13.0, 14.0])
+
+    def test_bulk_operations(self):
+        from array import array
+        buf = array('d', range(10))
+        s = Span(buf)
+        s[2:9].fill(0.5)
+        self.assertEqual(buf.tolist(), [0, 1] + [0.5] * 7 + [9])
+        s[::3].fill(-1.0)
+        self.assertEqual(buf[::3].tolist(), [-1.0] * 4)
+        self.assertEqual(s.count(0.5), 5)
+        self.assertEqual(s.find(9.0), -1)
+        self.assertEqual(s.find(0.5), 2)
+        self.assertEqual(s.find(0.5, 3), 4)
+        self.assertEqual(s.index(1.0), 1)
+        self.assertRaises(ValueError, s.index, 42.0)
+
+        # Overlapping copies behave like memmove
+        s.copy_from(range(10))
+        s[2:].copy_from(s[:8])
+        self.assertEqual(buf.tolist(), [0, 1, 0, 1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(s.first(3).copy_to(s[7:]), 3)
+        self.assertEqual(buf[7:].tolist(), [0, 1, 0])
+        self.assertRaises(ValueError, s.first(2).copy_from, [1, 2, 3])
+        out = [0] * 4
+        s.last(4).copy_to(out)
+        self.assertEqual(out, [4, 0, 1, 0])
+
+        self.assertEqual(Span(array('i', [1, 2])), [1, 2])
+        self.assertEqual(Span(array('i', [1, 2])), Span(bytearray(b'\x01\x02')))
+        self.assertNotEqual(Span([1, 2]), (1, 2, 3))
+        self.assertRaises(TypeError, hash, s)
+
+        # Generic sequences use slice operations
+        data = list(range(10))
+        odd = Span(data)[1::2]
+        odd.fill(0)
+        self.assertEqual(data[:4], [0, 0, 2, 0])
+        odd.copy_from([7, 8])
+        self.assertEqual(data[:4], [0, 7, 2, 8])
+        self.assertEqual(odd.count(0), 3)
+        self.assertEqual(odd.find(0), 2)
+        self.assertEqual(Span(data)[::-1].tolist(), data[::-1])
+        self.assertEqual(list(Span(data)[8:1:-3]), data[8:1:-3])
+        self.assertEqual(Span(tuple(data))[3:5], [8, 4])
+
 if __name__ == '__main__':
     unittest.main()
@@ -15,6 +15,7 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     install_requires=["cppbase"],
+    extras_require={"numpy": ["numpy"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
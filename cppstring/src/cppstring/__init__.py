@@ -1,11 +1,19 @@
-from .string import String
+from .string import String, FrozenString
 from .string_view import StringView
+from .rope import Rope
+from .pool import StringPool, intern
+from .search import Searcher, CharSet, AhoCorasick, find_all
 from .conversions import to_string, stoi, stol, stoll, stoul, stoull, stof, stod, stold
-from .io import getline
+from .conversions import stoi_many, stoul_many, stod_many, to_string_many, join_numbers
+from .io import getline, lines
 
 __all__ = [
-    "String", 
+    "String", "FrozenString",
     "StringView",
+    "Rope",
+    "StringPool", "intern",
+    "Searcher", "CharSet", "AhoCorasick", "find_all",
     "to_string", "stoi", "stol", "stoll", "stoul", "stoull", "stof", "stod", "stold",
-    "getline"
+    "stoi_many", "stoul_many", "stod_many", "to_string_many", "join_numbers",
+    "getline", "lines"
 ]
@@ -1,36 +1,167 @@
-from typing import Union, Any
+from typing import Union, Any, Iterable, List, Optional
+import mmap
+import warnings
 from .string import String
+from .string_view import StringView, _BYTES
+
+try: # Optional: vectorised parsing of delimited buffers
+    import numpy as _np
+except ImportError: # pragma: no cover
+    _np = None
+
+# Ranges of the C++ result types on LP64 platforms (int is 32-bit,
+# long / long long / unsigned long are 64-bit), used by strict=True.
+_INT_RANGE = (-2 ** 31, 2 ** 31 - 1)
+_LONG_RANGE = (-2 ** 63, 2 ** 63 - 1)
+_ULONG_MAX = 2 ** 64 - 1
+
+Numeric = Union[str, bytes, String, StringView]
+
+def _text(s: Any) -> Union[str, bytes]:
+    # int() and float() parse bytes directly, so buffer views are not decoded
+    if isinstance(s, (str, bytes)):
+        return s
+    if isinstance(s, StringView):
+        return s.tobytes() if s._kind == _BYTES else str(s)
+    if isinstance(s, (bytearray, memoryview, mmap.mmap)):
+        return bytes(s)
+    return str(s)
+
+def _signed(value: int, bounds: tuple, name: str) -> int:
+    if not bounds[0] <= value <= bounds[1]:
+        raise OverflowError(f"{name}: out of range")
+    return value
+
+def _unsigned(value: int, name: str) -> int:
+    # std::stoul accepts a leading '-' and wraps the magnitude modulo 2**64
+    if not -_ULONG_MAX <= value <= _ULONG_MAX:
+        raise OverflowError(f"{name}: out of range")
+    return value & _ULONG_MAX
 
 def to_string(val: Any) -> String:
     """Converts numeric value to String."""
     return String(str(val))
 
-def stoi(s: Union[str, String], base: int = 10) -> int:
-    """Parses string to int."""
-    return int(str(s), base)
+def stoi(s: Union[str, String], base: int = 10, strict: bool = False) -> int:
+    """Parses string to int. strict=True raises OverflowError outside the 32-bit range, like C++."""
+    value = int(_text(s), base)
+    return _signed(value, _INT_RANGE, 'stoi') if strict else value
 
-def stol(s: Union[str, String], base: int = 10) -> int:
+def stol(s: Union[str, String], base: int = 10, strict: bool = False) -> int:
     """Parses string to long (int in Python)."""
-    return int(str(s), base)
+    value = int(_text(s), base)
+    return _signed(value, _LONG_RANGE, 'stol') if strict else value
 
-def stoll(s: Union[str, String], base: int = 10) -> int:
+def stoll(s: Union[str, String], base: int = 10, strict: bool = False) -> int:
     """Parses string to long long (int in Python)."""
-    return int(str(s), base)
+    value = int(_text(s), base)
+    return _signed(value, _LONG_RANGE, 'stoll') if strict else value
 
-def stoul(s: Union[str, String], base: int = 10) -> int:
+def stoul(s: Union[str, String], base: int = 10, strict: bool = False) -> int:
     """Parses string to unsigned long."""
-    # Python doesn't handle unsigned/overflow manually unless we enforce it.
-    # Just standard parse.
-    return int(str(s), base)
+    # Python doesn't handle unsigned/overflow unless strict=True enforces it.
+    value = int(_text(s), base)
+    return _unsigned(value, 'stoul') if strict else value
 
-def stoull(s: Union[str, String], base: int = 10) -> int:
-    return int(str(s), base)
+def stoull(s: Union[str, String], base: int = 10, strict: bool = False) -> int:
+    value = int(_text(s), base)
+    return _unsigned(value, 'stoull') if strict else value
 
 def stof(s: Union[str, String]) -> float:
-    return float(str(s))
+    return float(_text(s))
 
 def stod(s: Union[str, String]) -> float:
-    return float(str(s))
+    return float(_text(s))
 
 def stold(s: Union[str, String]) -> float:
-    return float(str(s))
+    return float(_text(s))
+
+# --------------------- Batch Conversions ---------------------
+# The *_many parsers take either an iterable of values or, with `sep`, one
+# delimited buffer (str, bytes-like, String or StringView). A trailing
+# separator does not produce an extra empty field. Parsing runs as a single
+# map(int, ...) / map(float, ...) pass in C; for a base-10 buffer NumPy's
+# text parser is used when it is installed, with the loop as the fallback
+# for anything it rejects (or values beyond int64).
+
+def _fields(source: Any, sep: Optional[Union[str, bytes]]) -> list:
+    if sep is None:
+        return list(map(_text, source))
+    data = _text(source)
+    if isinstance(data, bytes) and isinstance(sep, str):
+        sep = sep.encode()
+    elif isinstance(data, str) and isinstance(sep, bytes):
+        sep = sep.decode()
+    fields = data.split(sep)
+    if fields and not fields[-1]:
+        fields.pop()
+    return fields
+
+def _np_parse(source: Any, sep: Any, dtype: str) -> Optional[list]:
+    if _np is None or sep is None:
+        return None
+    data = _text(source)
+    if isinstance(sep, bytes):
+        sep = sep.decode()
+    if isinstance(data, bytes):
+        data = data.decode('latin-1') # Digits are ASCII; anything else fails below
+    if not data:
+        return []
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error') # Unparsed trailing data
+            parsed = _np.fromstring(data, dtype=dtype, sep=sep)
+    except (ValueError, DeprecationWarning):
+        return None
+    # NumPy merges runs of a whitespace separator; _fields does not
+    if parsed.size != data.count(sep) + (not data.endswith(sep)):
+        return None
+    if dtype == 'i8' and parsed.size:
+        info = _np.iinfo(parsed.dtype)
+        if parsed.min() == info.min or parsed.max() == info.max:
+            return None # Possibly saturated; Python ints are exact
+    return parsed.tolist()
+
+def stoi_many(source: Iterable[Numeric], sep: Optional[Union[str, bytes]] = None,
+              base: int = 10, strict: bool = False) -> List[int]:
+    """Parses many integers; strict=True applies stoi's 32-bit range."""
+    values = _np_parse(source, sep, 'i8') if base == 10 else None
+    if values is None:
+        fields = _fields(source, sep)
+        values = list(map(int, fields)) if base == 10 else [int(f, base) for f in fields]
+    if strict and values and (min(values) < _INT_RANGE[0] or max(values) > _INT_RANGE[1]):
+        raise OverflowError("stoi: out of range")
+    return values
+
+def stoul_many(source: Iterable[Numeric], sep: Optional[Union[str, bytes]] = None,
+               base: int = 10, strict: bool = False) -> List[int]:
+    """Parses many unsigned integers; strict=True applies stoul's range and wrap-around."""
+    values = stoi_many(source, sep, base)
+    if strict and values:
+        if min(values) < -_ULONG_MAX or max(values) > _ULONG_MAX:
+            raise OverflowError("stoul: out of range")
+        if min(values) < 0:
+            values = [v & _ULONG_MAX for v in values]
+    return values
+
+def stod_many(source: Iterable[Numeric], sep: Optional[Union[str, bytes]] = None) -> List[float]:
+    """Parses many floating point values."""
+    values = _np_parse(source, sep, 'f8')
+    if values is None:
+        values = list(map(float, _fields(source, sep)))
+    return values
+
+def _plain(values: Iterable[Any]) -> Iterable[Any]:
+    # NumPy arrays format fastest as Python scalars
+    tolist = getattr(values, 'tolist', None)
+    return tolist() if tolist is not None else values
+
+def to_string_many(values: Iterable[Any]) -> List[String]:
+    """to_string for every value."""
+    return [String(text) for text in map(str, _plain(values))]
+
+def join_numbers(values: Iterable[Any], sep: str = ',', fmt: Optional[str] = None) -> String:
+    """Formats values (with format spec `fmt` if given) into one sep-joined String."""
+    values = _plain(values)
+    texts = map(str, values) if fmt is None else (format(v, fmt) for v in values)
+    return String(sep.join(texts))
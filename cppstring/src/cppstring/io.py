@@ -1,23 +1,196 @@
-from typing import IO
+from typing import IO, Iterator, Union, Optional, Any
+import io
+import mmap
+import weakref
 from .string import String
+from .string_view import StringView
 
-def getline(input_stream: IO[str], s: String, delimiter: str = '\n') -> IO[str]:
+_CHUNK = 1 << 16 # Read size for delimiter scans
+
+# Data read past a delimiter, kept for the next getline / lines call on the
+# same stream (the role of std::istream's stream buffer).
+_pending: 'weakref.WeakKeyDictionary[Any, Any]' = weakref.WeakKeyDictionary()
+
+
+def _is_binary(stream: Any) -> bool:
+    if isinstance(stream, io.TextIOBase):
+        return False
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase, mmap.mmap)):
+        return True
+    return 'b' in getattr(stream, 'mode', '')
+
+
+def _push_back(stream: Any, rest: Any):
+    try:
+        _pending[stream] = rest
+    except TypeError: # Not weak-referenceable (e.g. mmap): rewind instead
+        stream.seek(-len(rest), io.SEEK_CUR)
+
+
+def _take_pending(stream: Any) -> Any:
+    try:
+        return _pending.pop(stream, None)
+    except TypeError:
+        return None
+
+
+def _next_record(stream: Any, delim: Union[str, bytes]) -> Optional[Union[str, bytes]]:
+    """
+    Reads up to and including the next delimiter and returns the text before
+    it, or None at end of stream. Whole segments are located with find()
+    rather than read one character at a time.
+    """
+    data = _take_pending(stream)
+    if data is None:
+        if delim == '\n' or delim == b'\n':
+            # readline is buffered and scans in C. Text streams opened with
+            # newline='' or '\r' also end lines at '\r', and newline='\r\n'
+            # reads past a lone '\n', so cut at the first '\n' seen
+            line = stream.readline()
+            if not line:
+                return None
+            i = line.find(delim)
+            if i == len(line) - 1:
+                return line[:-1]
+            parts = []
+            while i < 0:
+                parts.append(line)
+                line = stream.readline()
+                if not line:
+                    return delim[:0].join(parts)
+                i = line.find(delim)
+            parts.append(line[:i])
+            if i + 1 < len(line):
+                _push_back(stream, line[i + 1:])
+            return delim[:0].join(parts)
+        peek = getattr(stream, 'peek', None)
+        if peek is not None and len(delim) == 1:
+            return _peek_record(stream, peek, delim)
+        data = stream.read(_CHUNK)
+        if not data:
+            return None
+
+    k = len(delim) - 1 # Overlap kept between chunks so a delimiter can straddle them
+    parts = []
+    while True:
+        i = data.find(delim)
+        if i >= 0:
+            parts.append(data[:i])
+            rest = data[i + len(delim):]
+            if rest:
+                _push_back(stream, rest)
+            break
+        more = stream.read(_CHUNK)
+        if not more:
+            parts.append(data)
+            break
+        if k and len(data) > k:
+            parts.append(data[:-k])
+            data = data[-k:] + more
+        elif k:
+            data = data + more
+        else:
+            parts.append(data)
+            data = more
+    return data[:0].join(parts)
+
+
+def _peek_record(stream: Any, peek: Any, delim: bytes) -> Optional[bytes]:
+    # Buffered binary streams: look at the buffer, then consume exactly the
+    # record and its delimiter, so nothing is read ahead.
+    parts = []
+    while True:
+        data = peek(_CHUNK)
+        if not data:
+            return b''.join(parts) if parts else None
+        i = data.find(delim)
+        if i >= 0:
+            parts.append(stream.read(i))
+            stream.read(1)
+            return b''.join(parts)
+        parts.append(stream.read(len(data)))
+
+
+def _delimiter(stream: Any, delimiter: Union[str, bytes], encoding: str) -> Union[str, bytes]:
+    if not delimiter:
+        raise ValueError("empty delimiter")
+    if _is_binary(stream):
+        return delimiter if isinstance(delimiter, bytes) else delimiter.encode(encoding)
+    return delimiter if isinstance(delimiter, str) else delimiter.decode(encoding)
+
+
+def getline(input_stream: IO[str], s: String, delimiter: str = '\n',
+            encoding: str = 'utf-8') -> IO[str]:
     """
     Reads characters from input_stream and stores them into string s until delimiter is found.
     The delimiter is NOT included in s.
     Returns the input_stream.
+
+    Binary streams are decoded with `encoding`. Input is read in blocks;
+    with a delimiter other than newline, data read past it is kept for the
+    next getline / lines call on the same stream.
     """
     s.clear()
-    
-    # Read char by char to handle custom delimiter
-    # This might be slow but mimics generic getline behavior
-    
-    while True:
-        char = input_stream.read(1)
-        if not char:
-            break
-        if char == delimiter:
-            break
-        s.push_back(char)
-        
+    record = _next_record(input_stream, _delimiter(input_stream, delimiter, encoding))
+    if record:
+        s.append(record if isinstance(record, str) else record.decode(encoding))
     return input_stream
+
+
+def _map(stream: Any) -> Optional[mmap.mmap]:
+    # Real binary files with nothing read ahead are mapped; pipes, sockets,
+    # in-memory streams and empty files return None.
+    if not _is_binary(stream) or isinstance(stream, mmap.mmap) or stream in _pending:
+        return None
+    try:
+        return mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def lines(input_stream: IO[str], delimiter: str = '\n', view: bool = False,
+          encoding: str = 'utf-8') -> Iterator[Union[String, StringView]]:
+    """
+    Yields each record of input_stream (as getline would read them) as a
+    `String`, or as a `StringView` when view=True.
+
+    A binary file ("rb") is memory-mapped and scanned with mmap.find; the
+    views then point into the mapping, so no line is copied until it is
+    used. The stream is left positioned after the last record yielded.
+    """
+    delim = _delimiter(input_stream, delimiter, encoding)
+    mm = _map(input_stream)
+    if mm is not None:
+        yield from _mapped_lines(input_stream, mm, delim, view, encoding)
+        return
+    binary = isinstance(delim, bytes)
+    while True:
+        record = _next_record(input_stream, delim)
+        if record is None:
+            return
+        if view:
+            yield StringView(record, encoding=encoding)
+        else:
+            yield String(record.decode(encoding) if binary else record)
+
+
+def _mapped_lines(stream: Any, mm: mmap.mmap, delim: bytes, view: bool,
+                  encoding: str) -> Iterator[Union[String, StringView]]:
+    pos = stream.tell()
+    end = len(mm)
+    try:
+        while pos < end:
+            i = mm.find(delim, pos)
+            stop = end if i < 0 else i
+            nxt = end if i < 0 else i + len(delim)
+            if view:
+                record = StringView(mm, pos, stop - pos, encoding)
+            else:
+                record = String(mm[pos:stop].decode(encoding))
+            pos = nxt
+            yield record
+    finally:
+        if not stream.closed:
+            stream.seek(pos)
+        if not view: # Views keep using the mapping; it is freed with them
+            mm.close()
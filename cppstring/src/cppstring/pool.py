@@ -0,0 +1,93 @@
+from typing import Union, Iterable, Iterator, List, Dict, Any
+import weakref
+from .string import String, FrozenString
+
+Key = Union[str, String, Any]
+
+# Process-wide table behind intern(); entries disappear with their last user
+_interned: 'weakref.WeakValueDictionary[str, FrozenString]' = weakref.WeakValueDictionary()
+
+
+def intern(s: Key) -> FrozenString:
+    """
+    Returns the shared FrozenString equal to s (like sys.intern), so equal
+    interned strings are one object and compare with an identity check.
+    """
+    if type(s) is FrozenString and _interned.get(s.c_str()) is s:
+        return s
+    text = str(s)
+    frozen = _interned.get(text)
+    if frozen is None:
+        frozen = FrozenString(text)
+        _interned[text] = frozen
+    return frozen
+
+
+class StringPool:
+    """
+    A symbol table: deduplicates equal strings and hands out compact integer
+    IDs (0, 1, 2, ... in insertion order).
+
+    Keys can be str, String or StringView; each distinct value is stored
+    once as a FrozenString. Code that keeps IDs instead of strings compares
+    and hashes plain ints, and `string(id)` maps back in O(1).
+    """
+    __slots__ = ('_ids', '_strings')
+
+    def __init__(self, strings: Iterable[Key] = ()):
+        self._ids: Dict[Any, int] = {}
+        self._strings: List[FrozenString] = []
+        for s in strings:
+            self.add(s)
+
+    @staticmethod
+    def _key(s: Key) -> Key:
+        # str and String hash alike; views (byte-backed ones included) are
+        # looked up by their text
+        return s if isinstance(s, (str, String)) else str(s)
+
+    def add(self, s: Key) -> int:
+        """Returns the ID of s, inserting it if it is new."""
+        s = self._key(s)
+        ident = self._ids.get(s)
+        if ident is None:
+            frozen = s if type(s) is FrozenString else FrozenString(str(s))
+            ident = len(self._strings)
+            self._strings.append(frozen)
+            self._ids[frozen] = ident
+        return ident
+
+    def add_many(self, strings: Iterable[Key]) -> List[int]:
+        return [self.add(s) for s in strings]
+
+    def intern(self, s: Key) -> FrozenString:
+        """Returns the pool's shared instance equal to s (inserting it)."""
+        return self._strings[self.add(s)]
+
+    def find(self, s: Key) -> int:
+        """ID of s, or -1 if it is not in the pool."""
+        return self._ids.get(self._key(s), -1)
+
+    def string(self, ident: int) -> FrozenString:
+        if not 0 <= ident < len(self._strings):
+            raise IndexError("StringPool id out of range")
+        return self._strings[ident]
+
+    def __getitem__(self, ident: int) -> FrozenString:
+        return self.string(ident)
+
+    def __contains__(self, s: Key) -> bool:
+        return self._key(s) in self._ids
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def size(self) -> int:
+        return len(self._strings)
+
+    def __iter__(self) -> Iterator[FrozenString]:
+        return iter(self._strings)
+
+    def clear(self):
+        self._ids.clear()
+        self._strings.clear()
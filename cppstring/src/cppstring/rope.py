@@ -0,0 +1,424 @@
+from __future__ import annotations
+from typing import Union, Iterable, Iterator, Any, List, Tuple
+import random
+from cppbase import Sequence
+from .string import String
+from .search import char_set
+
+# Private generator: treap balance does not depend on, or disturb, the user's
+# random.seed() state
+_rng = random.Random()
+
+
+class _Piece:
+    """Treap node holding one chunk of text; `size` counts the whole subtree."""
+    __slots__ = ('text', 'left', 'right', 'prio', 'size')
+
+    def __init__(self, text: str, prio: float | None = None):
+        self.text = text
+        self.left: _Piece | None = None
+        self.right: _Piece | None = None
+        self.prio = _rng.random() if prio is None else prio
+        self.size = len(text)
+
+
+def _size(node: _Piece | None) -> int:
+    return node.size if node is not None else 0
+
+
+def _update(node: _Piece):
+    node.size = _size(node.left) + len(node.text) + _size(node.right)
+
+
+def _split(node: _Piece | None, k: int) -> Tuple[_Piece | None, _Piece | None]:
+    """Splits off the first k characters: (first k, rest)."""
+    if node is None:
+        return None, None
+    lsize = _size(node.left)
+    if k <= lsize:
+        a, b = _split(node.left, k)
+        node.left = b
+        _update(node)
+        return a, node
+    k -= lsize
+    tlen = len(node.text)
+    if k >= tlen:
+        a, b = _split(node.right, k - tlen)
+        node.right = a
+        _update(node)
+        return node, b
+    # Cut inside this piece; the right half keeps the priority, so both
+    # halves remain valid treaps.
+    rest = _Piece(node.text[k:], node.prio)
+    rest.right = node.right
+    _update(rest)
+    node.text = node.text[:k]
+    node.right = None
+    _update(node)
+    return node, rest
+
+
+def _merge(a: _Piece | None, b: _Piece | None) -> _Piece | None:
+    """Concatenates two treaps (all of a before all of b)."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    _update(b)
+    return b
+
+
+def _build(chunks: Iterable[str]) -> _Piece | None:
+    """Builds a treap from chunks in order in O(n) (Cartesian tree on a stack)."""
+    stack: List[_Piece] = []
+    for text in chunks:
+        node = _Piece(text)
+        last = None
+        while stack and stack[-1].prio < node.prio:
+            last = stack.pop()
+            _update(last)
+        node.left = last
+        if stack:
+            stack[-1].right = node
+        stack.append(node)
+    for node in reversed(stack):
+        _update(node)
+    return stack[0] if stack else None
+
+
+def _pieces(node: _Piece | None) -> Iterator[str]:
+    """Chunks in order (iterative in-order walk)."""
+    stack: List[_Piece] = []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.text
+        node = node.right
+
+
+class Rope(Sequence):
+    """
+    Editing buffer with the String API, stored as a treap of text pieces.
+
+    Each node holds a chunk of up to _CHUNK characters and the size of its
+    subtree, so insert / erase / replace at any position split and re-join
+    the tree in O(log N) instead of shifting the tail. Read operations
+    (find, compare, iteration...) run on the flattened `str`, which is built
+    lazily by c_str() and cached until the next modification.
+    """
+    _CHUNK = 512
+    __slots__ = ('_root', '_flat')
+
+    def __init__(self, source: Union[str, Iterable[str], String, 'Rope', None] = None):
+        self._root: _Piece | None = None
+        self._flat: str | None = ''
+        if source is not None:
+            self.assign(source)
+
+    # --------------------- Internal ---------------------
+    def _text(self) -> str:
+        if self._flat is None:
+            self._flat = ''.join(_pieces(self._root))
+        return self._flat
+
+    def _from_text(self, text: str) -> _Piece | None:
+        step = self._CHUNK
+        return _build(text[i:i + step] for i in range(0, len(text), step))
+
+    def _coerce(self, source: Any) -> str:
+        if isinstance(source, str):
+            return source
+        if isinstance(source, (String, Rope)):
+            return source.c_str()
+        return ''.join([_validate_char(c) for c in source])
+
+    def _append_text(self, node: _Piece | None, text: str) -> _Piece | None:
+        # Small appends extend the last piece in place (walking the right
+        # spine) so that typing-style edits don't create a node per char.
+        if not text:
+            return node
+        last = node
+        while last is not None and last.right is not None:
+            last = last.right
+        if last is not None and len(last.text) + len(text) <= self._CHUNK:
+            last.text += text
+            spine = node
+            while spine is not None:
+                spine.size += len(text)
+                spine = spine.right
+            return node
+        return _merge(node, self._from_text(text))
+
+    # --------------------- Modifiers ---------------------
+    def assign(self, source: Union[str, Iterable[str], String, 'Rope']):
+        text = self._coerce(source)
+        self._root = self._from_text(text)
+        self._flat = text
+
+    def append(self, source: Union[str, Iterable[str], String, 'Rope']):
+        text = self._coerce(source)
+        self._root = self._append_text(self._root, text)
+        self._flat = None
+
+    def push_back(self, c: str):
+        self.append(_validate_char(c))
+
+    def pop_back(self):
+        if self._root is None:
+            raise IndexError("pop_back on empty string")
+        self.erase(self._root.size - 1, 1)
+
+    def insert(self, pos: int, sub: str):
+        size = self.size()
+        if pos < 0: pos += size
+        if not (0 <= pos <= size):
+            raise IndexError("insert index out of range")
+        text = self._coerce(sub)
+        if not text:
+            return
+        left, right = _split(self._root, pos)
+        self._root = _merge(self._append_text(left, text), right)
+        self._flat = None
+
+    def erase(self, pos: int = 0, count: int = -1) -> 'Rope':
+        """Removes count characters starting from pos (default to end). returns self."""
+        size = self.size()
+        if pos < 0 or pos >= size:
+            raise IndexError("erase index out of range")
+        if count == -1 or pos + count > size:
+            count = size - pos
+        left, rest = _split(self._root, pos)
+        _, right = _split(rest, count)
+        self._root = _merge(left, right)
+        self._flat = None
+        return self
+
+    def clear(self):
+        self._root = None
+        self._flat = ''
+
+    def replace(self, pos: int, count: int, sub: str) -> 'Rope':
+        self.erase(pos, count)
+        self.insert(pos, sub)
+        return self
+
+    def swap(self, other: 'Rope'):
+        if not isinstance(other, Rope):
+            raise TypeError("Can only swap with another Rope")
+        self._root, other._root = other._root, self._root
+        self._flat, other._flat = other._flat, self._flat
+
+    # --------------------- Element Access ---------------------
+    def _locate(self, index: int) -> Tuple[_Piece, int]:
+        size = self.size()
+        if index < 0: index += size
+        if not (0 <= index < size):
+            raise IndexError("Rope index out of range")
+        node = self._root
+        while True:
+            lsize = _size(node.left)
+            if index < lsize:
+                node = node.left
+                continue
+            index -= lsize
+            if index < len(node.text):
+                return node, index
+            index -= len(node.text)
+            node = node.right
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, 'Rope']:
+        if isinstance(index, slice):
+            return Rope(self._text()[index])
+        if self._flat is not None:
+            size = len(self._flat)
+            if index < 0: index += size
+            if not (0 <= index < size):
+                raise IndexError("Rope index out of range")
+            return self._flat[index]
+        node, offset = self._locate(index)
+        return node.text[offset]
+
+    def __setitem__(self, index: int, value: str):
+        value = _validate_char(value)
+        node, offset = self._locate(index)
+        node.text = node.text[:offset] + value + node.text[offset + 1:]
+        self._flat = None
+
+    def at(self, index: int) -> str:
+        return self[index]
+
+    def front(self) -> str:
+        return self[0]
+
+    def back(self) -> str:
+        return self[-1]
+
+    def c_str(self) -> str:
+        """Returns native Python string (flattened once, cached until modified)."""
+        return self._text()
+
+    def __str__(self) -> str:
+        return self._text()
+
+    def _search_text(self) -> str:
+        return self._text()
+
+    def __repr__(self) -> str:
+        return f'Rope("{self._text()}")'
+
+    # --------------------- Capacity ---------------------
+    def size(self) -> int: return _size(self._root)
+    def length(self) -> int: return _size(self._root)
+    def empty(self) -> bool: return self._root is None or self._root.size == 0
+    def capacity(self) -> int: return _size(self._root)
+
+    def reserve(self, n: int):
+        pass # Pieces are allocated per edit; nothing to reserve
+
+    def resize(self, n: int, c: str = '\0'):
+        size = self.size()
+        if n < size:
+            self.erase(n)
+        elif n > size:
+            self.append(_validate_char(c) * (n - size))
+
+    def shrink_to_fit(self):
+        """Rebuilds the tree from full-size chunks (after many small edits)."""
+        text = self._text()
+        self._root = self._from_text(text)
+
+    def piece_count(self) -> int:
+        return sum(1 for _ in _pieces(self._root))
+
+    # --------------------- Operations ---------------------
+    def __add__(self, other: Union[str, String, 'Rope']) -> 'Rope':
+        r = Rope(self)
+        r.append(other)
+        return r
+
+    def __iadd__(self, other: Union[str, String, 'Rope']) -> 'Rope':
+        self.append(other)
+        return self
+
+    def substr(self, pos: int = 0, count: int = -1) -> 'Rope':
+        size = self.size()
+        if pos < 0 or pos > size:
+            raise IndexError("pos out of range")
+        if count == -1 or pos + count > size:
+            count = size - pos
+        return Rope(self._text()[pos:pos + count])
+
+    def find(self, sub: str, pos: int = 0) -> int:
+        return self._text().find(str(sub), pos)
+
+    def rfind(self, sub: str, pos: int = -1) -> int:
+        """Find last occurrence of sub at or before pos."""
+        s = self._text()
+        if pos == -1 or pos >= len(s):
+            return s.rfind(str(sub))
+        return s.rfind(str(sub), 0, pos + 1)
+
+    def compare(self, other: Union[str, String, 'Rope']) -> int:
+        s = self._text()
+        o = str(other)
+        if s < o: return -1
+        if s > o: return 1
+        return 0
+
+    def find_all(self, sub: str, pos: int = 0, overlapping: bool = False) -> Iterator[int]:
+        """Yields the index of every occurrence of sub from pos on."""
+        s = self._text()
+        sub = str(sub)
+        step = 1 if overlapping else max(1, len(sub))
+        i = s.find(sub, pos)
+        while i != -1:
+            yield i
+            i = s.find(sub, i + step)
+
+    def find_first_of(self, chars: str, pos: int = 0) -> int:
+        """Finds the first occurrence of any character from the set."""
+        return char_set(str(chars)).first_of(self._text(), pos)
+
+    def find_last_of(self, chars: str, pos: int = -1) -> int:
+        """Finds the last occurrence of any character from the set at or before pos."""
+        return char_set(str(chars)).last_of(self._text(), pos)
+
+    def find_first_not_of(self, chars: str, pos: int = 0) -> int:
+        """Finds the first occurrence of any character NOT from the set."""
+        return char_set(str(chars)).first_not_of(self._text(), pos)
+
+    def find_last_not_of(self, chars: str, pos: int = -1) -> int:
+        """Finds the last occurrence of any character NOT from the set at or before pos."""
+        return char_set(str(chars)).last_not_of(self._text(), pos)
+
+    # --------------------- Case Conversions ---------------------
+    def to_upper(self) -> 'Rope':
+        self.assign(self._text().upper())
+        return self
+
+    def to_lower(self) -> 'Rope':
+        self.assign(self._text().lower())
+        return self
+
+    # --------------------- Comparisons ---------------------
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Rope, String, str)):
+            return self._text() == str(other)
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, (Rope, String, str)):
+            return self._text() != str(other)
+        return NotImplemented
+
+    def __lt__(self, other: Union['Rope', String, str]) -> bool:
+        if isinstance(other, (Rope, String, str)):
+            return self.compare(other) < 0
+        return NotImplemented
+
+    def __le__(self, other: Union['Rope', String, str]) -> bool:
+        if isinstance(other, (Rope, String, str)):
+            return self.compare(other) <= 0
+        return NotImplemented
+
+    def __gt__(self, other: Union['Rope', String, str]) -> bool:
+        if isinstance(other, (Rope, String, str)):
+            return self.compare(other) > 0
+        return NotImplemented
+
+    def __ge__(self, other: Union['Rope', String, str]) -> bool:
+        if isinstance(other, (Rope, String, str)):
+            return self.compare(other) >= 0
+        return NotImplemented
+
+    # --------------------- Predicates (C++20) ---------------------
+    def starts_with(self, prefix: Union[str, String, 'Rope']) -> bool:
+        return self._text().startswith(str(prefix))
+
+    def ends_with(self, suffix: Union[str, String, 'Rope']) -> bool:
+        return self._text().endswith(str(suffix))
+
+    def contains(self, sub: Union[str, String, 'Rope']) -> bool:
+        return str(sub) in self._text()
+
+    # --------------------- Iteration ---------------------
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._text())
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+
+def _validate_char(c: Any) -> str:
+    if isinstance(c, str):
+        if len(c) == 1:
+            return c
+        raise ValueError(f"Rope can only contain single characters, got length {len(c)}")
+    raise TypeError(f"Rope requires str characters, got {type(c)}")
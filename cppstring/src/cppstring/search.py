@@ -0,0 +1,330 @@
+from __future__ import annotations
+from typing import Union, Iterable, Iterator, Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+import re
+
+# Haystacks are `str`, bytes-like objects (bytes, bytearray, mmap, memoryview)
+# or the cppstring types, which are reduced to one of those. Positions are
+# character indices for text and byte offsets for bytes-like haystacks.
+Text = Union[str, bytes, bytearray, memoryview, Any]
+
+
+@lru_cache(maxsize=64)
+def _needle_regex(needle: bytes):
+    return re.compile(re.escape(needle))
+
+
+def _bfind(src: Any, needle: Any, start: int, end: int) -> int:
+    # str / bytes / bytearray / mmap have find(); a memoryview is searched
+    # in place through the regex engine, which accepts any buffer.
+    if isinstance(src, memoryview):
+        m = _needle_regex(needle).search(src, start, end)
+        return m.start() if m else -1
+    return src.find(needle, start, end)
+
+
+@lru_cache(maxsize=64)
+def _overlapping_regex(needle: bytes):
+    return re.compile(b'(?=' + re.escape(needle) + b')')
+
+
+_RCHUNK = 1 << 16 # Window size for backward scans of a memoryview
+
+
+def _brfind(src: Any, needle: Any, start: int, end: int) -> int:
+    if isinstance(src, memoryview):
+        # Windows from the end, overlapping by len(needle) - 1; the lookahead
+        # pattern finds overlapping matches and endpos keeps them in the window.
+        if not needle:
+            return end if start <= end else -1
+        rx = _overlapping_regex(needle)
+        hi = end
+        while hi - start >= len(needle):
+            lo = max(start, hi - _RCHUNK)
+            last = -1
+            for m in rx.finditer(src, lo, hi):
+                last = m.start()
+            if last >= 0:
+                return last
+            if lo == start:
+                break
+            hi = lo + len(needle) - 1
+        return -1
+    return src.rfind(needle, start, end)
+
+
+def _haystack(text: Any) -> Any:
+    # A memoryview is kept as is (searched with _bfind / _brfind and the
+    # regex engine), so views over mmaps and large buffers are never copied.
+    if isinstance(text, (str, bytes, bytearray)):
+        return text
+    reduce = getattr(text, '_search_text', None) # String, Rope, StringView
+    if reduce is not None:
+        text = reduce()
+        if isinstance(text, (str, bytes, bytearray)):
+            return text
+    if isinstance(text, memoryview):
+        return text if text.format == 'B' and text.ndim == 1 else text.cast('B')
+    try:
+        memoryview(text).release() # mmap and other buffers
+        return text
+    except TypeError:
+        return str(text)
+
+
+def _is_bytes(text: Any) -> bool:
+    return not isinstance(text, str)
+
+
+class Searcher:
+    """
+    A needle prepared once for repeated searches (std::boyer_moore_horspool_searcher).
+
+    The scan itself is CPython's `find`, whose fastsearch already combines a
+    Horspool-style skip table with the Two-Way algorithm for long needles
+    and runs in C; a pure-Python Horspool loop would be far slower. What is
+    reused across calls is the needle in each storage encoding.
+    """
+    __slots__ = ('needle', 'encoding', '_bytes')
+
+    def __init__(self, needle: Union[str, bytes], encoding: str = 'utf-8'):
+        self.needle = needle
+        self.encoding = encoding
+        self._bytes = needle if isinstance(needle, (bytes, bytearray)) else needle.encode(encoding)
+
+    def _for(self, text: Any) -> Any:
+        if _is_bytes(text):
+            return self._bytes
+        if isinstance(self.needle, str):
+            return self.needle
+        return self.needle.decode(self.encoding)
+
+    def find(self, text: Text, pos: int = 0, end: Optional[int] = None) -> int:
+        text = _haystack(text)
+        return _bfind(text, self._for(text), pos, len(text) if end is None else end)
+
+    def rfind(self, text: Text, pos: int = 0, end: Optional[int] = None) -> int:
+        text = _haystack(text)
+        return _brfind(text, self._for(text), pos, len(text) if end is None else end)
+
+    def find_all(self, text: Text, pos: int = 0, overlapping: bool = False) -> Iterator[int]:
+        """Yields the start of every match from pos on."""
+        text = _haystack(text)
+        needle = self._for(text)
+        step = 1 if overlapping else max(1, len(needle))
+        n = len(text)
+        i = _bfind(text, needle, pos, n)
+        while i != -1:
+            yield i
+            i = _bfind(text, needle, i + step, n)
+
+    def count(self, text: Text, overlapping: bool = False) -> int:
+        return sum(1 for _ in self.find_all(text, 0, overlapping))
+
+
+class CharSet:
+    """
+    A character set prepared for find_first_of-style scans.
+
+    Membership is a compiled regex character class (a bitmap test inside
+    the C regex engine), so each scan is one C-level pass instead of a
+    Python loop with a set lookup per character. `last` scans match a greedy
+    `.*[set]`, which the engine resolves by backing off from the end.
+    """
+    __slots__ = ('chars', '_patterns')
+
+    def __init__(self, chars: Union[str, bytes]):
+        self.chars = chars
+        self._patterns: Dict[Tuple[bool, str], Any] = {}
+
+    def _pattern(self, text: Any, kind: str):
+        is_bytes = _is_bytes(text)
+        key = (is_bytes, kind)
+        pattern = self._patterns.get(key)
+        if pattern is None:
+            pattern = self._compile(is_bytes, kind)
+            self._patterns[key] = pattern
+        return pattern
+
+    def _compile(self, is_bytes: bool, kind: str):
+        # The pattern is built as text; for bytes haystacks it is encoded as
+        # latin-1, dropping characters that can never match a single byte.
+        chars = self.chars
+        if not isinstance(chars, str):
+            chars = chars.decode('latin-1')
+        if is_bytes:
+            chars = ''.join(c for c in chars if ord(c) < 256)
+        negate = kind.endswith('not')
+        if not chars:
+            body = '(?s:.)' if negate else '(?!)'
+        else:
+            body = ('[^' if negate else '[') + re.escape(chars) + ']'
+        if kind.startswith('last'):
+            body = '(?s:.*)' + body
+        if is_bytes:
+            return re.compile(body.encode('latin-1'))
+        return re.compile(body)
+
+    def _first(self, text: Any, pos: int, kind: str) -> int:
+        text = _haystack(text)
+        if pos < 0:
+            pos = max(0, pos + len(text))
+        m = self._pattern(text, kind).search(text, pos)
+        return m.end() - 1 if m else -1
+
+    def _last(self, text: Any, pos: int, kind: str) -> int:
+        text = _haystack(text)
+        n = len(text)
+        if pos == -1 or pos >= n:
+            pos = n - 1
+        elif pos < 0:
+            pos += n
+        if pos < 0:
+            return -1
+        m = self._pattern(text, kind).match(text, 0, pos + 1)
+        return m.end() - 1 if m else -1
+
+    def first_of(self, text: Text, pos: int = 0) -> int:
+        return self._first(text, pos, 'first')
+
+    def first_not_of(self, text: Text, pos: int = 0) -> int:
+        return self._first(text, pos, 'first_not')
+
+    def last_of(self, text: Text, pos: int = -1) -> int:
+        return self._last(text, pos, 'last')
+
+    def last_not_of(self, text: Text, pos: int = -1) -> int:
+        return self._last(text, pos, 'last_not')
+
+
+@lru_cache(maxsize=256)
+def char_set(chars: Union[str, bytes]) -> CharSet:
+    """Shared CharSet for `chars` (repeated find_first_of calls reuse it)."""
+    return CharSet(chars)
+
+
+@lru_cache(maxsize=256)
+def searcher(needle: Union[str, bytes], encoding: str = 'utf-8') -> Searcher:
+    return Searcher(needle, encoding)
+
+
+def find_all(text: Text, needle: Union[str, bytes], pos: int = 0,
+             overlapping: bool = False) -> Iterator[int]:
+    """Yields every match position of needle in text."""
+    return searcher(needle).find_all(text, pos, overlapping)
+
+
+class AhoCorasick:
+    """
+    Multi-pattern matcher (Aho-Corasick automaton).
+
+    `finditer(text)` reports every occurrence of every pattern, including
+    overlapping ones, in one pass over the text: (start, pattern) pairs in
+    order of their end position. `finditer(text, overlapping=False)` reports
+    leftmost-longest non-overlapping matches instead, via one compiled
+    regex alternation (longest pattern first) run by the C regex engine.
+    """
+    __slots__ = ('patterns', 'encoding', '_automata', '_regexes')
+
+    def __init__(self, patterns: Iterable[Union[str, bytes]], encoding: str = 'utf-8'):
+        self.patterns: List[Union[str, bytes]] = []
+        seen = set()
+        for p in patterns:
+            if not p:
+                raise ValueError("AhoCorasick patterns must be non-empty")
+            if p not in seen:
+                seen.add(p)
+                self.patterns.append(p)
+        self.encoding = encoding
+        self._automata: Dict[bool, Tuple[list, list]] = {}
+        self._regexes: Dict[bool, Any] = {}
+
+    def _keys(self, is_bytes: bool) -> List[Any]:
+        enc = self.encoding
+        if is_bytes:
+            return [p if isinstance(p, bytes) else p.encode(enc) for p in self.patterns]
+        return [p if isinstance(p, str) else p.decode(enc) for p in self.patterns]
+
+    def _automaton(self, is_bytes: bool) -> Tuple[list, list]:
+        built = self._automata.get(is_bytes)
+        if built is not None:
+            return built
+        goto: List[Dict[Any, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for index, key in enumerate(self._keys(is_bytes)):
+            state = 0
+            for c in key:
+                nxt = goto[state].get(c)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][c] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(index)
+
+        # Breadth-first failure links, folded into complete transition
+        # tables so the scan never follows a failure chain.
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for c, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and c not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(c, 0)
+                fail[nxt] = target if target != nxt else 0
+                out[nxt] = out[nxt] + out[fail[nxt]]
+        for state in queue: # BFS order: fail[state] is complete before state
+            inherited = goto[fail[state]]
+            table = goto[state]
+            for c, nxt in inherited.items():
+                table.setdefault(c, nxt)
+        keys = self._keys(is_bytes)
+        outputs = [[(len(keys[i]), keys[i]) for i in o] for o in out]
+        built = (goto, outputs)
+        self._automata[is_bytes] = built
+        return built
+
+    def _regex(self, is_bytes: bool):
+        regex = self._regexes.get(is_bytes)
+        if regex is None:
+            keys = sorted(self._keys(is_bytes), key=len, reverse=True) # Longest first
+            sep = b'|' if is_bytes else '|'
+            regex = re.compile(sep.join(re.escape(k) for k in keys))
+            self._regexes[is_bytes] = regex
+        return regex
+
+    def finditer(self, text: Text, overlapping: bool = True) -> Iterator[Tuple[int, Any]]:
+        text = _haystack(text)
+        is_bytes = _is_bytes(text)
+        if not self.patterns:
+            return
+        if not overlapping:
+            for m in self._regex(is_bytes).finditer(text):
+                yield m.start(), m.group()
+            return
+        if not isinstance(text, (str, bytes, bytearray)):
+            text = memoryview(text) # Iterate an mmap as ints, without copying
+        goto, outputs = self._automaton(is_bytes)
+        root = goto[0]
+        state = 0
+        for i, c in enumerate(text):
+            state = goto[state].get(c)
+            if state is None:
+                state = root.get(c, 0)
+            hits = outputs[state]
+            if hits:
+                for length, key in hits:
+                    yield i - length + 1, key
+
+    def findall(self, text: Text, overlapping: bool = True) -> List[Tuple[int, Any]]:
+        return list(self.finditer(text, overlapping))
+
+    def contains_any(self, text: Text) -> bool:
+        text = _haystack(text)
+        return bool(self.patterns) and self._regex(_is_bytes(text)).search(text) is not None
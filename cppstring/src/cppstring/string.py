@@ -1,63 +1,76 @@
 from __future__ import annotations
-from typing import Union, Iterable, Iterator, Any, overload
-import ctypes
+from typing import Union, Iterable, Iterator, Any, Optional, overload
 from cppbase import Sequence
+from .search import char_set
+
+# Storage codecs. Both are fixed width, so character i lives at byte i * width
+# and byte-wise comparison orders strings by code point (big-endian UTF-32).
+_NARROW = 'latin-1'   # 1 byte per character, used while every char is < U+0100
+_WIDE = 'utf-32-be'   # 4 bytes per character
+_WIDE_ERRORS = 'surrogatepass'
 
 class String(Sequence):
     """
     A mutable, C++ style string implementation for Python.
     Supports SSO (Small String Optimization) and strict memory management.
+
+    Characters are stored encoded in a single `bytearray`: latin-1 (one byte
+    per character) until a character above U+00FF is stored, then UTF-32
+    (four bytes per character), in the spirit of CPython's own compact
+    strings. Indexing stays O(1) and append / insert / erase / find /
+    comparisons run as native bytes operations.
     """
     _SSO_CAP = 15  # std::string usually has 15 chars SSO (16 bytes struct)
-    __slots__ = ('_size', '_capacity', '_is_small', '_small', '_large')
+    __slots__ = ('_buf', '_width', '_capacity', '_is_small', '_hash')
 
     def __init__(self, source: Union[str, Iterable[str], 'String', None] = None):
-        self._size = 0
+        self._buf = bytearray()
+        self._width = 1
         self._capacity = self._SSO_CAP
         self._is_small = True
-        
-        # Small buffer: Fixed size list
-        self._small = [None] * (self._SSO_CAP + 1) 
-        self._large = None
-        
+        self._hash: Optional[int] = None # Cached hash, reset by every mutation
+
         if source is not None:
             self.assign(source)
 
     # --------------------- Internal ---------------------
-    def _move_to_large(self, new_cap: int):
-        if not self._is_small:
-            return
-        
-        # Allocate large buffer using ctypes
-        new_cap = max(new_cap, 32)
-        large = (ctypes.py_object * new_cap)()
-        
-        for i in range(self._size):
-            large[i] = self._small[i]
-            
-        self._large = large
-        self._capacity = new_cap
-        self._is_small = False
-        self._small = None # Release small buffer
+    @property
+    def _size(self) -> int:
+        return len(self._buf) // self._width
 
-    def _resize_capacity(self, new_cap: int):
-        if self._is_small and new_cap <= self._SSO_CAP:
+    def _reserve_for(self, n: int):
+        # Capacity bookkeeping (bytearray manages the actual allocation)
+        if n <= self._capacity:
             return
+        new_cap = max(n, self._capacity * 2)
         if self._is_small:
-            self._move_to_large(new_cap)
-            return
-        
-        if new_cap == self._capacity:
-            return
-            
-        # Realloc large
-        new_data = (ctypes.py_object * new_cap)()
-        for i in range(self._size):
-            new_data[i] = self._large[i]
-            
-        self._large = new_data
+            new_cap = max(new_cap, 32)
+            self._is_small = False
         self._capacity = new_cap
 
+    def _widen(self):
+        self._buf = bytearray(self._buf.decode(_NARROW).encode(_WIDE, _WIDE_ERRORS))
+        self._width = 4
+
+    def _encode(self, text: str) -> bytes:
+        """Encodes text in this string's width, widening the storage if needed."""
+        if self._width == 1:
+            try:
+                return text.encode(_NARROW)
+            except UnicodeEncodeError:
+                self._widen()
+        return text.encode(_WIDE, _WIDE_ERRORS)
+
+    def _needle(self, text: Any) -> Optional[bytes]:
+        """Encodes a search argument without widening; None if it cannot occur."""
+        text = str(text)
+        if self._width == 1:
+            try:
+                return text.encode(_NARROW)
+            except UnicodeEncodeError:
+                return None
+        return text.encode(_WIDE, _WIDE_ERRORS)
+
     def _validate_char(self, c: Any) -> str:
         if isinstance(c, str):
             if len(c) == 1:
@@ -71,88 +84,60 @@ class String(Sequence):
         self.append(source)
 
     def append(self, source: Union[str, Iterable[str], 'String']):
-        if isinstance(source, String):
-            for char in source:
-                self.push_back(char)
+        if isinstance(source, String) and source._width == self._width:
+            data = bytes(source._buf) if source is self else source._buf
         elif isinstance(source, str):
-            for char in source:
-                self.push_back(char)
+            data = self._encode(source)
+        elif isinstance(source, String):
+            data = self._encode(source.c_str())
         else:
-            for char in source:
-                self.push_back(char)
+            data = self._encode(''.join([self._validate_char(c) for c in source]))
+        self._reserve_for(self._size + len(data) // self._width)
+        self._buf += data
+        self._hash = None
 
     def push_back(self, c: str):
-        val = self._validate_char(c)
-        
-        if self._size == self._capacity:
-            # Growth factor 2x
-            self._resize_capacity(self._capacity * 2)
-            
-        if self._is_small:
-            self._small[self._size] = val
-        else:
-            self._large[self._size] = val
-            
-        self._size += 1
+        data = self._encode(self._validate_char(c))
+        self._reserve_for(self._size + 1)
+        self._buf += data
+        self._hash = None
 
     def pop_back(self):
-        if self._size == 0:
+        if not self._buf:
             raise IndexError("pop_back on empty string")
-        self._size -= 1
-        # Optional: null out for GC, though strings are small
-        if self._is_small:
-            self._small[self._size] = None
-        else:
-            self._large[self._size] = None
+        del self._buf[-self._width:]
+        self._hash = None
 
     def insert(self, pos: int, sub: str):
-        if pos < 0: pos += self._size
-        if not (0 <= pos <= self._size):
+        size = self._size
+        if pos < 0: pos += size
+        if not (0 <= pos <= size):
             raise IndexError("insert index out of range")
-        
-        sub_len = len(sub)
-        if self._size + sub_len > self._capacity:
-            self._resize_capacity(max(self._size + sub_len, self._capacity * 2))
-            
-        # Shift
-        # We need to shift starting from end
-        # Python range is strict, so we do it carefully or just use list slice logic if we weren't doing manual memory compliance
-        
-        # Accessor helper
-        tgt = self._small if self._is_small else self._large
-        
-        # Shift right
-        for i in range(self._size - 1, pos - 1, -1):
-            tgt[i + sub_len] = tgt[i]
-            
-        # Insert
-        for i, char in enumerate(sub):
-            tgt[pos + i] = char
-            
-        self._size += sub_len
+
+        data = self._encode(str(sub))
+        self._reserve_for(size + len(data) // self._width)
+        w = self._width
+        self._buf[pos * w:pos * w] = data # memmove of the tail
+        self._hash = None
 
     def erase(self, pos: int = 0, count: int = -1) -> 'String':
         """Removes count characters starting from pos (default to end). returns self."""
-        if pos < 0 or pos >= self._size:
+        size = self._size
+        if pos < 0 or pos >= size:
             raise IndexError("erase index out of range")
-            
-        if count == -1:
-            count = self._size - pos
-            
-        if pos + count > self._size:
-            count = self._size - pos
-            
-        tgt = self._small if self._is_small else self._large
-        
-        # Shift left
-        for i in range(pos + count, self._size):
-            tgt[i - count] = tgt[i]
-            
-        self._size -= count
+
+        if count == -1 or pos + count > size:
+            count = size - pos
+
+        w = self._width
+        del self._buf[pos * w:(pos + count) * w]
+        self._hash = None
         return self
 
     def clear(self):
-        self._size = 0
+        self._buf = bytearray()
+        self._width = 1
+        self._hash = None
 
     def replace(self, pos: int, count: int, sub: str) -> 'String':
         self.erase(pos, count)
@@ -162,100 +147,118 @@ class String(Sequence):
     def swap(self, other: 'String'):
         if not isinstance(other, String):
             raise TypeError("Can only swap with another String")
-        
-        (self._size, other._size) = (other._size, self._size)
-        (self._capacity, other._capacity) = (other._capacity, self._capacity)
-        (self._is_small, other._is_small) = (other._is_small, self._is_small)
-        (self._small, other._small) = (other._small, self._small)
-        (self._large, other._large) = (other._large, self._large)
+        if isinstance(other, FrozenString):
+            raise TypeError("FrozenString is immutable")
+
+        for name in String.__slots__:
+            mine, theirs = getattr(self, name), getattr(other, name)
+            setattr(self, name, theirs)
+            setattr(other, name, mine)
 
     # --------------------- Element Access ---------------------
+    def _from_storage(self, data: bytes) -> 'String':
+        res = String()
+        res._buf = bytearray(data)
+        res._width = self._width
+        res._reserve_for(len(data) // self._width)
+        return res
+
     def __getitem__(self, index: Union[int, slice]) -> Union[str, 'String']:
+        w = self._width
         if isinstance(index, slice):
             start, stop, step = index.indices(self._size)
-            res = String()
-            src = self._small if self._is_small else self._large
-            for i in range(start, stop, step):
-                res.push_back(src[i])
-            return res
-        
-        if index < 0: index += self._size
-        if not (0 <= index < self._size):
+            if step == 1:
+                return self._from_storage(self._buf[start * w:max(start, stop) * w])
+            return String(self.c_str()[index])
+
+        size = self._size
+        if index < 0: index += size
+        if not (0 <= index < size):
             raise IndexError("String index out of range")
-        
-        return (self._small if self._is_small else self._large)[index]
+
+        if w == 1:
+            return chr(self._buf[index])
+        return self._buf[index * 4:index * 4 + 4].decode(_WIDE, _WIDE_ERRORS)
 
     def __setitem__(self, index: int, value: str):
-        if index < 0: index += self._size
-        if not (0 <= index < self._size):
+        size = self._size
+        if index < 0: index += size
+        if not (0 <= index < size):
             raise IndexError("String index out of range")
-        
-        val = self._validate_char(value)
-        (self._small if self._is_small else self._large)[index] = val
+
+        data = self._encode(self._validate_char(value))
+        w = self._width
+        self._buf[index * w:index * w + w] = data
+        self._hash = None
 
     def at(self, index: int) -> str:
         return self[index]
-    
+
     def front(self) -> str:
         return self[0]
-    
+
     def back(self) -> str:
         return self[self._size - 1]
-    
+
     def c_str(self) -> str:
         """Returns native Python string."""
-        if self._size == 0:
-            return ""
-        src = self._small if self._is_small else self._large
-        # Efficient join of py_objects
-        # We need to extract them to a list first because join expects iterator
-        # slicing a ctypes array might not work directly with join
-        return "".join([src[i] for i in range(self._size)])
+        if self._width == 1:
+            return self._buf.decode(_NARROW)
+        return self._buf.decode(_WIDE, _WIDE_ERRORS)
 
     def __str__(self) -> str:
         return self.c_str()
 
+    def _decode_range(self, start: int, stop: int) -> str:
+        """Decodes characters [start, stop) straight from the storage."""
+        w = self._width
+        data = self._buf[start * w:stop * w]
+        if w == 1:
+            return data.decode(_NARROW)
+        return data.decode(_WIDE, _WIDE_ERRORS)
+
+    def _search_text(self) -> str:
+        return self.c_str()
+
     def __repr__(self) -> str:
         return f'String("{self.c_str()}")'
 
     # --------------------- Capacity ---------------------
     def size(self) -> int: return self._size
     def length(self) -> int: return self._size
-    def empty(self) -> bool: return self._size == 0
+    def empty(self) -> bool: return not self._buf
     def capacity(self) -> int: return self._capacity
-    
+
     def reserve(self, n: int):
-        if n > self._capacity:
-            self._resize_capacity(n)
+        self._reserve_for(n)
 
     def resize(self, n: int, c: str = '\0'):
-        if n < self._size:
-            self._size = n
-            # Data remains but is inaccessible, strictly safe.
-        elif n > self._size:
-            if n > self._capacity:
-                self.reserve(n)
-            
-            val = self._validate_char(c)
-            tgt = self._small if self._is_small else self._large
-            for i in range(self._size, n):
-                tgt[i] = val
-            self._size = n
+        size = self._size
+        if n < size:
+            del self._buf[n * self._width:]
+        elif n > size:
+            data = self._encode(self._validate_char(c))
+            self._reserve_for(n)
+            self._buf += data * (n - size)
+        self._hash = None
 
     def shrink_to_fit(self):
+        """Releases spare capacity and narrows wide storage back to one byte
+        per character when every character allows it."""
+        if self._width == 4:
+            try:
+                self._buf = bytearray(self.c_str().encode(_NARROW))
+                self._width = 1
+            except UnicodeEncodeError:
+                pass
         if self._is_small:
             return
         if self._size <= self._SSO_CAP:
             # Move back to small
-            small = [None] * (self._SSO_CAP + 1)
-            for i in range(self._size):
-                small[i] = self._large[i]
-            self._small = small
-            self._large = None
             self._is_small = True
             self._capacity = self._SSO_CAP
-        elif self._size < self._capacity:
-            self._resize_capacity(self._size)
+        else:
+            self._capacity = self._size
 
     # --------------------- Operations ---------------------
     def __add__(self, other: Union[str, 'String']) -> 'String':
@@ -268,95 +271,83 @@ class String(Sequence):
         return self
 
     def substr(self, pos: int = 0, count: int = -1) -> 'String':
-        if pos < 0 or pos > self._size:
+        size = self._size
+        if pos < 0 or pos > size:
             raise IndexError("pos out of range")
-        if count == -1 or pos + count > self._size:
-            count = self._size - pos
-        
+        if count == -1 or pos + count > size:
+            count = size - pos
+
         # Use existing slice logic
         return self[pos : pos + count]
 
     def find(self, sub: str, pos: int = 0) -> int:
-        # Optimization: To avoid building huge strings, check first char then compare
-        # But native string search is extremely optimized.
-        # For now, convert to string and search.
-        s = self.c_str()
-        return s.find(sub, pos)
+        needle = self._needle(sub)
+        if needle is None:
+            return -1
+        if pos < 0:
+            pos = max(0, pos + self._size)
+        buf, w = self._buf, self._width
+        i = buf.find(needle, pos * w)
+        # In wide storage a match must also start on a character boundary
+        while i > 0 and i % w:
+            i = buf.find(needle, i + 1)
+        return i if i < 0 else i // w
 
     def rfind(self, sub: str, pos: int = -1) -> int:
         """Find last occurrence of sub at or before pos.
-        
+
         C++ rfind(str, pos) searches for last occurrence starting at or before pos.
         """
-        s = self.c_str()
-        if pos == -1 or pos >= self._size:
-            return s.rfind(sub)
-        # C++ semantics: search for sub ending at or before pos
+        needle = self._needle(sub)
+        if needle is None:
+            return -1
+        buf, w = self._buf, self._width
+        size = len(buf) // w
         # Python rfind(sub, start, end) searches in [start, end)
-        return s.rfind(sub, 0, pos + 1)
+        end = len(buf) if pos == -1 or pos >= size else (pos + 1) * w
+        i = buf.rfind(needle, 0, end)
+        while i > 0 and i % w:
+            i = buf.rfind(needle, 0, i - 1 + len(needle))
+        return i if i < 0 else i // w
 
     def compare(self, other: Union[str, 'String']) -> int:
-        s = self.c_str()
-        o = str(other)
+        if isinstance(other, String) and other._width == self._width:
+            # Fixed-width storage compares byte-wise in code point order
+            s, o = self._buf, other._buf
+        else:
+            s, o = self.c_str(), str(other)
         if s < o: return -1
         if s > o: return 1
         return 0
 
+    def find_all(self, sub: str, pos: int = 0, overlapping: bool = False) -> Iterator[int]:
+        """Yields the index of every occurrence of sub from pos on."""
+        step = 1 if overlapping else max(1, len(str(sub)))
+        i = self.find(sub, pos)
+        while i != -1:
+            yield i
+            i = self.find(sub, i + step)
+
+    # The find_*_of family scans the latin-1 storage directly (one byte per
+    # character) with a cached, compiled character-set table.
+    def _scan_text(self) -> Union[bytearray, str]:
+        return self._buf if self._width == 1 else self.c_str()
+
     def find_first_of(self, chars: str, pos: int = 0) -> int:
         """Finds the first occurrence of any character from the set."""
-        if pos < 0: pos += self._size
-        if pos < 0: pos = 0
-        
-        src = self._small if self._is_small else self._large
-        charset = set(chars)
-        for i in range(pos, self._size):
-            if src[i] in charset:
-                return i
-        return -1
+        return char_set(str(chars)).first_of(self._scan_text(), pos)
 
     def find_last_of(self, chars: str, pos: int = -1) -> int:
         """Finds the last occurrence of any character from the set at or before pos."""
-        if pos == -1 or pos >= self._size:
-            pos = self._size - 1
-        elif pos < 0:
-            pos += self._size
-        
-        if pos < 0: return -1 # Still negative? Empty or out of bounds
-
-        src = self._small if self._is_small else self._large
-        charset = set(chars)
-        for i in range(pos, -1, -1):
-            if src[i] in charset:
-                return i
-        return -1
+        return char_set(str(chars)).last_of(self._scan_text(), pos)
 
     def find_first_not_of(self, chars: str, pos: int = 0) -> int:
         """Finds the first occurrence of any character NOT from the set."""
-        if pos < 0: pos += self._size
-        if pos < 0: pos = 0
-        
-        src = self._small if self._is_small else self._large
-        charset = set(chars)
-        for i in range(pos, self._size):
-            if src[i] not in charset:
-                return i
-        return -1
+        return char_set(str(chars)).first_not_of(self._scan_text(), pos)
 
     def find_last_not_of(self, chars: str, pos: int = -1) -> int:
         """Finds the last occurrence of any character NOT from the set at or before pos."""
-        if pos == -1 or pos >= self._size:
-            pos = self._size - 1
-        elif pos < 0:
-            pos += self._size
-            
-        if pos < 0: return -1
-
-        src = self._small if self._is_small else self._large
-        charset = set(chars)
-        for i in range(pos, -1, -1):
-            if src[i] not in charset:
-                return i
-        return -1
+        return char_set(str(chars)).last_not_of(self._scan_text(), pos)
 
     # --------------------- Case Conversions ---------------------
     def to_upper(self) -> 'String':
@@ -373,15 +364,32 @@ class String(Sequence):
 
     # --------------------- Comparisons ---------------------
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, (String, str)):
-            return self.compare(other) == 0
+        if isinstance(other, String):
+            if other is self:
+                return True
+            if self._hash is not None and other._hash is not None and self._hash != other._hash:
+                return False
+            if other._width == self._width:
+                return self._buf == other._buf
+            return self.c_str() == other.c_str()
+        if isinstance(other, str):
+            return self.c_str() == other
         return NotImplemented
 
     def __ne__(self, other: object) -> bool:
         if isinstance(other, (String, str)):
-            return self.compare(other) != 0
+            return not (self == other)
         return NotImplemented
 
+    def __hash__(self) -> int:
+        # Equal to hash(str(self)), so a String and an equal str find the
+        # same dict / UnorderedMap entry. Computed once per mutation: like
+        # any key, a String must not be mutated while it is stored as one.
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(self.c_str())
+        return h
+
     def __lt__(self, other: Union[String, str]) -> bool:
         if isinstance(other, (String, str)):
             return self.compare(other) < 0
@@ -403,27 +411,50 @@ class String(Sequence):
         return NotImplemented
 
     # --------------------- Predicates (C++20) ---------------------
+    # Fixed-width storage: a byte-wise prefix/suffix match is always
+    # aligned to character boundaries.
     def starts_with(self, prefix: Union[str, 'String', 'StringView']) -> bool:
-        # Avoid circular import if possible, explicit check
-        p_str = str(prefix)
-        if self._size < len(p_str):
-            return False
-        # Optimization: check directly
-        return self.c_str().startswith(p_str)
+        needle = self._needle(prefix)
+        return needle is not None and self._buf.startswith(needle)
 
     def ends_with(self, suffix: Union[str, 'String', 'StringView']) -> bool:
-        s_str = str(suffix)
-        return self.c_str().endswith(s_str)
+        needle = self._needle(suffix)
+        return needle is not None and self._buf.endswith(needle)
 
     def contains(self, sub: Union[str, 'String', 'StringView']) -> bool:
         return self.find(str(sub)) != -1
 
     # --------------------- Iteration ---------------------
     def __iter__(self) -> Iterator[str]:
-        src = self._small if self._is_small else self._large
-        for i in range(self._size):
-            yield src[i]
-    
+        return iter(self.c_str())
+
     def __len__(self) -> int:
         return self._size
 
+
+class FrozenString(String):
+    """
+    An immutable String. Its hash is computed once at construction, and
+    the mutating methods raise TypeError. `intern()` and `StringPool` hand
+    out shared FrozenString instances, so equal interned strings are the
+    same object and compare by identity.
+    """
+    __slots__ = ('__weakref__',)
+
+    def __init__(self, source: Union[str, Iterable[str], 'String', None] = None):
+        String.__init__(self)
+        if source is not None:
+            String.append(self, source)
+        self._hash = hash(self.c_str())
+
+    def _immutable(self, *args: Any, **kwargs: Any):
+        raise TypeError("FrozenString is immutable")
+
+    assign = append = push_back = pop_back = insert = erase = clear = _immutable
+    replace = swap = resize = __setitem__ = to_upper = to_lower = _immutable
+
+    def __iadd__(self, other: Union[str, 'String']) -> 'String':
+        return self + other # Rebinds to a new String, like str
+
+    def __repr__(self) -> str:
+        return f'FrozenString("{self.c_str()}")'
@@ -1,26 +1,52 @@
-from typing import Union, Optional, Any
+from typing import Union, Optional, Any, Iterator
 from .string import String
+from .search import _bfind, _brfind
+
+_TEXT, _STRING, _BYTES = 0, 1, 2 # Source kinds
+
 
 class StringView:
     """
     A non-owning reference to a string or substring.
     Mimics C++17 std::string_view.
+
+    The source can be a `str`, a `String`, or a bytes-like buffer (`bytes`,
+    `bytearray`, `mmap`, `memoryview`). Over a buffer, positions are byte
+    offsets, elements are byte values, and `encoding` is used by `str()` and
+    to encode `str` needles. find / starts_with / split / lines work on the
+    source in place and hand out sub-views, so nothing is copied until a
+    caller asks for `str()` or `tobytes()`. Like its C++ counterpart, a view
+    is invalidated when a mutable source is modified.
     """
-    __slots__ = ('_source', '_start', '_len')
+    __slots__ = ('_source', '_start', '_len', '_kind', '_encoding')
 
-    def __init__(self, source: Union[str, String, 'StringView'], offset: int = 0, count: int = -1):
+    def __init__(self, source: Union[str, String, 'StringView', bytes, bytearray, memoryview, Any],
+                 offset: int = 0, count: int = -1, encoding: str = 'utf-8'):
         if isinstance(source, StringView):
             self._source = source._source
+            self._kind = source._kind
+            self._encoding = source._encoding
             base_start = source._start
             base_len = source._len
         else:
+            if isinstance(source, str):
+                self._kind = _TEXT
+            elif isinstance(source, String):
+                self._kind = _STRING
+            else:
+                self._kind = _BYTES
+                if isinstance(source, memoryview) and source.format != 'B':
+                    source = source.cast('B')
+                elif not isinstance(source, (bytes, bytearray, memoryview)) and not hasattr(source, 'find'):
+                    source = memoryview(source).cast('B')
             self._source = source
+            self._encoding = encoding
             base_start = 0
             base_len = len(source)
-        
+
         if offset < 0:
             offset = 0 # Match C++ behavior? C++ throws out_of_range if pos > size.
-        
+
         if offset > base_len:
             # In C++ constructor, if pos > size, it throws.
             # Here we clamp or throw? Let's throw to match C++ strictness or valid python slicing?
@@ -31,67 +57,97 @@ class StringView:
             # Let's assume this handles the logic: view(source, offset, count)
             # effectively source.substr(offset, count) as a view.
             offset = base_len # Empty view
-        
+
         self._start = base_start + offset
-        
+
         max_len = base_len - offset
         if count == -1 or count > max_len:
             self._len = max_len
         else:
             self._len = count
 
+    def _sub(self, start: int, length: int) -> 'StringView':
+        # Sub-view at absolute position `start` of the same source
+        view = StringView.__new__(StringView)
+        view._source = self._source
+        view._kind = self._kind
+        view._encoding = self._encoding
+        view._start = start
+        view._len = length
+        return view
+
+    # --------------------- Element Access ---------------------
     def __len__(self) -> int:
         return self._len
 
+    def size(self) -> int:
+        return self._len
+
     def empty(self) -> bool:
         return self._len == 0
 
-    def at(self, index: int) -> str:
+    def at(self, index: int) -> Union[str, int]:
         if index < 0 or index >= self._len:
             raise IndexError("StringView index out of range")
         return self._source[self._start + index]
 
-    def __getitem__(self, index: Union[int, slice]) -> Union[str, 'StringView']:
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, int, 'StringView']:
         if isinstance(index, slice):
             start, stop, step = index.indices(self._len)
             if step != 1:
-                # StringView doesn't support stride != 1 efficiently without copying
-                # Return string? Or fail?
-                # C++ doesn't have strided view.
-                # Let's return a new StringView if step is 1, else raise/copy.
+                # C++ doesn't have strided views
                 raise ValueError("StringView does not support strided slicing")
-            
-            # New view relative to this one
-            new_offset = start # relative to 0 of this view
-            new_count = stop - start
-            return StringView(self._source, self._start + new_offset - (self._source._start if isinstance(self._source, StringView) else 0), new_count) 
-            # Wait, recursion in logic. Simpler:
-            # We are creating a NEW view.
-            # Pass THIS view as source?
-            return StringView(self, start, stop - start)
+            return self._sub(self._start + start, max(0, stop - start))
 
         if index < 0: index += self._len
         if not (0 <= index < self._len):
             raise IndexError("StringView index out of range")
         return self._source[self._start + index]
 
+    def __iter__(self) -> Iterator[Union[str, int]]:
+        if self._kind == _STRING:
+            return iter(str(self))
+        src, start = self._source, self._start
+        return map(src.__getitem__, range(start, start + self._len))
+
+    # --------------------- Conversions ---------------------
     def __str__(self) -> str:
         # Materialize
-        if isinstance(self._source, str):
-            return self._source[self._start : self._start + self._len]
-        # String object
-        # We can implement a bulk fetch if String supports it, or looping
-        # String.substr returns a String (copy).
-        # We want a python str.
-        # String.c_str() returns full string.
-        # If String exposes slicing that returns str, use that?
-        # String slice returns String.
-        # Let's iterate.
-        return "".join([self._source[self._start + i] for i in range(self._len)])
-    
+        src, start, end = self._source, self._start, self._start + self._len
+        if self._kind == _TEXT:
+            return src[start:end]
+        if self._kind == _STRING:
+            return src._decode_range(start, end)
+        return self._raw_bytes(start, end).decode(self._encoding)
+
+    def __repr__(self) -> str:
+        return f"StringView({str(self)!r})"
+
+    def _raw_bytes(self, start: int, end: int) -> bytes:
+        data = self._source[start:end]
+        return data if isinstance(data, bytes) else bytes(data)
+
+    def tobytes(self) -> bytes:
+        """The viewed bytes (text views are encoded with `encoding`)."""
+        if self._kind == _BYTES:
+            return self._raw_bytes(self._start, self._start + self._len)
+        return str(self).encode(self._encoding)
+
+    def memoryview(self) -> memoryview:
+        """Zero-copy buffer over a bytes-like source."""
+        if self._kind != _BYTES:
+            raise TypeError("memoryview requires a bytes-like source")
+        return memoryview(self._source)[self._start:self._start + self._len]
+
     def to_string(self) -> String:
         return String(str(self))
 
+    def _search_text(self) -> Any:
+        if self._kind == _BYTES:
+            return self.memoryview()
+        return str(self)
+
+    # --------------------- Modifiers ---------------------
     def remove_prefix(self, n: int):
         if n > self._len:
             n = self._len
@@ -103,13 +159,165 @@ class StringView:
             n = self._len
         self._len -= n
 
-    def starts_with(self, prefix: Union[str, String, 'StringView']) -> bool:
-        return str(self).startswith(str(prefix))
+    # --------------------- Search ---------------------
+    # Needles are converted once to the source's representation: str for
+    # text, encoded bytes for buffers, and the String's own storage encoding
+    # (searched in its bytearray with character alignment) for String.
+    def _needle(self, sub: Any) -> Any:
+        kind = self._kind
+        if kind == _TEXT:
+            return str(sub)
+        if kind == _STRING:
+            return self._source._needle(sub)
+        if isinstance(sub, StringView) and sub._kind == _BYTES:
+            return sub.tobytes()
+        if isinstance(sub, (bytes, bytearray, memoryview)):
+            return bytes(sub)
+        return str(sub).encode(self._encoding)
+
+    def _units(self, needle: Any) -> int:
+        # Needle length in view positions
+        if self._kind == _STRING:
+            return len(needle) // self._source._width
+        return len(needle)
+
+    def _find(self, needle: Any, pos: int) -> int:
+        if needle is None or pos > self._len:
+            return -1
+        src, start, end = self._source, self._start + pos, self._start + self._len
+        kind = self._kind
+        if kind == _TEXT:
+            i = src.find(needle, start, end)
+        elif kind == _BYTES:
+            i = _bfind(src, needle, start, end)
+        else:
+            buf, w = src._buf, src._width
+            i = buf.find(needle, start * w, end * w)
+            while i > 0 and i % w:
+                i = buf.find(needle, i + 1, end * w)
+            if i >= 0:
+                i //= w
+        return i if i < 0 else i - self._start
+
+    def find(self, sub: Union[str, String, 'StringView', bytes], pos: int = 0) -> int:
+        """Position of the first occurrence of sub at or after pos, or -1."""
+        return self._find(self._needle(sub), pos)
+
+    def rfind(self, sub: Union[str, String, 'StringView', bytes], pos: int = -1) -> int:
+        """Position of the last occurrence of sub at or before pos (ending by pos + 1, as String.rfind), or -1."""
+        needle = self._needle(sub)
+        if needle is None:
+            return -1
+        limit = self._len if pos < 0 else min(self._len, pos + 1)
+        src, start, end = self._source, self._start, self._start + limit
+        kind = self._kind
+        if kind == _TEXT:
+            i = src.rfind(needle, start, end)
+        elif kind == _BYTES:
+            i = _brfind(src, needle, start, end)
+        else:
+            buf, w = src._buf, src._width
+            i = buf.rfind(needle, start * w, end * w)
+            while i > 0 and i % w:
+                i = buf.rfind(needle, start * w, i - 1 + len(needle))
+            if i >= 0:
+                i //= w
+        return i if i < 0 else i - start
+
+    def contains(self, sub: Union[str, String, 'StringView', bytes]) -> bool:
+        return self.find(sub) != -1
+
+    def starts_with(self, prefix: Union[str, String, 'StringView', bytes]) -> bool:
+        needle = self._needle(prefix)
+        if needle is None or self._units(needle) > self._len:
+            return False
+        return self._matches_at(needle, self._start)
+
+    def ends_with(self, suffix: Union[str, String, 'StringView', bytes]) -> bool:
+        needle = self._needle(suffix)
+        if needle is None:
+            return False
+        n = self._units(needle)
+        if n > self._len:
+            return False
+        return self._matches_at(needle, self._start + self._len - n)
+
+    def _matches_at(self, needle: Any, pos: int) -> bool:
+        # Compares only len(needle) elements of the source at absolute pos
+        src = self._source
+        if self._kind == _TEXT:
+            return src.startswith(needle, pos)
+        if self._kind == _STRING:
+            w = src._width
+            return src._buf.startswith(needle, pos * w)
+        return src[pos:pos + len(needle)] == needle
 
-    def ends_with(self, suffix: Union[str, String, 'StringView']) -> bool:
-        return str(self).endswith(str(suffix))
-    
     def substr(self, pos: int = 0, count: int = -1) -> 'StringView':
         if pos >= self._len:
             return StringView(self, self._len, 0)
         return StringView(self, pos, count)
+
+    # --------------------- Tokenizing ---------------------
+    def split(self, delim: Union[str, String, 'StringView', bytes],
+              maxsplit: int = -1) -> Iterator['StringView']:
+        """
+        Yields the sub-views between occurrences of delim (like str.split
+        with an explicit separator, empty fields included), without copying.
+        """
+        needle = self._needle(delim)
+        if needle is None:
+            yield self._sub(self._start, self._len)
+            return
+        n = self._units(needle)
+        if n == 0:
+            raise ValueError("empty separator")
+        pos = 0
+        while maxsplit != 0:
+            i = self._find(needle, pos)
+            if i == -1:
+                break
+            yield self._sub(self._start + pos, i - pos)
+            pos = i + n
+            maxsplit -= 1
+        yield self._sub(self._start + pos, self._len - pos)
+
+    def lines(self, keepends: bool = False) -> Iterator['StringView']:
+        """
+        Yields each line as a sub-view. Lines end at '\\n' (a preceding '\\r'
+        is dropped too unless keepends); a final newline does not start an
+        extra empty line.
+        """
+        newline = self._needle('\n')
+        cr = 13 if self._kind == _BYTES else '\r'
+        src, base, length = self._source, self._start, self._len
+        pos = 0
+        while pos < length:
+            i = self._find(newline, pos)
+            if i == -1:
+                stop = nxt = length
+            else:
+                stop, nxt = i, i + 1
+            if keepends:
+                stop = nxt
+            elif stop > pos and src[base + stop - 1] == cr:
+                stop -= 1
+            yield self._sub(base + pos, stop - pos)
+            pos = nxt
+
+    # --------------------- Comparisons ---------------------
+    # Text views compare (and hash) like str; buffer views like bytes.
+    def __eq__(self, other: object) -> bool:
+        if self._kind == _BYTES:
+            if isinstance(other, StringView):
+                return other._kind == _BYTES and self._len == other._len and self.tobytes() == other.tobytes()
+            if isinstance(other, (bytes, bytearray, memoryview)):
+                return self._len == len(other) and self.tobytes() == bytes(other)
+            return NotImplemented
+        if isinstance(other, StringView):
+            return other._kind != _BYTES and self._len == other._len and str(self) == str(other)
+        if isinstance(other, (str, String)):
+            return self._len == len(other) and str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.tobytes() if self._kind == _BYTES else str(self))
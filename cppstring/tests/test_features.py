@@ -1,6 +1,7 @@
 import pytest
 import io
-from cppstring import String, StringView, to_string, stoi, stof, getline
+from cppstring import String, StringView, to_string, stoi, stof, getline, lines
+from cppstring import stoul, stod, stoi_many, stoul_many, stod_many, to_string_many, join_numbers
 
 def test_comparisons():
     s1 = String("apple")
@@ -132,3 +133,222 @@ def test_case_conversions():
     s_german.to_upper()
     assert s_german == "MSS" # 'ß' -> 'SS'
     assert len(s_german) == 3
+
+def test_string_view_search_and_split():
+    s = String("a,bb,,ccc")
+    sv = StringView(s)
+    assert sv.find("bb") == 2
+    assert sv.find(",", 2) == 4
+    assert sv.rfind(",") == 5
+    assert sv.find("zz") == -1
+    parts = list(sv.split(","))
+    assert [str(p) for p in parts] == "a,bb,,ccc".split(",")
+    assert all(isinstance(p, StringView) for p in parts)
+    assert [str(p) for p in sv.split(",", 1)] == ["a", "bb,,ccc"]
+    with pytest.raises(ValueError):
+        list(sv.split(""))
+
+    sub = sv.substr(2, 5) # "bb,,c"
+    assert sub.starts_with("bb") and sub.ends_with(",c")
+    assert not sub.ends_with("cc")
+    assert sub.find(",c") == 3
+
+    wide = String("αβγ,δ")
+    assert [str(p) for p in StringView(wide).split(",")] == ["αβγ", "δ"]
+    assert StringView(wide, 1).starts_with("βγ")
+    assert StringView(wide).find("δ") == 4
+
+    text = "one\r\ntwo\n\nthree\n"
+    assert [str(l) for l in StringView(text).lines()] == text.splitlines()
+    assert [str(l) for l in StringView(text).lines(keepends=True)] == text.splitlines(True)
+    assert [str(l) for l in StringView("x\ny").lines()] == ["x", "y"]
+
+def test_string_view_buffers():
+    import mmap
+    import tempfile
+
+    data = b"GET /a 200\nPOST /b 500\nGET /c 404\n"
+    for source in (data, bytearray(data), memoryview(data)):
+        sv = StringView(source)
+        assert len(sv) == len(data)
+        assert sv[0] == ord("G")
+        lines = list(sv.lines())
+        assert [l.tobytes() for l in lines] == data.splitlines()
+        assert lines[1].starts_with("POST") and lines[1].ends_with(b"500")
+        assert str(lines[2]) == "GET /c 404"
+        assert [f.tobytes() for f in lines[0].split(" ")] == [b"GET", b"/a", b"200"]
+        assert sv.find("/b") == 16
+        assert sv.rfind("GET") == 23
+        assert lines[1] == b"POST /b 500"
+
+    # The sub-views share the source; memoryview() exposes them zero-copy
+    buf = bytearray(data)
+    first = next(StringView(buf).lines())
+    buf[0:3] = b"PUT"
+    assert first.memoryview().tobytes() == b"PUT /a 200"
+
+    with tempfile.TemporaryFile() as f:
+        f.write("héllo\nwörld".encode("utf-8"))
+        f.flush()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            sv = StringView(mm)
+            assert [str(l) for l in sv.lines()] == ["héllo", "wörld"]
+            assert sv.find("wörld") == 7
+            del sv
+
+def test_getline_chunked(monkeypatch):
+    import cppstring.io as cio
+    monkeypatch.setattr(cio, "_CHUNK", 4) # Force records and delimiters to straddle reads
+
+    stream = io.StringIO("alpha::beta::::gamma")
+    s = String()
+    out = []
+    for _ in range(4):
+        getline(stream, s, "::")
+        out.append(str(s))
+    assert out == ["alpha", "beta", "", "gamma"]
+    getline(stream, s, "::")
+    assert s.empty()
+
+    raw = io.BytesIO("x;héllo;y".encode("utf-8"))
+    stream = io.BufferedReader(raw, buffer_size=8)
+    getline(stream, s, ";")
+    assert s == "x"
+    getline(stream, s, ";")
+    assert s == "héllo"
+    assert stream.read() == b"y" # Nothing was read past the delimiter
+
+    stream = io.BytesIO(b"a\r\nb")
+    getline(stream, s)
+    assert s == "a\r"
+    getline(stream, s)
+    assert s == "b"
+
+def test_lines():
+    import tempfile
+
+    text = "one\ntwo\n\nthree\n"
+    assert [str(l) for l in lines(io.StringIO(text))] == ["one", "two", "", "three"]
+    assert all(isinstance(l, String) for l in lines(io.StringIO(text)))
+    views = list(lines(io.BytesIO(text.encode()), view=True))
+    assert all(isinstance(v, StringView) for v in views)
+    assert [str(v) for v in views] == ["one", "two", "", "three"]
+    assert [str(l) for l in lines(io.StringIO("a|b||c"), "|")] == ["a", "b", "", "c"]
+
+    with tempfile.TemporaryFile() as f:
+        f.write("head\nαβ\ntail".encode("utf-8"))
+        f.seek(0)
+        s = String()
+        getline(f, s) # lines() continues from the current position
+        assert s == "head"
+        assert [str(l) for l in lines(f)] == ["αβ", "tail"]
+        assert f.read() == b""
+
+        f.seek(0)
+        it = lines(f, view=True)
+        first = next(it)
+        assert first.tobytes() == b"head"
+        it.close()
+        assert f.tell() == 5 # Positioned after the last record yielded
+
+def test_strict_conversions():
+    assert stoi("2147483647", strict=True) == 2147483647
+    with pytest.raises(OverflowError):
+        stoi("2147483648", strict=True)
+    assert stoi("2147483648") == 2147483648 # Unbounded unless strict
+    assert stoul("-1", strict=True) == 2 ** 64 - 1 # Wraps like std::stoul
+    with pytest.raises(OverflowError):
+        stoul(str(2 ** 64), strict=True)
+    assert stoi(StringView(b"x42", 1)) == 42
+    assert stod(StringView(b"2.5")) == 2.5
+
+def test_batch_conversions():
+    assert stoi_many(["1", String("-2"), StringView("x3", 1), b"4"]) == [1, -2, 3, 4]
+    assert stoi_many("10,20,30\n", sep=",") == [10, 20, 30]
+    assert stoi_many(b"1\n2\n3\n", sep="\n") == [1, 2, 3]
+    assert stoi_many(String("ff;10"), sep=";", base=16) == [255, 16]
+    big = str(2 ** 70)
+    assert stoi_many("1," + big, sep=",") == [1, 2 ** 70] # Beyond int64 stays exact
+    assert stoi_many("1_000,2", sep=",") == [1000, 2]
+    with pytest.raises(ValueError):
+        stoi_many("1,,2", sep=",")
+    with pytest.raises(OverflowError):
+        stoi_many("1,3000000000", sep=",", strict=True)
+    assert stoul_many(["-1", "5"], strict=True) == [2 ** 64 - 1, 5]
+
+    assert stod_many("1.5,2,-0.25", sep=",") == [1.5, 2.0, -0.25]
+    assert stod_many([StringView(b"1e3"), "nan"])[0] == 1000.0
+    with pytest.raises(ValueError):
+        stod_many("1.5,x", sep=",")
+
+    strings = to_string_many([1, 2.5])
+    assert strings == ["1", "2.5"] and all(isinstance(s, String) for s in strings)
+    assert join_numbers([1, 2, 3]) == "1,2,3"
+    assert join_numbers([0.5, 1.25], sep=" ", fmt=".1f") == "0.5 1.2"
+    assert stoi_many(str(join_numbers(range(1000))), sep=",") == list(range(1000))
+
+
+def test_batch_parse_whitespace_separator():
+    with pytest.raises(ValueError):
+        stoi_many("1 2  3", sep=" ")
+    with pytest.raises(ValueError):
+        stod_many("1.5\n\n2", sep="\n")
+    assert stoi_many("1 2 3 ", sep=" ") == [1, 2, 3]
+
+
+def test_rfind_position_matches_string_and_rope(monkeypatch):
+    from cppstring import Rope
+    import cppstring.search as search_mod
+    text = "abcabc"
+    for pos in range(-1, 8):
+        expected = String(text).rfind("bc", pos)
+        assert Rope(text).rfind("bc", pos) == expected
+        assert StringView(text).rfind("bc", pos) == expected
+        assert StringView(String(text)).rfind("bc", pos) == expected
+        assert StringView(memoryview(text.encode())).rfind("bc", pos) == expected
+    assert StringView("abcabc").rfind("bc", 4) == 1
+
+    # Backward window scan over a memoryview: matches straddling windows and overlapping ones
+    monkeypatch.setattr(search_mod, "_RCHUNK", 4)
+    data = b"xaaxxxxxxabxxxx"
+    view = StringView(memoryview(data))
+    for needle in (b"ab", b"xa", b"aa", b"xxx", b"q", b""):
+        assert view.rfind(needle) == data.rfind(needle)
+        assert view.rfind(needle, 6) == data.rfind(needle, 0, 7)
+
+
+def test_search_memoryview_haystack_in_place(tmp_path):
+    import mmap
+    from cppstring import Searcher, AhoCorasick, CharSet
+    from cppstring.search import _haystack
+    data = b"GET /a HTTP\nPOST /b HTTP\nGET /c HTTP\n"
+    path = tmp_path / "log"
+    path.write_bytes(data)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = StringView(mm, 12)
+        hay = _haystack(view)
+        assert isinstance(hay, memoryview) and hay.obj is mm # Not copied
+        hay.release()
+        tail = data[12:]
+        s = Searcher(b"GET")
+        assert s.find(view) == tail.find(b"GET")
+        assert s.rfind(view) == tail.rfind(b"GET")
+        assert list(s.find_all(view)) == [tail.find(b"GET")]
+        assert Searcher(b"HTTP").count(view) == 2
+        ac = AhoCorasick([b"POST", b"GET"])
+        assert ac.findall(view) == [(0, b"POST"), (13, b"GET")]
+        assert ac.contains_any(view)
+        assert CharSet("/").first_of(view) == tail.find(b"/")
+
+def test_getline_untranslated_newlines(tmp_path):
+    path = tmp_path / "records.txt"
+    path.write_bytes(b"a\rb\nc\r\nd")
+    # newline='' lets readline stop at a lone '\r'; records still end at '\n'
+    with open(path, newline="") as f:
+        s = String()
+        getline(f, s)
+        assert s == "a\rb"
+        assert [str(l) for l in lines(f)] == ["c\r", "d"]
+    path.write_bytes(b"x\ny\r\nz")
+    with open(path, newline="\r\n") as f: # readline runs past the lone '\n'
+        assert [str(l) for l in lines(f)] == ["x", "y\r", "z"]
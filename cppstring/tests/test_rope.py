@@ -0,0 +1,65 @@
+import unittest
+import random
+from cppstring import Rope, String
+
+class TestRope(unittest.TestCase):
+    def test_string_api(self):
+        r = Rope("Hello")
+        r.push_back('!')
+        r.pop_back()
+        r.append(", World")
+        r.insert(5, " there")
+        self.assertEqual(str(r), "Hello there, World")
+        r.erase(5, 6)
+        r.replace(7, 5, "Python")
+        self.assertEqual(r, "Hello, Python")
+        self.assertEqual(r, String("Hello, Python"))
+        self.assertEqual(r.size(), 13)
+        self.assertEqual(r[0], 'H')
+        self.assertEqual(r[-1], 'n')
+        r[0] = 'h'
+        self.assertEqual(r.front(), 'h')
+        self.assertEqual(r.find("Py"), 7)
+        self.assertEqual(r.substr(7).c_str(), "Python")
+        self.assertIsInstance(r[1:3], Rope)
+        self.assertTrue(r.starts_with("hello"))
+        self.assertTrue(r < "z")
+        self.assertEqual(r.find_first_of("o,"), 4)
+        with self.assertRaises(IndexError):
+            r.insert(100, "x")
+        with self.assertRaises(ValueError):
+            r.push_back("xy")
+        r.clear()
+        self.assertTrue(r.empty())
+
+    def test_random_edits(self):
+        rng = random.Random(11)
+        Rope._CHUNK, chunk = 8, Rope._CHUNK # Small pieces exercise the tree
+        try:
+            r = Rope("seed text for the rope")
+            ref = "seed text for the rope"
+            for _ in range(2000):
+                op = rng.randrange(3)
+                if op == 0 or not ref:
+                    pos = rng.randrange(len(ref) + 1)
+                    text = ''.join(rng.choice('abcxyz') for _ in range(rng.randrange(1, 20)))
+                    r.insert(pos, text)
+                    ref = ref[:pos] + text + ref[pos:]
+                elif op == 1:
+                    pos = rng.randrange(len(ref))
+                    count = rng.randrange(1, 10)
+                    r.erase(pos, count)
+                    ref = ref[:pos] + ref[pos + count:]
+                else:
+                    i = rng.randrange(len(ref))
+                    self.assertEqual(r[i], ref[i])
+                self.assertEqual(len(r), len(ref))
+            self.assertEqual(r.c_str(), ref)
+            r.shrink_to_fit()
+            self.assertEqual(r.c_str(), ref)
+            self.assertLessEqual(r.piece_count(), len(ref) // 8 + 1)
+        finally:
+            Rope._CHUNK = chunk
+
+if __name__ == '__main__':
+    unittest.main()
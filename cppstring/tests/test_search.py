@@ -0,0 +1,69 @@
+import unittest
+import random
+from cppstring import String, Rope, StringView, Searcher, CharSet, AhoCorasick, find_all
+
+class TestSearch(unittest.TestCase):
+    def test_searcher(self):
+        s = Searcher("ab")
+        self.assertEqual(s.find("xxabyab"), 2)
+        self.assertEqual(s.rfind(String("xxabyab")), 5)
+        self.assertEqual(list(s.find_all(b"abab-ab")), [0, 2, 5])
+        self.assertEqual(list(find_all("aaaa", "aa")), [0, 2])
+        self.assertEqual(list(find_all("aaaa", "aa", overlapping=True)), [0, 1, 2])
+        self.assertEqual(Searcher("é").find("café".encode()), 3) # UTF-8 bytes
+
+    def test_char_sets_match_loops(self):
+        rng = random.Random(5)
+        for _ in range(200):
+            text = ''.join(rng.choice('ab-]^\\Ā') for _ in range(rng.randrange(10)))
+            chars = ''.join(rng.choice('a-]^\\Ā') for _ in range(rng.randrange(4)))
+            pos = rng.randrange(-3, 12)
+            cs = CharSet(chars)
+            n = len(text)
+            start = max(0, pos + n) if pos < 0 else pos
+            last = n - 1 if pos == -1 or pos >= n else pos + n if pos < 0 else pos
+            first_of = next((i for i in range(start, n) if text[i] in chars), -1)
+            first_not = next((i for i in range(start, n) if text[i] not in chars), -1)
+            last_of = next((i for i in range(last, -1, -1) if text[i] in chars), -1)
+            last_not = next((i for i in range(last, -1, -1) if text[i] not in chars), -1)
+            for hay in (text, String(text), Rope(text)):
+                self.assertEqual(cs.first_of(hay, pos), first_of)
+                self.assertEqual(cs.first_not_of(hay, pos), first_not)
+                self.assertEqual(cs.last_of(hay, pos), last_of)
+                self.assertEqual(cs.last_not_of(hay, pos), last_not)
+            s = String(text)
+            self.assertEqual(s.find_first_of(chars, pos), first_of)
+            self.assertEqual(s.find_last_not_of(chars, pos), last_not)
+            if all(ord(c) < 128 for c in text):
+                self.assertEqual(cs.first_of(text.encode(), pos), first_of)
+
+    def test_find_all(self):
+        s = String("one two one two one")
+        self.assertEqual(list(s.find_all("one")), [0, 8, 16])
+        self.assertEqual(list(Rope(s).find_all("two", 5)), [12])
+        w = String("ĀaĀaĀ")
+        self.assertEqual(list(w.find_all("Ā")), [0, 2, 4])
+
+    def test_aho_corasick(self):
+        ac = AhoCorasick(["he", "she", "his", "hers"])
+        text = "ushers"
+        self.assertEqual(sorted(ac.findall(text)), [(1, 'she'), (2, 'he'), (2, 'hers')])
+        self.assertEqual(ac.findall(text, overlapping=False), [(1, 'she')])
+        self.assertEqual(sorted(ac.findall(b"ushers")), [(1, b'she'), (2, b'he'), (2, b'hers')])
+        self.assertEqual(sorted(ac.findall(String(text))), sorted(ac.findall(text)))
+        self.assertEqual(ac.findall(StringView(String("a his")), overlapping=False), [(2, 'his')])
+        self.assertTrue(ac.contains_any("xhisx"))
+        self.assertFalse(ac.contains_any("nothing"))
+
+        rng = random.Random(9)
+        patterns = ['ab', 'b', 'abc', 'bca', 'c', 'aab']
+        ac = AhoCorasick(patterns)
+        for _ in range(50):
+            text = ''.join(rng.choice('abc') for _ in range(30))
+            expected = sorted((i, p) for p in patterns for i in range(len(text)) if text.startswith(p, i))
+            self.assertEqual(sorted(ac.findall(text)), expected)
+        with self.assertRaises(ValueError):
+            AhoCorasick(["ok", ""])
+
+if __name__ == '__main__':
+    unittest.main()
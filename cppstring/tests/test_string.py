@@ -1,5 +1,5 @@
 import unittest
-from cppstring import String
+from cppstring import String, FrozenString, StringPool, StringView, intern
 
 class TestString(unittest.TestCase):
     def test_init(self):
@@ -97,5 +97,97 @@ class TestString(unittest.TestCase):
         with self.assertRaises(ValueError):
             s[0] = "xx"
 
+    def test_storage_widths(self):
+        s = String("caf\u00e9")
+        self.assertEqual(s._width, 1) # latin-1: one byte per character
+        s.push_back('\u20ac')
+        self.assertEqual(s._width, 4)
+        self.assertEqual(str(s), "caf\u00e9\u20ac")
+        self.assertEqual(s[4], '\u20ac')
+        self.assertEqual(s.find('\u20ac'), 4)
+        self.assertEqual(s.find('\u2603'), -1)
+        s.pop_back()
+        s.shrink_to_fit()
+        self.assertEqual(s._width, 1)
+        self.assertEqual(s, String("caf\u00e9"))
+        self.assertEqual(String("\U0001F600x")[1], 'x')
+
+    def test_matches_str(self):
+        import random
+        rng = random.Random(3)
+        alphabet = ['a', 'b', '\x00', '\x01', '\u0100', '\u0101', '\U00010000']
+        for _ in range(300):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randrange(12)))
+            sub = ''.join(rng.choice(alphabet) for _ in range(rng.randrange(3)))
+            other = ''.join(rng.choice(alphabet) for _ in range(rng.randrange(6)))
+            s = String(text)
+            pos = rng.randrange(-2, 14)
+            self.assertEqual(s.find(sub), text.find(sub))
+            self.assertEqual(s.find(sub, pos), text.find(sub, pos))
+            self.assertEqual(s.rfind(sub), text.rfind(sub))
+            self.assertEqual(s.starts_with(sub), text.startswith(sub))
+            self.assertEqual(s.ends_with(sub), text.endswith(sub))
+            self.assertEqual(s < String(other), text < other)
+            self.assertEqual(s == String(other), text == other)
+            self.assertEqual(str(s[1:4]), text[1:4])
+            self.assertEqual(str(s[::-1]), text[::-1])
+            if text:
+                s.insert(1, other)
+                s.erase(0, 1)
+                self.assertEqual(str(s), other + text[1:])
+
+    def test_hash(self):
+        s = String("key")
+        self.assertEqual(hash(s), hash("key"))
+        d = {s: 1}
+        self.assertEqual(d["key"], 1)
+        self.assertEqual(d[String("key")], 1)
+        s.push_back('s') # Mutation resets the cached hash
+        self.assertEqual(hash(s), hash("keys"))
+        for mutate in (lambda x: x.append("!"), lambda x: x.pop_back(), lambda x: x.insert(0, "\u0100"),
+                       lambda x: x.erase(0, 1), lambda x: x.resize(2), lambda x: x.__setitem__(0, 'K'),
+                       lambda x: x.to_upper(), lambda x: x.clear()):
+            hash(s)
+            mutate(s)
+            self.assertEqual(hash(s), hash(s.c_str()))
+        self.assertNotEqual(String("ab"), String("ba"))
+
+    def test_frozen_and_pool(self):
+        f = FrozenString("abc")
+        self.assertEqual(f, "abc")
+        self.assertEqual(hash(f), hash("abc"))
+        for call in (lambda: f.append("d"), lambda: f.push_back("d"), lambda: f.clear(),
+                     lambda: f.__setitem__(0, "x"), lambda: f.to_upper(), lambda: f.erase(0)):
+            self.assertRaises(TypeError, call)
+        g = f
+        g += "d" # Rebinds, leaving f unchanged
+        self.assertEqual(f, "abc")
+        self.assertEqual(g, "abcd")
+        self.assertIs(intern("abc"), intern(String("abc")))
+        self.assertIsInstance(intern("x"), FrozenString)
+
+        pool = StringPool(["GET", "POST"])
+        self.assertEqual(pool.add("GET"), 0)
+        self.assertEqual(pool.add(String("PUT")), 2)
+        self.assertEqual(pool.add(StringView(b"xPOST", 1)), 1)
+        self.assertEqual(pool.add_many(["PUT", "GET", "HEAD"]), [2, 0, 3])
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(pool.find("DELETE"), -1)
+        self.assertIn(String("HEAD"), pool)
+        self.assertEqual(pool[2], "PUT")
+        self.assertIs(pool.intern("PUT"), pool.string(2))
+        self.assertEqual([str(x) for x in pool], ["GET", "POST", "PUT", "HEAD"])
+        self.assertRaises(IndexError, pool.string, 4)
+
+    def test_swap_refuses_frozen(self):
+        key = intern("key")
+        s = String("x")
+        self.assertRaises(TypeError, s.swap, key)
+        self.assertEqual(s, "x")
+        self.assertEqual(hash(key), hash("key"))
+        pool = StringPool(["a"])
+        self.assertRaises(TypeError, String("zz").swap, pool.string(0))
+        self.assertEqual(pool.find("a"), 0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -11,17 +11,20 @@ class _HashNode(Generic[K, V]):
         self.value = value
         self.next = next_node
 
-from cppbase import Unordered
+from cppbase import Unordered, NodePool
+from cppbase.pool import make_pool
 
 class UnorderedMap(Unordered, Generic[K, V]):
-    __slots__ = ('_buckets', '_size', '_bucket_count', '_max_load_factor')
+    __slots__ = ('_buckets', '_size', '_bucket_count', '_max_load_factor', '_pool')
     
     # std::unordered_map implementation using Separate Chaining (buckets)
     # Python's dict is open addressing (optimized).
     # We implement separate chaining to behave strictly like typical C++ std implementations (e.g. GCC libstdc++).
     # This exposes "bucket interface" which is part of the STL standard.
 
-    def __init__(self, source=None, bucket_count: int = 8):
+    def __init__(self, source=None, bucket_count: int = 8, pool: NodePool | bool | None = None):
+        # Opt-in node recycling: pool=True (private) or a shared NodePool(_HashNode).
+        self._pool = make_pool(pool, _HashNode)
         self._bucket_count = bucket_count
         self._buckets: List[_HashNode[K,V] | None] = [None] * bucket_count
         self._size = 0
@@ -42,13 +45,31 @@ class UnorderedMap(Unordered, Generic[K, V]):
         old_buckets = self._buckets
         self._bucket_count = new_count
         self._buckets = [None] * new_count
-        self._size = 0
         
+        # Relink the existing nodes into the new buckets (no re-allocation).
         for head in old_buckets:
             curr = head
             while curr:
-                self[curr.key] = curr.value # Re-insert
-                curr = curr.next
+                next_node = curr.next
+                idx = self._hash(curr.key)
+                curr.next = self._buckets[idx]
+                self._buckets[idx] = curr
+                curr = next_node
+
+    # --------------------- Allocator ---------------------
+    def get_allocator(self) -> NodePool | None:
+        return self._pool
+
+    def _new_node(self, key: K, value: V, next_node: _HashNode | None) -> _HashNode:
+        if self._pool is None:
+            return _HashNode(key, value, next_node)
+        return self._pool.acquire(key, value, next_node)
+
+    def _release_chain(self, curr: _HashNode | None):
+        while curr:
+            next_node = curr.next
+            self._pool.release(curr)
+            curr = next_node
 
     # --------------------- Modifiers ---------------------
     def __setitem__(self, key: K, value: V):
@@ -64,7 +85,7 @@ class UnorderedMap(Unordered, Generic[K, V]):
             curr = curr.next
             
         # Insert new
-        new_node = _HashNode(key, value, head)
+        new_node = self._new_node(key, value, head)
         self._buckets[idx] = new_node
         self._size += 1
         
@@ -88,11 +109,20 @@ class UnorderedMap(Unordered, Generic[K, V]):
                 else:
                     self._buckets[idx] = curr.next
                 self._size -= 1
+                if self._pool is not None:
+                    self._pool.release(curr)
                 return
             prev = curr
             curr = curr.next
         # Else not found (no-op in C++ erase(key) returns 0)
 
+    def clear(self):
+        if self._pool is not None:
+            for head in self._buckets:
+                self._release_chain(head)
+        self._buckets = [None] * self._bucket_count
+        self._size = 0
+
     # --------------------- Access ---------------------
     def __getitem__(self, key: K) -> V:
         idx = self._hash(key)
@@ -47,5 +47,27 @@ class TestUnorderedMap(unittest.TestCase):
         self.assertEqual(m.bucket_size(0), 1)
         self.assertEqual(m["y"], 2)
 
+    def test_node_pool(self):
+        m = UnorderedMap(bucket_count=2, pool=True)
+        for i in range(10):
+            m[i] = i * i   # Triggers rehashes, which must keep every node
+        self.assertEqual(len(m), 10)
+        self.assertEqual(m[7], 49)
+
+        pool = m.get_allocator()
+        for i in range(5):
+            m.erase(i)
+        for i in range(20, 25):
+            m[i] = i
+        self.assertEqual(pool.stats()['hits'], 5)
+        self.assertEqual(pool.stats()['misses'], 10)
+
+        m.clear()
+        self.assertTrue(m.empty())
+        self.assertEqual(m.find(7), None)
+        for i in range(10):
+            m[i] = i
+        self.assertEqual(pool.stats()['hits'], 15) # Every cleared node reused
+
 if __name__ == '__main__':
     unittest.main()
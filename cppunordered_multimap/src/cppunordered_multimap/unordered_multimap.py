@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import TypeVar, Generic, Tuple, Iterator, Any, List
-from cppbase import Unordered
+from cppbase import Unordered, NodePool, EqualRange
+from cppbase.pool import make_pool
 
 K = TypeVar('K')
 V = TypeVar('V')
@@ -13,9 +14,17 @@ class _HashNode(Generic[K, V]):
         self.next = next_node
 
 class UnorderedMultiMap(Unordered, Generic[K, V]):
-    __slots__ = ('_buckets', '_size', '_bucket_count', '_max_load_factor')
+    __slots__ = ('_buckets', '_size', '_bucket_count', '_max_load_factor', '_pool',
+                 '_compact', '_unique')
     
-    def __init__(self, source=None, bucket_count: int = 8):
+    def __init__(self, source=None, bucket_count: int = 8, pool: NodePool | bool | None = None,
+                 compact: bool = False):
+        # compact=True keeps one node per key whose `value` is the list of its
+        # mapped values, so count() is O(1) on average and equal_range() is a view.
+        self._compact = compact
+        self._unique = 0 # Nodes (distinct keys) in compact mode
+        # Opt-in node recycling: pool=True (private) or a shared NodePool(_HashNode).
+        self._pool = make_pool(pool, _HashNode)
         self._bucket_count = bucket_count
         self._buckets: List[_HashNode[K,V] | None] = [None] * bucket_count
         self._size = 0
@@ -36,18 +45,46 @@ class UnorderedMultiMap(Unordered, Generic[K, V]):
         old_buckets = self._buckets
         self._bucket_count = new_count
         self._buckets = [None] * new_count
-        self._size = 0
         
+        # Relink the existing nodes into the new buckets (no re-allocation).
         for head in old_buckets:
             curr = head
             while curr:
-                self.insert(curr.key, curr.value)
-                curr = curr.next
+                next_node = curr.next
+                idx = self._hash(curr.key)
+                curr.next = self._buckets[idx]
+                self._buckets[idx] = curr
+                curr = next_node
+
+    # --------------------- Allocator ---------------------
+    def get_allocator(self) -> NodePool | None:
+        return self._pool
+
+    def _new_node(self, key: K, value: V, next_node: _HashNode | None) -> _HashNode:
+        if self._pool is None:
+            return _HashNode(key, value, next_node)
+        return self._pool.acquire(key, value, next_node)
+
+    def _release_chain(self, curr: _HashNode | None):
+        while curr:
+            next_node = curr.next
+            self._pool.release(curr)
+            curr = next_node
 
     def insert(self, key: K, value: V):
         idx = self._hash(key)
         head = self._buckets[idx]
-        new_node = _HashNode(key, value, head)
+        if self._compact:
+            curr = head
+            while curr:
+                if curr.key == key:
+                    curr.value.append(value)
+                    self._size += 1
+                    return
+                curr = curr.next
+            self._unique += 1
+            value = [value]
+        new_node = self._new_node(key, value, head)
         self._buckets[idx] = new_node
         self._size += 1
         
@@ -57,6 +94,8 @@ class UnorderedMultiMap(Unordered, Generic[K, V]):
     def erase(self, key: K) -> int:
         idx = self._hash(key)
         head = self._buckets[idx]
+        if self._compact:
+            return self._erase_grouped(idx, key)
         
         count = 0
         prev = None
@@ -69,7 +108,10 @@ class UnorderedMultiMap(Unordered, Generic[K, V]):
                     prev.next = curr.next
                 else:
                     head = curr.next
+                removed = curr
                 curr = curr.next
+                if self._pool is not None:
+                    self._pool.release(removed)
                 # Do NOT advance prev here, because curr is now a new node (the old curr.next)
             else:
                 prev = curr
@@ -78,11 +120,45 @@ class UnorderedMultiMap(Unordered, Generic[K, V]):
         self._buckets[idx] = head
         return count
 
+    def _erase_grouped(self, idx: int, key: K) -> int:
+        prev = None
+        curr = self._buckets[idx]
+        while curr:
+            if curr.key == key:
+                if prev:
+                    prev.next = curr.next
+                else:
+                    self._buckets[idx] = curr.next
+                count = len(curr.value)
+                self._size -= count
+                self._unique -= 1
+                if self._pool is not None:
+                    self._pool.release(curr)
+                return count
+            prev = curr
+            curr = curr.next
+        return 0
+
+    def _find_node(self, key: K) -> _HashNode[K,V] | None:
+        curr = self._buckets[self._hash(key)]
+        while curr:
+            if curr.key == key:
+                return curr
+            curr = curr.next
+        return None
+
     def clear(self):
+        if self._pool is not None:
+            for head in self._buckets:
+                self._release_chain(head)
         self._buckets = [None] * self._bucket_count
         self._size = 0
+        self._unique = 0
 
     def find(self, key: K) -> Iterator[Tuple[K,V]] | None:
+        if self._compact:
+            node = self._find_node(key)
+            return (node.key, node.value[0]) if node else None
         idx = self._hash(key)
         curr = self._buckets[idx]
         while curr:
@@ -92,6 +168,9 @@ class UnorderedMultiMap(Unordered, Generic[K, V]):
         return None
 
     def count(self, key: K) -> int:
+        if self._compact:
+            node = self._find_node(key)
+            return len(node.value) if node else 0
         idx = self._hash(key)
         curr = self._buckets[idx]
         c = 0
@@ -102,6 +181,14 @@ class UnorderedMultiMap(Unordered, Generic[K, V]):
         return c
 
     def equal_range(self, key: K) -> Iterator[Tuple[K,V]]:
+        if self._compact:
+            return EqualRange(self._find_node(key), mapped=True)
+        return self._equal_range_scan(key)
+
+    def is_compact(self) -> bool:
+        return self._compact
+
+    def _equal_range_scan(self, key: K) -> Iterator[Tuple[K,V]]:
         idx = self._hash(key)
         curr = self._buckets[idx]
         while curr:
@@ -110,7 +197,9 @@ class UnorderedMultiMap(Unordered, Generic[K, V]):
             curr = curr.next
 
     def bucket_count(self) -> int: return self._bucket_count
-    def load_factor(self) -> float: return self._size / self._bucket_count
+    def load_factor(self) -> float:
+        # Compact mode chains hold one node per distinct key
+        return (self._unique if self._compact else self._size) / self._bucket_count
     def __len__(self) -> int: return self._size
     def empty(self) -> bool: return self._size == 0
     def size(self) -> int: return self._size
@@ -119,14 +208,22 @@ class UnorderedMultiMap(Unordered, Generic[K, V]):
         for head in self._buckets:
             curr = head
             while curr:
-                yield curr.key
+                if self._compact:
+                    for _ in curr.value:
+                        yield curr.key
+                else:
+                    yield curr.key
                 curr = curr.next
 
     def items(self) -> Iterator[Tuple[K, V]]:
         for head in self._buckets:
             curr = head
             while curr:
-                yield (curr.key, curr.value)
+                if self._compact:
+                    for v in curr.value:
+                        yield (curr.key, v)
+                else:
+                    yield (curr.key, curr.value)
                 curr = curr.next
 
     def __repr__(self):
@@ -44,5 +44,30 @@ class TestUnorderedMultiMap(unittest.TestCase):
         self.assertTrue((10, 'x') in er)
         self.assertTrue((10, 'y') in er)
 
+    def test_compact_mode(self):
+        mm = UnorderedMultiMap(compact=True)
+        for i in range(30):
+            mm.insert(i % 3, i)
+        self.assertEqual(mm.count(1), 10)
+        self.assertEqual(mm.size(), 30)
+        self.assertEqual(list(mm.equal_range(2))[:2], [(2, 2), (2, 5)])
+        self.assertEqual(mm.find(0), (0, 0))
+        self.assertEqual(len(list(mm.items())), 30)
+
+        self.assertEqual(mm.erase(0), 10)
+        self.assertIsNone(mm.find(0))
+        self.assertEqual(mm.size(), 20)
+
+    def test_node_pool(self):
+        mm = UnorderedMultiMap([(1, 'a'), (1, 'b'), (2, 'c')], pool=True)
+        pool = mm.get_allocator()
+        self.assertEqual(mm.erase(1), 2)
+        self.assertEqual(pool.free_count(), 2)
+        mm.insert(3, 'd')
+        self.assertEqual(pool.stats()['hits'], 1)
+        self.assertEqual(mm.find(3), (3, 'd'))
+        mm.clear()
+        self.assertEqual(pool.free_count(), 3)
+
 if __name__ == '__main__':
     unittest.main()
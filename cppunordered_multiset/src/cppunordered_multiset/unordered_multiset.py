@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import TypeVar, Generic, Iterator, Any, List
-from cppbase import Unordered
+from cppbase import Unordered, NodePool, EqualRange
+from cppbase.pool import make_pool
 
 T = TypeVar('T')
 
@@ -10,13 +11,29 @@ class _HashNode(Generic[T]):
         self.key = key
         self.next = next_node
 
+class _CountedHashNode(Generic[T]):
+    __slots__ = ('key', 'count', 'next')
+    def __init__(self, key: T, next_node: _CountedHashNode[T] | None = None):
+        self.key = key
+        self.count = 1
+        self.next = next_node
+
 class UnorderedMultiSet(Unordered, Generic[T]):
-    __slots__ = ('_buckets', '_size', '_bucket_count', '_max_load_factor')
+    __slots__ = ('_buckets', '_size', '_bucket_count', '_max_load_factor', '_pool',
+                 '_compact', '_node_type', '_unique')
     
-    def __init__(self, source=None, bucket_count: int = 8):
+    def __init__(self, source=None, bucket_count: int = 8, pool: NodePool | bool | None = None,
+                 compact: bool = False):
+        # compact=True keeps one _CountedHashNode per distinct key, so count()
+        # is O(1) on average and duplicates cost no memory.
+        self._compact = compact
+        self._node_type = _CountedHashNode if compact else _HashNode
+        # Opt-in node recycling: pool=True (private) or a shared NodePool of the node type.
+        self._pool = make_pool(pool, self._node_type)
         self._bucket_count = bucket_count
         self._buckets: List[_HashNode[T] | None] = [None] * bucket_count
         self._size = 0
+        self._unique = 0 # Nodes (distinct keys) in compact mode
         self._max_load_factor = 1.0
         
         if source:
@@ -30,19 +47,46 @@ class UnorderedMultiSet(Unordered, Generic[T]):
         old_buckets = self._buckets
         self._bucket_count = new_count
         self._buckets = [None] * new_count
-        self._size = 0
         
+        # Relink the existing nodes into the new buckets (no re-allocation).
         for head in old_buckets:
             curr = head
             while curr:
-                self.insert(curr.key)
-                curr = curr.next
+                next_node = curr.next
+                idx = self._hash(curr.key)
+                curr.next = self._buckets[idx]
+                self._buckets[idx] = curr
+                curr = next_node
+
+    # --------------------- Allocator ---------------------
+    def get_allocator(self) -> NodePool | None:
+        return self._pool
+
+    def _new_node(self, key: T, next_node: _HashNode | None) -> _HashNode:
+        if self._pool is None:
+            return self._node_type(key, next_node)
+        return self._pool.acquire(key, next_node)
+
+    def _release_chain(self, curr: _HashNode | None):
+        while curr:
+            next_node = curr.next
+            self._pool.release(curr)
+            curr = next_node
 
     # --------------------- Modifiers ---------------------
     def insert(self, key: T):
         idx = self._hash(key)
         head = self._buckets[idx]
-        new_node = _HashNode(key, head)
+        if self._compact:
+            curr = head
+            while curr:
+                if curr.key == key:
+                    curr.count += 1
+                    self._size += 1
+                    return
+                curr = curr.next
+            self._unique += 1
+        new_node = self._new_node(key, head)
         self._buckets[idx] = new_node
         self._size += 1
         
@@ -52,6 +96,8 @@ class UnorderedMultiSet(Unordered, Generic[T]):
     def erase(self, key: T) -> int:
         idx = self._hash(key)
         head = self._buckets[idx]
+        if self._compact:
+            return self._erase_counted(idx, key)
         
         count = 0
         prev = None
@@ -64,7 +110,10 @@ class UnorderedMultiSet(Unordered, Generic[T]):
                     prev.next = curr.next
                 else:
                     head = curr.next
+                removed = curr
                 curr = curr.next
+                if self._pool is not None:
+                    self._pool.release(removed)
             else:
                 prev = curr
                 curr = curr.next
@@ -72,9 +121,32 @@ class UnorderedMultiSet(Unordered, Generic[T]):
         self._buckets[idx] = head
         return count
 
+    def _erase_counted(self, idx: int, key: T) -> int:
+        prev = None
+        curr = self._buckets[idx]
+        while curr:
+            if curr.key == key:
+                if prev:
+                    prev.next = curr.next
+                else:
+                    self._buckets[idx] = curr.next
+                count = curr.count
+                self._size -= count
+                self._unique -= 1
+                if self._pool is not None:
+                    self._pool.release(curr)
+                return count
+            prev = curr
+            curr = curr.next
+        return 0
+
     def clear(self):
+        if self._pool is not None:
+            for head in self._buckets:
+                self._release_chain(head)
         self._buckets = [None] * self._bucket_count
         self._size = 0
+        self._unique = 0
 
     # --------------------- Access ---------------------
     def find(self, key: T) -> T | None:
@@ -89,6 +161,12 @@ class UnorderedMultiSet(Unordered, Generic[T]):
     def count(self, key: T) -> int:
         idx = self._hash(key)
         curr = self._buckets[idx]
+        if self._compact:
+            while curr:
+                if curr.key == key:
+                    return curr.count
+                curr = curr.next
+            return 0
         c = 0
         while curr:
             if curr.key == key:
@@ -99,8 +177,22 @@ class UnorderedMultiSet(Unordered, Generic[T]):
     def contains(self, key: T) -> bool:
         return self.find(key) is not None
 
+    def equal_range(self, key: T) -> Iterator[T]:
+        """All elements equal to key (a lazy EqualRange view in compact mode)."""
+        if self._compact:
+            curr = self._buckets[self._hash(key)]
+            while curr and curr.key != key:
+                curr = curr.next
+            return EqualRange(curr)
+        return iter([key] * self.count(key))
+
+    def is_compact(self) -> bool:
+        return self._compact
+
     def bucket_count(self) -> int: return self._bucket_count
-    def load_factor(self) -> float: return self._size / self._bucket_count
+    def load_factor(self) -> float:
+        # Compact mode chains hold one node per distinct key
+        return (self._unique if self._compact else self._size) / self._bucket_count
     def __len__(self) -> int: return self._size
     def empty(self) -> bool: return self._size == 0
     def size(self) -> int: return self._size
@@ -110,7 +202,11 @@ class UnorderedMultiSet(Unordered, Generic[T]):
         for head in self._buckets:
             curr = head
             while curr:
-                yield curr.key
+                if self._compact:
+                    for _ in range(curr.count):
+                        yield curr.key
+                else:
+                    yield curr.key
                 curr = curr.next
 
     def __repr__(self):
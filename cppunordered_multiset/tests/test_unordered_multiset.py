@@ -28,6 +28,34 @@ class TestUnorderedMultiSet(unittest.TestCase):
             ms.insert(i)
         
         self.assertTrue(ms.bucket_count() > 4) # Should have rehashed
-        
+
+    def test_compact_mode(self):
+        ms = UnorderedMultiSet(compact=True)
+        for i in range(100):
+            ms.insert(i % 5)
+        self.assertEqual(ms.size(), 100)
+        self.assertEqual(ms.count(3), 20)
+        self.assertEqual(ms.load_factor(), 5 / ms.bucket_count())
+        self.assertEqual(len(ms.equal_range(4)), 20)
+        self.assertEqual(sorted(ms).count(0), 20)
+
+        self.assertEqual(ms.erase(3), 20)
+        self.assertEqual(ms.count(3), 0)
+        self.assertEqual(ms.size(), 80)
+
+    def test_node_pool(self):
+        for compact in (False, True):
+            ms = UnorderedMultiSet([1, 1, 2], pool=True, compact=compact)
+            pool = ms.get_allocator()
+            ms.erase(1)
+            self.assertEqual(pool.free_count(), 1 if compact else 2)
+            ms.insert(3)
+            ms.insert(3)
+            self.assertEqual(ms.count(3), 2)
+            self.assertEqual(pool.stats()['hits'], 1 if compact else 2)
+            ms.clear()
+            self.assertEqual(ms.size(), 0)
+            self.assertEqual(pool.free_count(), 2 if compact else 3)
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,15 +9,18 @@ class _SetNode(Generic[T]):
         self.key = key
         self.next = next_node
 
-from cppbase import Unordered
+from cppbase import Unordered, NodePool
+from cppbase.pool import make_pool
 
 class UnorderedSet(Unordered, Generic[T]):
-    __slots__ = ('_buckets', '_size', '_bucket_count', '_max_load_factor')
+    __slots__ = ('_buckets', '_size', '_bucket_count', '_max_load_factor', '_pool')
     
     # std::unordered_set implementation (Hash Set with Buckets)
     # Similar to unordered_map but stores only keys.
 
-    def __init__(self, source=None, bucket_count: int = 8):
+    def __init__(self, source=None, bucket_count: int = 8, pool: NodePool | bool | None = None):
+        # Opt-in node recycling: pool=True (private) or a shared NodePool(_SetNode).
+        self._pool = make_pool(pool, _SetNode)
         self._bucket_count = bucket_count
         self._buckets: List[_SetNode[T] | None] = [None] * bucket_count
         self._size = 0
@@ -34,18 +37,31 @@ class UnorderedSet(Unordered, Generic[T]):
         old_buckets = self._buckets
         self._bucket_count = new_count
         self._buckets = [None] * new_count
-        self._size = 0
         
+        # Relink the existing nodes into the new buckets (no re-allocation).
         for head in old_buckets:
             curr = head
             while curr:
-                self.insert(curr.key) # Re-insert (recurses but handles new size)
-                # Wait, calling insert() triggers size++ and potential recursive loop if not careful?
-                # Actually, standard insert() increments size. 
-                # Better implementation: manual re-insertion to avoid size increment logic issues or just reset size.
-                # Here we reset size=0 above, so calling insert matches.
-                # EFFICIENCY: calling insert recalc hash. Correct.
-                curr = curr.next
+                next_node = curr.next
+                idx = self._hash(curr.key)
+                curr.next = self._buckets[idx]
+                self._buckets[idx] = curr
+                curr = next_node
+
+    # --------------------- Allocator ---------------------
+    def get_allocator(self) -> NodePool | None:
+        return self._pool
+
+    def _new_node(self, key: T, next_node: _SetNode | None) -> _SetNode:
+        if self._pool is None:
+            return _SetNode(key, next_node)
+        return self._pool.acquire(key, next_node)
+
+    def _release_chain(self, curr: _SetNode | None):
+        while curr:
+            next_node = curr.next
+            self._pool.release(curr)
+            curr = next_node
 
     # --------------------- Modifiers ---------------------
     def insert(self, key: T):
@@ -60,7 +76,7 @@ class UnorderedSet(Unordered, Generic[T]):
             curr = curr.next
             
         # Insert new
-        new_node = _SetNode(key, head)
+        new_node = self._new_node(key, head)
         self._buckets[idx] = new_node
         self._size += 1
         
@@ -80,11 +96,16 @@ class UnorderedSet(Unordered, Generic[T]):
                 else:
                     self._buckets[idx] = curr.next
                 self._size -= 1
+                if self._pool is not None:
+                    self._pool.release(curr)
                 return
             prev = curr
             curr = curr.next
 
     def clear(self):
+        if self._pool is not None:
+            for head in self._buckets:
+                self._release_chain(head)
         self._buckets = [None] * self._bucket_count
         self._size = 0
 
@@ -35,5 +35,19 @@ class TestUnorderedSet(unittest.TestCase):
         for i in range(10):
             self.assertTrue(s.contains(i))
 
+    def test_node_pool(self):
+        s = UnorderedSet(bucket_count=2, pool=True)
+        for i in range(6):
+            s.insert(i)
+        pool = s.get_allocator()
+        s.erase(2)
+        s.erase(4)
+        self.assertEqual(pool.free_count(), 2)
+        s.insert(10)
+        self.assertEqual(pool.stats()['hits'], 1)
+        self.assertTrue(s.contains(10))
+        s.clear()
+        self.assertEqual(pool.free_count(), 6)
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,6 +9,8 @@ T = TypeVar('T')
 
 
 from cppbase import Sequence
+from cppbase.buffer import REVERSED_BITS, check_bitorder
+
 
 # =================================================================
 # 1. Ultimate Generic Vector<T> with SVO, swap, comparisons, etc.
@@ -207,6 +209,30 @@ class VectorBool:
         for i in range(self._size):
             yield self[i]
 
+    # --------------------- Serialization ---------------------
+    def to_bytes(self, bitorder: str = 'little') -> bytes:
+        """Packed bits, (len + 7) // 8 bytes. 'little': element 0 is the LSB of byte 0; 'big': its MSB."""
+        data = bytes(self._data)
+        return data if check_bitorder(bitorder) == 'little' else data.translate(REVERSED_BITS)
+
+    @classmethod
+    def from_bytes(cls, data, size: int | None = None, bitorder: str = 'little') -> 'VectorBool':
+        """Inverse of to_bytes; size defaults to 8 bits per byte of data."""
+        data = bytes(data)
+        if size is None:
+            size = 8 * len(data)
+        nbytes = (size + 7) >> 3
+        if size < 0 or nbytes > len(data):
+            raise ValueError(f"{len(data)} bytes cannot hold {size} bits")
+        if check_bitorder(bitorder) == 'big':
+            data = data.translate(REVERSED_BITS)
+        res = cls()
+        res._data = bytearray(data[:nbytes])
+        res._size = size
+        if size & 7: # Bits past the end stay zero
+            res._data[-1] &= (1 << (size & 7)) - 1
+        return res
+
     def __repr__(self):
         return f"vector<bool>[{self._size}] bits={self._size} bytes={len(self._data)} {list(self)[:20]}{'...' if len(self)>20 else ''}"
 
@@ -1,5 +1,5 @@
 import unittest
-from cppvector.vector import Vector
+from cppvector.vector import Vector, VectorBool
 
 class TestVector(unittest.TestCase):
     def test_svo_and_growth(self):
@@ -25,5 +25,16 @@ class TestVector(unittest.TestCase):
         self.assertTrue(isinstance(v, Sequence))
         self.assertTrue(isinstance(v, Vector))
 
+    def test_vector_bool_bytes(self):
+        vb = VectorBool([True, False, True, True, False, False, False, False, False, True])
+        self.assertEqual(vb.to_bytes(), bytes([0b00001101, 0b00000010]))
+        self.assertEqual(vb.to_bytes('big'), bytes([0b10110000, 0b01000000]))
+        back = VectorBool.from_bytes(vb.to_bytes('big'), len(vb), 'big')
+        self.assertEqual(list(back), list(vb))
+        self.assertEqual(len(VectorBool.from_bytes(b'\xff\xff', 11)), 11)
+        self.assertEqual(VectorBool.from_bytes(b'\xff\xff', 11).to_bytes(), b'\xff\x07')
+        with self.assertRaises(ValueError):
+            VectorBool.from_bytes(b'\x00', 9)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file